@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the data generation primitives in generate_data.py
+
+Each primitive is timed at several call counts and, in a separate pass, traced with
+tracemalloc to record the memory it allocates. Results are written to a JSON file that
+can be diffed between commits, or compared against a previous run with --compare.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from itertools import cycle
+
+import generate_data
+
+# Default call counts each primitive is timed at
+DEFAULT_CALLS = [1, 1000, 100000]
+
+# Number of distinct SVG logos svg_to_png cycles through
+SVG_SAMPLE_SIZE = 64
+
+def build_primitives(seed):
+    """
+    Build the benchmarked primitives as name -> zero-argument callable
+
+    Inputs (such as the SVGs fed to svg_to_png) are generated up front so only the
+    primitive itself is measured.
+    """
+    random.seed(seed)
+    svgs = cycle([generate_data.generate_team_logo() for _ in range(SVG_SAMPLE_SIZE)])
+    registry = generate_data.UniquenessRegistry()
+
+    return {
+        "generate_team_name": generate_data.generate_team_name,
+        "generate_player_nickname": generate_data.generate_player_nickname,
+        "allocate_team_name": registry.allocate_team_name,
+        "allocate_nickname": registry.allocate_nickname,
+        "distribute_nationalities": lambda: generate_data.distribute_nationalities(5),
+        "generate_player_attributes": generate_data.generate_player_attributes,
+        "next_player_attributes": generate_data.next_player_attributes,
+        "generate_team_logo": generate_data.generate_team_logo,
+        "svg_to_png": lambda: generate_data.svg_to_png(next(svgs)),
+    }
+
+def time_calls(func, calls):
+    """Run `func` `calls` times and return the elapsed wall time in seconds"""
+    started = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return time.perf_counter() - started
+
+def trace_allocations(func, calls):
+    """
+    Run `func` `calls` times under tracemalloc
+
+    Returns (peak_bytes, retained_bytes): the peak traced memory above the starting point
+    and what was still allocated once the calls finished.
+    """
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(calls):
+            func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline, current - baseline
+
+def run_benchmarks(names, call_counts, seed, allocations=True):
+    """
+    Benchmark the selected primitives at each call count
+
+    The random generator is reseeded before every measurement so runs are repeatable.
+
+    Args:
+        names (list): Primitive names to benchmark
+        call_counts (list): Number of calls to time each primitive at
+        seed (int): Seed for the random module
+        allocations (bool): Also record allocations with tracemalloc (slower)
+    """
+    primitives = build_primitives(seed)
+    results = {}
+
+    for name in names:
+        func = primitives[name]
+        results[name] = {}
+        for calls in call_counts:
+            random.seed(seed)
+            elapsed = time_calls(func, calls)
+            result = {
+                "calls": calls,
+                "total_seconds": round(elapsed, 6),
+                "per_call_us": round(elapsed / calls * 1e6, 3),
+                "calls_per_second": round(calls / elapsed, 1) if elapsed else None,
+            }
+
+            if allocations:
+                random.seed(seed)
+                peak, retained = trace_allocations(func, calls)
+                result["peak_bytes"] = peak
+                result["retained_bytes"] = retained
+                result["peak_bytes_per_call"] = round(peak / calls, 1)
+
+            results[name][str(calls)] = result
+            print(f"{name:<28} {calls:>7} calls  {result['per_call_us']:>10.3f} µs/call"
+                  + (f"  peak {result['peak_bytes']:>10} B" if allocations else ""))
+
+    return results
+
+def git_commit():
+    """Return the current git commit hash, or None outside a git checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_results(baseline, current, threshold):
+    """
+    Print the per-call time change against a baseline run
+
+    Returns the list of (primitive, calls) entries that got slower by more than
+    `threshold` percent.
+    """
+    regressions = []
+    print(f"\nComparison against {baseline.get('commit') or 'baseline'}:")
+    for name, runs in current["results"].items():
+        for calls, result in runs.items():
+            previous = baseline.get("results", {}).get(name, {}).get(calls)
+            if not previous:
+                continue
+            change = (result["per_call_us"] - previous["per_call_us"]) / previous["per_call_us"] * 100
+            marker = ""
+            # Single calls are dominated by noise and one-off warm-up, so they never count as regressions
+            if change > threshold and int(calls) > 1:
+                marker = " ❌ regression"
+                regressions.append((name, calls))
+            print(f"{name:<28} {calls:>7} calls  {previous['per_call_us']:>10.3f} -> {result['per_call_us']:>10.3f} µs/call ({change:+.1f}%){marker}")
+    return regressions
+
+def main():
+    primitives = list(build_primitives(0))
+
+    parser = argparse.ArgumentParser(description="Benchmark the data generation primitives")
+    parser.add_argument("--output", type=str, default="benchmark_results.json",
+                        help="JSON file the results are written to")
+    parser.add_argument("--calls", type=str, default=",".join(map(str, DEFAULT_CALLS)),
+                        help="Comma-separated call counts to time each primitive at")
+    parser.add_argument("--only", type=str, action="append", choices=primitives,
+                        help="Only benchmark this primitive (can be repeated)")
+    parser.add_argument("--seed", type=int, default=1234, help="Seed for the random generator")
+    parser.add_argument("--no-allocations", action="store_true",
+                        help="Skip the tracemalloc pass (faster, but no allocation figures)")
+    parser.add_argument("--compare", type=str,
+                        help="Previous results file to compare against; exits with status 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Per-call slowdown in percent reported as a regression (with --compare)")
+    args = parser.parse_args()
+
+    call_counts = [int(calls) for calls in args.calls.split(",")]
+    results = run_benchmarks(args.only or primitives, call_counts, args.seed, not args.no_allocations)
+
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cairosvg": generate_data.cairosvg_available(),
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, sort_keys=True)
+        file.write("\n")
+    print(f"✅ Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare_results(baseline, report, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} regression(s) above {args.threshold}%")
+            sys.exit(1)
+        print("✅ No regressions")
+
+if __name__ == "__main__":
+    main()
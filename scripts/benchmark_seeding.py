@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+End-to-end seeding throughput benchmark against an in-process stub API
+
+Starts a lightweight HTTP stand-in for the team, player and tournament endpoints (including
+the bulk endpoints and the game endpoints the soak driver plays tournaments through) with
+configurable latency and error rate, runs the real creation code
+paths of generate_data.py against it and reports entities/second, request counts and
+bytes sent per entity. This measures the client's own overhead without a live backend.
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import generate_data
+
+# Collections served by the stub API
+COLLECTIONS = ["teams", "players", "tournaments"]
+
+class StubApiHandler(BaseHTTPRequestHandler):
+    """Request handler for StubApi; the server instance holds the data and the settings"""
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY delayed ACKs add ~40ms per request
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self, method):
+        path = urlparse(self.path).path
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        endpoint = method + " " + re.sub(r"/\d+", "/{id}", path)
+        failed = self.server.record(endpoint, len(self.raw_requestline) + len(bytes(self.headers)) + len(body))
+
+        with self.server.active(method) as overloaded:
+            if self.server.latency:
+                time.sleep(self.server.latency)
+        if overloaded:
+            with self.server.lock:
+                self.server.stats[endpoint]["errors"] += 1
+            return self.send_json(429, {"error": "Too many requests"})
+        if failed:
+            return self.send_json(503, {"error": "Injected failure"})
+
+        parts = path.strip("/").split("/")
+        collection = parts[1] if len(parts) > 1 else None
+        if method == "GET" and parts[-1] in ("stats", "standings") and collection in COLLECTIONS:
+            return self.handle_stats_request(parts[1:])
+        if collection == "games" or (collection == "tournaments" and len(parts) > 3):
+            return self.handle_game_request(method, parts[1:])
+        if collection not in COLLECTIONS:
+            return self.send_json(404, {"error": "Not found"})
+
+        if method == "GET":
+            query = parse_qs(urlparse(self.path).query)
+            limit = min(int(query.get("limit", ["10"])[0]), 100)
+            offset = int(query.get("offset", ["0"])[0])
+            items = self.server.data[collection]
+            return self.send_json(200, {"items": items[offset:offset + limit], "total": len(items)})
+
+        if path.endswith("/bulk"):
+            return self.send_json(201, [self.server.create(collection, item) for item in json.loads(body)])
+        if "multipart/form-data" in self.headers.get("Content-Type", ""):
+            fields = dict(re.findall(rb'name="(\w+)"\r\n\r\n(.*?)\r\n', body))
+            item = {key.decode(): value.decode("utf-8", "replace") for key, value in fields.items()}
+            return self.send_json(201, self.server.create(collection, item))
+        return self.send_json(201, self.server.create(collection, json.loads(body)))
+
+    def handle_stats_request(self, parts):
+        """Serve /teams/stats and /players/stats, slower on a cache miss, and uncached tournament standings"""
+        server = self.server
+        if parts[-1] == "standings":
+            tournament = server.find("tournaments", int(parts[1]))
+            if tournament is None:
+                return self.send_json(404, {"error": "Tournament not found"})
+            return self.send_json(200, [{"team_id": team["id"], "position": position + 1}
+                                        for position, team in enumerate(tournament.get("teams", []))])
+        with server.lock:
+            cold = parts[0] not in server.cache
+            server.cache.add(parts[0])
+        if cold and server.cold_latency:
+            time.sleep(server.cold_latency)
+        query = parse_qs(urlparse(self.path).query)
+        limit = int(query.get("limit", ["10"])[0])
+        offset = int(query.get("offset", ["0"])[0])
+        items = [{"id": item["id"]} for item in server.data[parts[0]][offset:offset + limit]]
+        return self.send_json(200, {"items": items, "total": len(server.data[parts[0]])})
+
+    def handle_game_request(self, method, parts):
+        """Serve the tournament start and schedule and the game endpoints used by the soak driver"""
+        server = self.server
+        route = (method,) + tuple("{id}" if part.isdigit() else part for part in parts)
+        ids = [int(part) for part in parts if part.isdigit()]
+        with server.lock:
+            if route == ("POST", "tournaments", "{id}", "start"):
+                tournament = server.find("tournaments", ids[0])
+                if tournament is None or tournament.get("started"):
+                    return self.send_json(400, {"error": "Tournament not found or already started"})
+                tournament["started"] = True
+                return self.send_json(200, tournament)
+            if route == ("GET", "tournaments", "{id}", "schedule"):
+                query = parse_qs(urlparse(self.path).query)
+                limit = min(int(query.get("limit", ["10"])[0]), 100)
+                offset = int(query.get("offset", ["0"])[0])
+                matches = server.matches.get(ids[0], [])
+                return self.send_json(200, {"items": matches[offset:offset + limit], "total": len(matches)})
+            if route == ("GET", "games", "match", "{id}"):
+                return self.send_json(200, [server.games[game_id] for game_id in server.match_games.get(ids[0], [])])
+
+            game = server.games.get(ids[0]) if ids else None
+            if game is None:
+                return self.send_json(404, {"error": "Not found"})
+            if route == ("GET", "games", "{id}", "rounds", "last"):
+                if not game["rounds"]:
+                    return self.send_json(200, [])
+                return self.send_json(200, [{"round_state": {"round": game["rounds"], "finished": True}}])
+            if route == ("POST", "games", "{id}", "rounds", "{id}", "play"):
+                if game["finished"] or ids[1] != game["rounds"] + 1:
+                    return self.send_json(400, {"error": "Round cannot be played"})
+                game["rounds"] += 1
+                return self.send_json(200, {"round": game["rounds"], "team_won": random.choice(game["teams"]),
+                                            "finished": True})
+            if route == ("POST", "games", "{id}", "play"):
+                game["finished"] = True
+                game["winner_id"] = random.choice(game["teams"])
+                return self.send_json(200, {})
+            if route == ("GET", "games", "{id}", "stats"):
+                return self.send_json(200, {"game_id": game["id"], "winner_id": game["winner_id"],
+                                            "team1_score": 13 if game["winner_id"] == game["teams"][0] else 7,
+                                            "team2_score": 13 if game["winner_id"] == game["teams"][1] else 7})
+        return self.send_json(404, {"error": "Not found"})
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+class StubApi(ThreadingHTTPServer):
+    """
+    In-process stand-in for the API's collection endpoints
+
+    Created entities are kept in memory (without logo payloads) and served back by the
+    paginated list endpoints. Every request is counted per endpoint with the bytes received.
+
+    Args:
+        latency (float): Seconds each request is delayed before it is answered
+        error_rate (float): Share of requests answered with a 503
+        capacity (int, optional): Writes served concurrently; writes beyond it are answered with a 429
+        cold_latency (float): Extra seconds the first read of /teams/stats or /players/stats takes
+    """
+    daemon_threads = True
+
+    def __init__(self, latency=0.0, error_rate=0.0, port=0, capacity=None, cold_latency=0.0):
+        super().__init__(("127.0.0.1", port), StubApiHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.capacity = capacity
+        self.cold_latency = cold_latency
+        self.cache = set()
+        self.writes = 0
+        self.lock = threading.Lock()
+        self.data = {collection: [] for collection in COLLECTIONS}
+        self.matches = {}
+        self.match_games = {}
+        self.games = {}
+        self.stats = {}
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_port}/api"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def record(self, endpoint, size):
+        """Count a request and return True if it should be failed"""
+        with self.lock:
+            stats = self.stats.setdefault(endpoint, {"requests": 0, "bytes": 0, "errors": 0})
+            stats["requests"] += 1
+            stats["bytes"] += size
+            failed = random.random() < self.error_rate
+            if failed:
+                stats["errors"] += 1
+        return failed
+
+    @contextlib.contextmanager
+    def active(self, method):
+        """Track a write being served and yield True if it exceeds the capacity"""
+        if method == "GET" or self.capacity is None:
+            yield False
+            return
+        with self.lock:
+            self.writes += 1
+            overloaded = self.writes > self.capacity
+        try:
+            yield overloaded
+        finally:
+            with self.lock:
+                self.writes -= 1
+
+    def create(self, collection, item):
+        with self.lock:
+            item = {key: value for key, value in item.items() if key != "logo_image_file"}
+            item["id"] = len(self.data[collection]) + 1
+            self.data[collection].append(item)
+            if collection == "tournaments":
+                self.schedule(item)
+        return item
+
+    def find(self, collection, item_id):
+        items = self.data[collection]
+        return items[item_id - 1] if 0 < item_id <= len(items) else None
+
+    def schedule(self, tournament):
+        """Create the round-robin BO3 matches of a tournament, three games each, like the API does"""
+        team_ids = [team["id"] for team in tournament.get("teams", [])]
+        matches = self.matches.setdefault(tournament["id"], [])
+        for i, team1 in enumerate(team_ids):
+            for team2 in team_ids[i + 1:]:
+                match_id = len(self.match_games) + 1
+                matches.append({"id": match_id, "tournament_id": tournament["id"], "type": "BO3",
+                                "team1": {"id": team1}, "team2": {"id": team2}, "finished": False})
+                self.match_games[match_id] = []
+                for _ in range(3):
+                    game_id = len(self.games) + 1
+                    self.games[game_id] = {"id": game_id, "date": tournament.get("start_date"), "finished": False,
+                                           "rounds": 0, "teams": [team1, team2], "winner_id": None}
+                    self.match_games[match_id].append(game_id)
+
+    def seed(self, teams=0, players=0):
+        """Pre-populate the stub with existing teams and players"""
+        for i in range(teams):
+            self.create("teams", {"short_name": f"S{i:05d}", "full_name": f"Seed Team {i}", "country": "Brazil"})
+        for i in range(players):
+            self.create("players", {"nickname": f"seed{i}", "team_id": None})
+
+def run_scenario(scenario, count, players_per_team=5, batch_size=None, concurrency=None, tournament_team_count=None):
+    """Run one creation code path of generate_data.py against the configured API"""
+    if scenario == "teams":
+        generate_data.create_team_with_players(count, players_per_team, batch_size=batch_size, concurrency=concurrency)
+    elif scenario == "players":
+        generate_data.create_player(count, batch_size=batch_size, concurrency=concurrency)
+    elif scenario == "tournaments":
+        generate_data.create_tournament(count, team_count=tournament_team_count, concurrency=concurrency)
+    elif scenario == "soak":
+        generate_data.create_tournament(count, team_count=tournament_team_count, concurrency=concurrency)
+        generate_data.soak_tournaments(count, [concurrency or 1])
+    elif scenario == "warm":
+        generate_data.create_tournament(count, team_count=tournament_team_count, concurrency=concurrency)
+        generate_data.warm_caches(list(range(1, count + 1)), concurrency or 1)
+
+def benchmark(scenario, count, latency=0.0, error_rate=0.0, seed_teams=50, seed_players=0, players_per_team=5,
+              batch_size=None, concurrency=None, tournament_team_count=None, max_retries=None, backoff=0.0,
+              verbose=False, capacity=None, adaptive=False, cold_latency=0.0):
+    """
+    Run a seeding scenario against a fresh stub API and return the measured figures
+
+    Args:
+        scenario (str): "teams" (teams with players), "players", "tournaments", "soak" (tournaments
+            played through the game endpoints) or "warm" (tournaments whose read endpoints are warmed)
+        count (int): Number of entities the scenario creates
+        latency (float): Seconds the stub waits before answering each request
+        error_rate (float): Share of requests the stub fails with a 503
+        seed_teams (int): Teams present in the stub before the run
+        seed_players (int): Players present in the stub before the run
+        backoff (float): Base retry backoff in seconds (kept low so retries do not dominate)
+        verbose (bool): Keep the per-entity output of the creation code
+        capacity (int, optional): Concurrent writes the stub serves before answering 429
+        adaptive (bool): Drive the writes through an AdaptiveLimiter capped at `concurrency`
+        cold_latency (float): Extra seconds the stub takes for the first read of /teams/stats or /players/stats
+    """
+    api = StubApi(latency, error_rate, capacity=capacity, cold_latency=cold_latency).start()
+    try:
+        api.seed(seed_teams, seed_players)
+        before = {collection: len(items) for collection, items in api.data.items()}
+
+        generate_data.API_BASE_URL = api.base_url
+        generate_data.JWT_TOKEN = "benchmark"
+        generate_data.API_CLIENT = generate_data.ApiClient(
+            api.base_url, generate_data.get_auth_headers(),
+            pool_size=max(generate_data.HTTP_POOL_SIZE, concurrency or 1),
+            max_retries=generate_data.HTTP_MAX_RETRIES if max_retries is None else max_retries,
+            backoff=backoff)
+        limiter = None
+        if adaptive:
+            limiter = generate_data.API_CLIENT.limiter = generate_data.AdaptiveLimiter(concurrency or 1)
+
+        started = time.perf_counter()
+        with contextlib.ExitStack() as stack:
+            if not verbose:
+                stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, "w"))))
+            run_scenario(scenario, count, players_per_team, batch_size, concurrency, tournament_team_count)
+        elapsed = time.perf_counter() - started
+
+        created = {collection: len(items) - before[collection] for collection, items in api.data.items()}
+        entities = sum(created.values())
+        requests_sent = sum(stats["requests"] for stats in api.stats.values())
+        bytes_sent = sum(stats["bytes"] for stats in api.stats.values())
+        return {
+            "scenario": scenario,
+            "count": count,
+            "latency_ms": latency * 1000,
+            "error_rate": error_rate,
+            "batch_size": batch_size,
+            "concurrency": concurrency,
+            "elapsed_seconds": round(elapsed, 4),
+            "created": created,
+            "entities_per_second": round(entities / elapsed, 1) if elapsed else None,
+            "requests": requests_sent,
+            "errors": sum(stats["errors"] for stats in api.stats.values()),
+            "retries": generate_data.API_CLIENT.retries,
+            "bytes_sent": bytes_sent,
+            "bytes_per_entity": round(bytes_sent / entities, 1) if entities else None,
+            "endpoints": api.stats,
+            "adaptive": limiter.status() if limiter is not None else None,
+        }
+    finally:
+        generate_data.API_CLIENT = None
+        api.stop()
+
+def print_report(result):
+    """Print a benchmark result as a readable summary"""
+    created = ", ".join(f"{created} {collection}" for collection, created in result["created"].items() if created)
+    print(f"\nScenario: {result['scenario']} x{result['count']} "
+          f"(latency {result['latency_ms']:.0f}ms, error rate {result['error_rate']:.1%}, "
+          f"batch size {result['batch_size'] or '-'}, concurrency {result['concurrency'] or 1})")
+    print(f"⏱  Created {created or 'nothing'} in {result['elapsed_seconds']:.2f}s "
+          f"({result['entities_per_second']} entities/s)")
+    print(f"Requests: {result['requests']} ({result['errors']} failed, {result['retries']} retries), "
+          f"{result['bytes_sent']} bytes sent ({result['bytes_per_entity']} bytes/entity)")
+    for endpoint, stats in sorted(result["endpoints"].items()):
+        print(f"  {endpoint:<28} {stats['requests']:>7} requests  {stats['bytes']:>12} bytes  {stats['errors']:>5} errors")
+    if result["adaptive"]:
+        adaptive = result["adaptive"]
+        best = adaptive["best"] or {}
+        print(f"Adaptive: final limit {adaptive['limit']}, back-offs {adaptive['overloads'] or 'none'}, "
+              f"best {best.get('requests_per_second', '-')} writes/s at limit {best.get('limit', '-')}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark seeding throughput against an in-process stub API")
+    parser.add_argument("scenario", choices=["teams", "players", "tournaments", "soak", "warm"],
+                        help="Creation path to run (teams creates teams with their players, "
+                             "soak creates tournaments and plays them, warm creates tournaments "
+                             "and warms the stats cache)")
+    parser.add_argument("count", type=int, nargs="?", default=100, help="Number of entities to create")
+    parser.add_argument("--players", type=int, default=5, help="Players per team (for teams)")
+    parser.add_argument("--teams", type=int, help="Teams per tournament (for tournaments)")
+    parser.add_argument("--batch-size", type=int, help="Use the bulk endpoints with this chunk size")
+    parser.add_argument("--concurrency", type=int, help="Number of requests kept in flight")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub latency per request in milliseconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failed with a 503 (0-1)")
+    parser.add_argument("--capacity", type=int, help="Concurrent writes the stub serves before answering 429")
+    parser.add_argument("--cold-latency", type=float, default=0.0,
+                        help="Extra stub latency in milliseconds for the first read of /teams/stats or /players/stats")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Adapt the writes in flight with AdaptiveLimiter, up to --concurrency")
+    parser.add_argument("--seed-teams", type=int, default=50, help="Teams present in the stub before the run")
+    parser.add_argument("--seed-players", type=int, default=0, help="Players present in the stub before the run")
+    parser.add_argument("--max-retries", type=int, help="Retries for failed requests")
+    parser.add_argument("--backoff", type=float, default=0.0, help="Base retry backoff in seconds")
+    parser.add_argument("--output", type=str, help="Also write the result to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="Show the per-entity output of the creation code")
+    args = parser.parse_args()
+
+    result = benchmark(args.scenario, args.count, args.latency / 1000, args.error_rate, args.seed_teams,
+                       args.seed_players, args.players, args.batch_size, args.concurrency, args.teams,
+                       args.max_retries, args.backoff, args.verbose, args.capacity, args.adaptive,
+                       args.cold_latency / 1000)
+    print_report(result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(result, file, indent=2)
+            file.write("\n")
+        print(f"✅ Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
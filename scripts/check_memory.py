@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Peak memory budget check for generate_data.py
+
+Runs an offline export in a child process and compares its peak resident set size with a
+budget. Generation is streamed and only the uniqueness keys stay resident, so peak memory
+should grow by a few tens of bytes per player; exits with status 1 when it is over budget,
+so memory regressions fail CI.
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+# Default run: 100,000 teams of 5 players
+DEFAULT_TEAMS = 100000
+
+# Default budget for that run, in MB of peak RSS
+DEFAULT_BUDGET_MB = 96
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def peak_rss_mb():
+    """Peak RSS of the largest child process waited for so far, in MB (ru_maxrss is in bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the peak memory of a generate_data.py export against a budget")
+    parser.add_argument("--teams", type=int, default=DEFAULT_TEAMS, help="Number of teams exported")
+    parser.add_argument("--players", type=int, default=5, help="Players per team")
+    parser.add_argument("--budget-mb", type=float, default=DEFAULT_BUDGET_MB, help="Maximum peak RSS in MB")
+    parser.add_argument("--strength", type=str, help="Plan the rosters with this --strength profile or tier")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        command = [sys.executable, os.path.join(SCRIPTS_DIR, "generate_data.py"), "export", str(args.teams),
+                   "--players", str(args.players), "--format", "ndjson", "--output-dir", output_dir]
+        if args.strength:
+            command += ["--strength", args.strength]
+        started = time.perf_counter()
+        subprocess.run(command, cwd=SCRIPTS_DIR, check=True, capture_output=True)
+        elapsed = time.perf_counter() - started
+
+    peak = peak_rss_mb()
+    run = f"{args.teams} teams, {args.teams * args.players} players in {elapsed:.1f}s"
+    if peak <= args.budget_mb:
+        print(f"✅ Export of {run} peaked at {peak:.1f}MB (budget {args.budget_mb:.0f}MB)")
+    else:
+        print(f"❌ Export of {run} peaked at {peak:.1f}MB, over the {args.budget_mb:.0f}MB budget")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Import-time budget check for generate_data.py
+
+Imports the script in fresh interpreters, compares the median import time (above a bare
+interpreter start) with a budget, and checks that no heavy dependency is loaded at import.
+Exits with status 1 when either check fails, so startup regressions fail CI.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Modules generate_data.py must only import when a code path needs them
+LAZY_MODULES = ["requests", "urllib3", "jwt", "dotenv", "cairosvg", "numpy", "multiprocessing"]
+
+# Default budget for importing generate_data, in milliseconds above a bare interpreter start
+DEFAULT_BUDGET_MS = 100
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def time_command(code, runs):
+    """Run `python -c code` `runs` times in fresh interpreters and return the median wall time in ms"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=SCRIPTS_DIR, check=True, capture_output=True)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def loaded_lazy_modules():
+    """Return the heavy modules that are loaded right after importing generate_data"""
+    code = (
+        "import sys, generate_data\n"
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=SCRIPTS_DIR, check=True, capture_output=True, text=True)
+    output = result.stdout.strip().splitlines()
+    return [module for module in (output[-1] if output else "").split(",") if module]
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import time of generate_data.py against a budget")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Maximum median import time in milliseconds (above a bare interpreter start)")
+    parser.add_argument("--runs", type=int, default=7, help="Number of fresh interpreters to time")
+    args = parser.parse_args()
+
+    # Write the bytecode cache up front (imports skip it under PYTHONDONTWRITEBYTECODE), so no run compiles
+    subprocess.run([sys.executable, "-m", "py_compile", "generate_data.py"], cwd=SCRIPTS_DIR, check=True)
+    baseline = time_command("pass", args.runs)
+    total = time_command("import generate_data", args.runs)
+    import_ms = total - baseline
+
+    failed = False
+    if import_ms <= args.budget_ms:
+        print(f"✅ generate_data imports in {import_ms:.1f}ms (budget {args.budget_ms:.0f}ms, interpreter start {baseline:.1f}ms)")
+    else:
+        print(f"❌ generate_data imports in {import_ms:.1f}ms, over the {args.budget_ms:.0f}ms budget")
+        failed = True
+
+    eager = loaded_lazy_modules()
+    if eager:
+        print(f"❌ Imported eagerly: {', '.join(eager)}")
+        failed = True
+    else:
+        print(f"✅ No heavy dependencies imported at startup ({', '.join(LAZY_MODULES)})")
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
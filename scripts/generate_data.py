@@ -1,7 +1,5 @@
 #!/usr/bin/env python3
 import os
-import jwt
-import requests
 import random
 import json
 import sys
@@ -9,32 +7,104 @@ import argparse
 from datetime import datetime, timedelta
 import math
 import zlib
-import dotenv
 from io import BytesIO
 import re
+import base64
+import gzip
+import hashlib
+import heapq
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache, partial
+from itertools import islice
 
-# Import cairosvg for SVG to PNG conversion
-try:
-    import cairosvg
-    CAIROSVG_AVAILABLE = True
-except ImportError:
-    CAIROSVG_AVAILABLE = False
-    print("Warning: cairosvg library not available. Using fallback PNG generation.")
-    print("Note: cairosvg requires the Cairo graphics library.")
-    print("- For macOS: brew install cairo")
-    print("- For Ubuntu/Debian: apt-get install libcairo2-dev")
-    print("- For Windows: pip install cairosvg")
+# Heavy and optional dependencies (requests, jwt, dotenv, cairosvg, numpy) are imported on
+# first use, so subcommands that never call the API or render a logo start quickly
+
+@lru_cache(maxsize=None)
+def load_cairosvg():
+    """Import cairosvg for SVG to PNG conversion, or return None (with install hints) if unavailable"""
+    try:
+        import cairosvg
+        return cairosvg
+    except (ImportError, OSError):
+        print("Warning: cairosvg library not available. Using fallback PNG generation.")
+        print("Note: cairosvg requires the Cairo graphics library.")
+        print("- For macOS: brew install cairo")
+        print("- For Ubuntu/Debian: apt-get install libcairo2-dev")
+        print("- For Windows: pip install cairosvg")
+        return None
+
+def cairosvg_available():
+    """Whether logos are rendered with cairosvg (rather than the fallback renderer)"""
+    return load_cairosvg() is not None
+
+@lru_cache(maxsize=None)
+def load_numpy():
+    """Import NumPy (optional, vectorizes batched player attribute generation), or return None"""
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
 
 # API base URL
 API_BASE_URL = "http://localhost:8000/api"
 
+# Page size used when walking list endpoints (the API caps `limit` at 100)
+PAGE_SIZE = 100
+
+# Number of pages fetched concurrently when walking list endpoints
+PAGE_FETCH_WORKERS = 1
+
+# HTTP client settings
+HTTP_POOL_SIZE = 10
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_SECONDS = 0.5
+HTTP_TIMEOUT_SECONDS = 60
+
+# Boundary of the multipart bodies sent by this process (random, so it cannot clash with uploaded data)
+MULTIPART_BOUNDARY = os.urandom(16).hex()
+
+# Status codes worth retrying (rate limiting and transient gateway/server errors)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Status codes worth retrying for writes that are not idempotent: a 500 is left out, since an
+# insert that hit a unique constraint fails the same way on every retry
+RETRY_WRITE_STATUS_CODES = {429, 502, 503, 504}
+
+# Adaptive (AIMD) concurrency for API writes: default ceiling, multiplicative decrease on
+# overload, tolerated latency growth over the baseline, minimum window size and readout interval
+ADAPTIVE_MAX_CONCURRENCY = 32
+ADAPTIVE_DECREASE_FACTOR = 0.75
+ADAPTIVE_LATENCY_TOLERANCE = 2.0
+ADAPTIVE_MIN_WINDOW = 10
+ADAPTIVE_REPORT_SECONDS = 2.0
+
 # JWT token for authentication
 JWT_TOKEN = None
 
+# Shared API client (created lazily by get_api_client)
+API_CLIENT = None
+
+# Write-ahead journal of the current run (see RunJournal), or None when journaling is off
+RUN_JOURNAL = None
+RUN_JOURNAL_DIR = os.path.join(os.path.expanduser("~"), ".cache", "vavalm", "runs")
+
+# The journal is fsynced after this many records or seconds, whichever comes first
+JOURNAL_SYNC_RECORDS = 500
+JOURNAL_SYNC_SECONDS = 1.0
+
 # Function to set the JWT token
 def set_jwt_token(token):
-    global JWT_TOKEN
+    global JWT_TOKEN, API_CLIENT
     JWT_TOKEN = token
+    # Drop the shared client so the next one is built with the new token
+    API_CLIENT = None
     print(f"JWT token set successfully: {JWT_TOKEN}")
 
 # Function to get headers with Authorization
@@ -44,6 +114,366 @@ def get_auth_headers():
         headers["Authorization"] = f"Bearer {JWT_TOKEN}"
     return headers
 
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted sequence (None if it is empty)"""
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))]
+
+class RequestMetrics:
+    """
+    Timing of every API call, grouped by endpoint
+
+    Each attempt is recorded with its method and path (numeric IDs collapsed to {id}),
+    status, latency and request payload size. Latencies are kept in compact float arrays
+    so long runs can still report exact percentiles.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.endpoints = {}
+
+    def record(self, method, path, status, latency, size):
+        """Record one request attempt; `status` is None when no response was received"""
+        endpoint = f"{method} " + re.sub(r"/\d+", "/{id}", "/" + path.strip("/").split("?")[0])
+        with self.lock:
+            stats = self.endpoints.get(endpoint)
+            if stats is None:
+                stats = self.endpoints[endpoint] = {"latencies": array("d"), "bytes": 0, "statuses": Counter(),
+                                                    "first": time.perf_counter() - latency}
+            stats["latencies"].append(latency)
+            stats["bytes"] += size
+            stats["statuses"][status] += 1
+            stats["last"] = time.perf_counter()
+
+    def summary(self):
+        """Return the per-endpoint summary (counts, errors, throughput and p50/p95/p99 latency in ms)"""
+        with self.lock:
+            endpoints = {endpoint: dict(stats, latencies=sorted(stats["latencies"]))
+                         for endpoint, stats in self.endpoints.items()}
+        
+        summary = {"elapsed_seconds": round(time.perf_counter() - self.started, 3), "endpoints": {}}
+        for endpoint, stats in sorted(endpoints.items()):
+            latencies = stats["latencies"]
+            window = max(stats["last"] - stats["first"], 1e-9)
+            errors = sum(count for status, count in stats["statuses"].items() if status is None or status >= 400)
+            summary["endpoints"][endpoint] = {
+                "requests": len(latencies),
+                "errors": errors,
+                "statuses": {str(status or "error"): count for status, count in sorted(
+                    stats["statuses"].items(), key=lambda item: item[0] or 0)},
+                "bytes_sent": stats["bytes"],
+                "requests_per_second": round(len(latencies) / window, 2),
+                "bytes_per_second": round(stats["bytes"] / window, 1),
+                "latency_ms": {name: round(percentile(latencies, fraction) * 1000, 2)
+                               for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))},
+                "max_latency_ms": round(latencies[-1] * 1000, 2),
+            }
+        return summary
+
+    def print_summary(self):
+        """Print the per-endpoint summary as a table"""
+        summary = self.summary()
+        if not summary["endpoints"]:
+            return
+        print(f"\nAPI requests ({summary['elapsed_seconds']:.2f}s):")
+        print(f"  {'Endpoint':<36} {'Requests':>8} {'Errors':>6} {'Req/s':>8} {'KB sent':>9} "
+              f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for endpoint, stats in summary["endpoints"].items():
+            latency = stats["latency_ms"]
+            print(f"  {endpoint:<36} {stats['requests']:>8} {stats['errors']:>6} {stats['requests_per_second']:>8.1f} "
+                  f"{stats['bytes_sent'] / 1024:>9.1f} {latency['p50']:>8.1f} {latency['p95']:>8.1f} {latency['p99']:>8.1f}")
+
+    def write_json(self, path):
+        """Dump the summary to a JSON file"""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=2)
+            file.write("\n")
+        print(f"✅ Request metrics written to {path}")
+
+class AdaptiveLimiter:
+    """
+    AIMD limit on the number of API writes in flight
+
+    Writes take a slot before they are sent and report their outcome when they finish.
+    Outcomes are judged in windows of about one request per slot. A 429, a 5xx or a
+    connection error multiplies the limit by `decrease_factor` right away; so does a window
+    whose median latency exceeds the baseline (the lowest window median seen, drifting slowly
+    towards the current one) by more than `latency_tolerance` times. A healthy window in which
+    the limit was actually reached raises it by one. Requests that were already in flight when
+    the limit was cut do not count towards the next decision, so one overload backs off once.
+
+    Args:
+        max_limit (int): Ceiling for the limit (the number of worker threads available)
+        initial (int): Starting limit
+        min_limit (int): Floor for the limit
+        decrease_factor (float): Factor the limit is multiplied by on overload
+        latency_tolerance (float): Median latency over the baseline that counts as a spike
+    """
+
+    def __init__(self, max_limit=ADAPTIVE_MAX_CONCURRENCY, initial=1, min_limit=1,
+                 decrease_factor=ADAPTIVE_DECREASE_FACTOR, latency_tolerance=ADAPTIVE_LATENCY_TOLERANCE):
+        self.condition = threading.Condition()
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.generation = 0
+        self.baseline = None
+        self.completed = 0
+        self.overloads = Counter()
+        self.best = None
+        self.started = time.perf_counter()
+        self.reporter = None
+        self.reset_window()
+
+    def reset_window(self):
+        self.window = array("d")
+        self.window_started = time.perf_counter()
+        self.saturated = self.in_flight >= int(self.limit)
+
+    def acquire(self):
+        """Wait for a free slot and return the token to pass to release()"""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.saturated = True
+                self.condition.wait()
+            self.in_flight += 1
+            if self.in_flight >= int(self.limit):
+                self.saturated = True
+            return self.generation
+
+    def release(self, token, status, latency):
+        """
+        Free a slot and feed the outcome of its request into the limit
+
+        Args:
+            token (int): Value returned by acquire()
+            status (int): Response status, or None if no response was received
+            latency (float): Request latency in seconds
+        """
+        with self.condition:
+            self.in_flight -= 1
+            self.completed += 1
+            if token == self.generation:
+                if status is None or status == 429 or status >= 500:
+                    self.decrease(str(status or "error"))
+                else:
+                    self.window.append(latency)
+                    if len(self.window) >= max(int(self.limit), ADAPTIVE_MIN_WINDOW):
+                        self.close_window()
+            self.condition.notify_all()
+
+    def decrease(self, reason):
+        self.overloads[reason] += 1
+        self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        self.generation += 1
+        self.reset_window()
+
+    def close_window(self):
+        """Judge a full window of successful requests: back off on a latency spike, otherwise ramp up"""
+        median = percentile(sorted(self.window), 0.5)
+        rate = len(self.window) / max(time.perf_counter() - self.window_started, 1e-9)
+        if self.baseline is None or median < self.baseline:
+            self.baseline = median
+        else:
+            # Let the baseline follow a lasting shift in server latency instead of pinning the first lucky window
+            self.baseline += (median - self.baseline) * 0.05
+
+        if median > self.baseline * self.latency_tolerance:
+            return self.decrease("latency")
+        if self.best is None or rate > self.best["requests_per_second"]:
+            self.best = {"requests_per_second": round(rate, 1), "limit": int(self.limit),
+                         "p50_ms": round(median * 1000, 1)}
+        if self.saturated and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1)
+        self.reset_window()
+
+    def status(self):
+        """Return the current limit, in-flight requests, baseline latency and overload counts"""
+        with self.condition:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "baseline_ms": round(self.baseline * 1000, 1) if self.baseline is not None else None,
+                "overloads": dict(self.overloads),
+                "best": self.best,
+            }
+
+    def start_readout(self, interval=ADAPTIVE_REPORT_SECONDS):
+        """Print the current limit and write rate every `interval` seconds on a background thread"""
+        stop = threading.Event()
+
+        def report():
+            completed = 0
+            while not stop.wait(interval):
+                status = self.status()
+                rate = (status["completed"] - completed) / interval
+                completed = status["completed"]
+                baseline = f"{status['baseline_ms']:.0f}ms" if status["baseline_ms"] is not None else "-"
+                print(f"⚙️  Adaptive: limit {status['limit']}, {status['in_flight']} in flight, {rate:.1f} writes/s, "
+                      f"baseline p50 {baseline}, {sum(status['overloads'].values())} back-offs")
+
+        self.reporter = (threading.Thread(target=report, daemon=True), stop)
+        self.reporter[0].start()
+
+    def stop_readout(self):
+        if self.reporter is not None:
+            self.reporter[1].set()
+            self.reporter[0].join()
+            self.reporter = None
+
+    def print_summary(self):
+        """Print the final limit, the back-offs and the best healthy write throughput seen"""
+        status = self.status()
+        overloads = ", ".join(f"{count} on {reason}" for reason, count in sorted(status["overloads"].items()))
+        print(f"Adaptive concurrency: final limit {status['limit']} (ceiling {self.max_limit}), "
+              f"back-offs: {overloads or 'none'}")
+        if status["best"]:
+            best = status["best"]
+            print(f"✅ Sustained {best['requests_per_second']} writes/s at {best['limit']} in flight "
+                  f"(p50 {best['p50_ms']}ms) without errors or latency spikes")
+
+class ApiClient:
+    """
+    Shared HTTP client for the API
+
+    Wraps a single requests.Session so every call reuses pooled keep-alive connections.
+    Idempotent calls (GET/PUT/DELETE) and calls explicitly marked as retryable (the bulk
+    endpoints) are retried on connection errors and transient statuses with jittered
+    exponential backoff; retryable writes are not retried on a 500 (RETRY_WRITE_STATUS_CODES).
+    A 429 means the request was not processed, so it is retried for any method. Every attempt is timed into `metrics`, and writes wait for a slot
+    from `limiter` when an AdaptiveLimiter is attached.
+    """
+
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+    READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(self, base_url, headers=None, pool_size=HTTP_POOL_SIZE, max_retries=HTTP_MAX_RETRIES,
+                 backoff=HTTP_BACKOFF_SECONDS, timeout=HTTP_TIMEOUT_SECONDS):
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.retries = 0
+        self.metrics = RequestMetrics()
+        self.limiter = None
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    def url(self, path):
+        """Build the absolute URL for a path relative to the API base URL"""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def backoff_delay(self, attempt, response=None):
+        """Full-jitter exponential backoff, honouring a numeric Retry-After header if present"""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.backoff * 2 ** self.max_retries)
+        return random.uniform(0, self.backoff * 2 ** attempt)
+
+    def request(self, method, path, retry=None, **kwargs):
+        """
+        Send a request to the API
+
+        Args:
+            method (str): HTTP method
+            path (str): Path relative to the API base URL (e.g. "teams/bulk")
+            retry (bool, optional): Whether the call may be retried (defaults to True for idempotent methods)
+            **kwargs: Passed through to requests.Session.request
+        """
+        import requests
+        method = method.upper()
+        if retry is None:
+            retry = method in self.IDEMPOTENT_METHODS
+        retry_statuses = RETRY_STATUS_CODES if method in self.IDEMPOTENT_METHODS else RETRY_WRITE_STATUS_CODES
+        kwargs.setdefault("timeout", self.timeout)
+        attempts = self.max_retries + 1
+        limiter = self.limiter if method not in self.READ_METHODS else None
+
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            token = limiter.acquire() if limiter is not None else None
+            status = None
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, self.url(path), **kwargs)
+                status = response.status_code
+            except (requests.ConnectionError, requests.Timeout):
+                self.metrics.record(method, path, None, time.perf_counter() - started, 0)
+                if last_attempt or not retry:
+                    raise
+                delay = self.backoff_delay(attempt)
+            else:
+                body = response.request.body or b""
+                self.metrics.record(method, path, response.status_code, time.perf_counter() - started,
+                                    len(body) if not isinstance(body, str) else len(body.encode("utf-8")))
+                if (last_attempt or response.status_code not in retry_statuses
+                        or not (retry or response.status_code == 429)):
+                    return response
+                delay = self.backoff_delay(attempt, response)
+            finally:
+                # The slot is freed before any backoff sleep so waiting retries do not hold it
+                if limiter is not None:
+                    limiter.release(token, status, time.perf_counter() - started)
+
+            self.retries += 1
+            time.sleep(delay)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def connection_stats(self):
+        """
+        Return connection reuse statistics for the pooled connections
+
+        Returns a dict with the number of requests sent, new connections opened,
+        the share of requests that reused an existing connection and the number of retries
+        """
+        pools = self.adapter.poolmanager.pools
+        requests_sent = 0
+        connections = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                requests_sent += pool.num_requests
+                connections += pool.num_connections
+        reuse = (requests_sent - connections) / requests_sent if requests_sent else 0.0
+        return {
+            "requests": requests_sent,
+            "connections": connections,
+            "reuse_ratio": reuse,
+            "retries": self.retries,
+        }
+
+    def print_connection_stats(self):
+        """Print a one-line summary of connection reuse"""
+        stats = self.connection_stats()
+        if stats["requests"]:
+            print(f"HTTP: {stats['requests']} requests over {stats['connections']} connections "
+                  f"({stats['reuse_ratio']:.1%} reused), {stats['retries']} retries")
+
+def get_api_client():
+    """Return the shared ApiClient, creating it from API_BASE_URL and the auth headers on first use"""
+    global API_CLIENT
+    if API_CLIENT is None:
+        API_CLIENT = ApiClient(API_BASE_URL, get_auth_headers(), pool_size=HTTP_POOL_SIZE, max_retries=HTTP_MAX_RETRIES)
+    return API_CLIENT
+
 # Tournament types from API
 TOURNAMENT_TYPE = ["SINGLE_GROUP"]
 
@@ -57,8 +487,14 @@ PLAYER_ROLES = [
     "IGL"
 ]
 
-# Match types from API
+# Match types from API, and the games a team needs to win each (MatchService.numberOfGamesToWinForMatchType)
 MATCH_TYPES = ["BO1", "BO3", "BO5"]
+MATCH_GAMES_TO_WIN = {"BO1": 1, "BO3": 2, "BO5": 3}
+
+# Rounds of every game played through /games/{id}/rounds/{round}/play by the soak driver before
+# /games/{id}/play finishes the game (no game ends before round 13, hence the limit)
+SOAK_ROUND_PLAYS = 3
+ROUND_PLAYS_LIMIT = 12
 
 # Tournament name components
 REGIONS = [
@@ -212,11 +648,65 @@ NICKNAMES = [
     "Bubzkji", "tabseN", "tiziaN", "syrsoN", "Ax1Le", "YEKINDAR", "Jame", "FL1T", "qikert", "SANJI"
 ]
 
+# Player attributes, in the column order of PlayerAttributeBatch
+PLAYER_ATTRIBUTE_NAMES = [
+    "clutch", "awareness", "aim", "positioning", "game_reading",
+    "resilience", "confidence", "strategy", "adaptability", "communication",
+    "unpredictability", "game_sense", "decision_making", "rage_fuel",
+    "teamwork", "utility_usage"
+]
+
+# Players whose attributes are generated together (see next_player_attributes)
+PLAYER_ATTRIBUTE_BATCH_SIZE = 1024
+PLAYER_ATTRIBUTE_STREAM = iter(())
+PLAYER_ATTRIBUTE_LOCK = threading.Lock()
+
+# Team strength tiers, as quantiles of the strength of randomly generated rosters
+STRENGTH_TIERS = {"S": 0.95, "A": 0.8, "B": 0.5, "C": 0.2, "D": 0.05}
+
+# League strength profiles: the share of teams in each tier
+STRENGTH_PROFILES = {
+    "even": {"B": 1.0},
+    "tiered": {tier: 1 / len(STRENGTH_TIERS) for tier in STRENGTH_TIERS},
+    "top-heavy": {"S": 0.1, "A": 0.2, "B": 0.3, "C": 0.4},
+}
+
+# Candidate rosters tried per team, and the share of the sorted player pool they are drawn from
+STRENGTH_CANDIDATES = 64
+STRENGTH_WINDOW = 0.05
+
+# Largest player pool rosters are drawn from, and teams whose candidates are searched at once
+# (pool indices fit in 16 bits, so a plan costs 2 bytes per player plus a 1 MB pool)
+STRENGTH_POOL_MAX = 1 << 16
+STRENGTH_PLAN_CHUNK = 1024
+
+# Planned rosters handed out to new teams (see plan_team_strengths), or None for random attributes
+TEAM_STRENGTH_PLAN = None
+
+# Slots a KeySet starts with, and the share of its slots filled before it doubles
+KEY_SET_MIN_SLOTS = 1024
+KEY_SET_MAX_LOAD = 2 / 3
+
+# Decorations and letter substitutions used by the nickname patterns
+NICKNAME_PREFIXES = ["x", "i", "o", "v", "s1", "The", "Mr", "Sir", ""]
+NICKNAME_SUFFIXES = ["x", "z", "y", "TTV", "YT", "Pro", "TV", ""]
+LEET_SUBSTITUTIONS = [('a', '4'), ('e', '3'), ('i', '1'), ('o', '0'), ('s', '5'), ('t', '7')]
+
 # Logo elements
 # Collection of SVG logos that are free to use (public domain or open licensed)
 LOGO_COLORS = ["red", "blue", "green", "yellow", "purple", "orange", "black", "white", 
               "gold", "silver", "crimson", "navy", "emerald", "azure", "violet", "amber"]
 
+# Rendered logos are cached in process and on disk, keyed by the colored SVG content
+# (i.e. template, primary and secondary color). 15 templates x 16 x 15 colors stay well below the LRU size.
+LOGO_CACHE_SIZE = 4096
+LOGO_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "vavalm", "logos")
+LOGO_CACHE_STATS = {"memory_hits": 0, "disk_hits": 0, "renders": 0}
+LOGO_MEMORY_CACHE = OrderedDict()
+
+# Emit indexed-colour PNGs from the fallback renderer (smaller uploads, same pixels)
+LOGO_INDEXED_PNG = False
+
 # Collection of SVG logos that are free to use (public domain or open licensed)
 SVG_LOGOS = [
     # Simple shield
@@ -351,29 +841,94 @@ def generate_random_date_range(start_date=None, end_date=None):
     
     return start.isoformat(), end.isoformat()
 
-def generate_unique_short_name(base_name):
-    """Generate a unique short name for a team by adding random suffix"""
-    # Take either the base name or the last word of a multi-word name
-    short_name = base_name.split()[-1] 
-    
-    # Add a random number suffix to make it more unique
-    random_suffix = str(random.randint(1, 999))
-    
-    return f"{short_name}{random_suffix}"
+class PageFetchError(Exception):
+    """A page of a collection could not be fetched, so the collection would be incomplete"""
+
+def fetch_page(endpoint, offset=0, limit=PAGE_SIZE):
+    """
+    Fetch a single page of a paginated collection endpoint
 
-def fetch_teams():
-    """Fetch teams from the API"""
+    Args:
+        endpoint (str): Collection path relative to the API base URL (e.g. "teams")
+        offset (int): Number of items to skip
+        limit (int): Maximum number of items to return (the API caps this at 100)
+
+    Returns a tuple of (items, total), or None if the request failed
+    """
     try:
-        response = requests.get(f"{API_BASE_URL}/teams", headers=get_auth_headers())
+        response = get_api_client().get(endpoint, params={"limit": limit, "offset": offset})
         if response.status_code == 200:
             data = response.json()
-            return data.get("items", [])
+            return data.get("items", []), data.get("total", 0)
         else:
-            print(f"Error fetching teams: {response.status_code}")
-            return []
+            print(f"Error fetching {endpoint} (offset {offset}): {response.status_code}")
+            return None
     except Exception as e:
         print(f"Error: {e}")
-        return []
+        return None
+
+def iter_collection(endpoint, page_size=PAGE_SIZE, workers=None):
+    """
+    Lazily iterate over every item of a paginated collection endpoint
+
+    The first page is fetched to learn the total. The remaining pages are then
+    fetched either one after another or, when more than one worker is requested,
+    concurrently with a bounded number of pages in flight. Items are always
+    yielded in API order and only a few pages are held in memory at a time.
+
+    Raises PageFetchError if a page still fails after the client's retries, rather
+    than ending early with a collection that looks complete but is not.
+
+    Args:
+        endpoint (str): Collection path relative to the API base URL (e.g. "teams")
+        page_size (int): Number of items requested per page
+        workers (int, optional): Number of pages to fetch concurrently
+            (defaults to PAGE_FETCH_WORKERS)
+    """
+    workers = workers or PAGE_FETCH_WORKERS
+
+    first_page = fetch_page(endpoint, 0, page_size)
+    if first_page is None:
+        raise PageFetchError(f"Could not fetch {endpoint} (offset 0)")
+    items, total = first_page
+    yield from items
+
+    # The server may return fewer items than requested, so step by what it actually gave us
+    page_size = len(items)
+    if page_size == 0:
+        return
+    offsets = range(page_size, total, page_size)
+
+    if workers <= 1:
+        for offset in offsets:
+            page = fetch_page(endpoint, offset, page_size)
+            if page is None:
+                raise PageFetchError(f"Could not fetch {endpoint} (offset {offset} of {total})")
+            yield from page[0]
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Keep a small window of pages in flight so memory stays bounded
+        pending = deque()
+        offsets = iter(offsets)
+        for offset in islice(offsets, workers * 2):
+            pending.append((offset, executor.submit(fetch_page, endpoint, offset, page_size)))
+
+        while pending:
+            offset, future = pending.popleft()
+            page = future.result()
+            if page is None:
+                for _, remaining in pending:
+                    remaining.cancel()
+                raise PageFetchError(f"Could not fetch {endpoint} (offset {offset} of {total})")
+            next_offset = next(offsets, None)
+            if next_offset is not None:
+                pending.append((next_offset, executor.submit(fetch_page, endpoint, next_offset, page_size)))
+            yield from page[0]
+
+def iter_teams(workers=None):
+    """Lazily iterate over all teams in the API"""
+    return iter_collection("teams", workers=workers)
 
 def generate_team_logo():
     """Generate a team logo using SVG designs"""
@@ -576,8 +1131,8 @@ def generate_player_nickname():
     elif pattern == 3:
         # Stylized nickname (e.g., "xPhantomx")
         nickname = random.choice(NICKNAMES)
-        prefix = random.choice(["x", "i", "o", "v", "s1", "The", "Mr", "Sir", ""])
-        suffix = random.choice(["x", "z", "y", "TTV", "YT", "Pro", "TV", ""])
+        prefix = random.choice(NICKNAME_PREFIXES)
+        suffix = random.choice(NICKNAME_SUFFIXES)
         return f"{prefix}{nickname}{suffix}"
     elif pattern == 4:
         # Two word nickname (e.g., "Phantom Assassin")
@@ -589,7 +1144,7 @@ def generate_player_nickname():
         nickname = random.choice(NICKNAMES)
         # 50% chance to replace some letters with numbers
         if random.random() < 0.5:
-            for old, new in [('a', '4'), ('e', '3'), ('i', '1'), ('o', '0'), ('s', '5'), ('t', '7')]:
+            for old, new in LEET_SUBSTITUTIONS:
                 if old in nickname.lower() and random.random() < 0.7:
                     nickname = nickname.replace(old, new).replace(old.upper(), new)
         return nickname
@@ -597,18 +1152,12 @@ def generate_player_nickname():
 def generate_player_attributes():
     """Generate detailed random player attributes with a signature strength"""
     attributes = {}
-    attribute_names = [
-        "clutch", "awareness", "aim", "positioning", "game_reading",
-        "resilience", "confidence", "strategy", "adaptability", "communication",
-        "unpredictability", "game_sense", "decision_making", "rage_fuel",
-        "teamwork", "utility_usage"
-    ]
     
     # Choose 1-2 signature strengths
-    signature_attributes = random.sample(attribute_names, random.randint(1, 2))
+    signature_attributes = random.sample(PLAYER_ATTRIBUTE_NAMES, random.randint(1, 2))
     
     # Assign values to all attributes
-    for attr in attribute_names:
+    for attr in PLAYER_ATTRIBUTE_NAMES:
         if attr in signature_attributes:
             # Signature attributes get highest values
             attributes[attr] = random.randint(2, 3)
@@ -618,7 +1167,304 @@ def generate_player_attributes():
     
     return attributes
 
-def create_tournament(count=1, start_date=None, end_date=None, team_count=None):
+class PlayerAttributeBatch:
+    """
+    Attributes of a batch of players, one column per entry of PLAYER_ATTRIBUTE_NAMES
+
+    Values are kept in a (count, attributes) uint8 NumPy array, or a flat array('B')
+    without NumPy, and only turned into player_attributes dicts when a row is read.
+    """
+
+    def __init__(self, values, count):
+        self.values = values
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def to_dict(self, index):
+        """Return the player_attributes dict of one player"""
+        if isinstance(self.values, array):
+            width = len(PLAYER_ATTRIBUTE_NAMES)
+            row = self.values[index * width:(index + 1) * width].tolist()
+        else:
+            row = self.values[index].tolist()
+        return dict(zip(PLAYER_ATTRIBUTE_NAMES, row))
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self.to_dict(index)
+
+def generate_player_attributes_batch(count):
+    """
+    Generate the attributes of `count` players at once
+
+    Follows the same rule as generate_player_attributes: 1 or 2 distinct signature
+    attributes at 2-3, every other attribute at 0-2. With NumPy each step is a single
+    vectorized draw over the whole batch.
+
+    Returns a PlayerAttributeBatch
+    """
+    width = len(PLAYER_ATTRIBUTE_NAMES)
+    
+    np = load_numpy()
+    if np is not None:
+        rng = np.random.default_rng(random.getrandbits(64))
+        values = rng.integers(0, 3, size=(count, width), dtype=np.uint8)
+        rows = np.arange(count)
+        # A uniformly random pair of distinct columns per player; the second is only used by players with two
+        first = rng.integers(0, width, size=count)
+        second = (first + rng.integers(1, width, size=count)) % width
+        values[rows, first] = rng.integers(2, 4, size=count, dtype=np.uint8)
+        two_signatures = rng.integers(0, 2, size=count).astype(bool)
+        values[rows[two_signatures], second[two_signatures]] = rng.integers(
+            2, 4, size=int(two_signatures.sum()), dtype=np.uint8)
+        return PlayerAttributeBatch(values, count)
+    
+    values = array("B", random.choices(range(3), k=count * width))
+    for row in range(count):
+        for column in random.sample(range(width), random.randint(1, 2)):
+            values[row * width + column] = random.randint(2, 3)
+    return PlayerAttributeBatch(values, count)
+
+def next_player_attributes():
+    """Return the attributes of one player, drawn from batches of PLAYER_ATTRIBUTE_BATCH_SIZE players"""
+    global PLAYER_ATTRIBUTE_STREAM
+    with PLAYER_ATTRIBUTE_LOCK:
+        attributes = next(PLAYER_ATTRIBUTE_STREAM, None)
+        if attributes is None:
+            PLAYER_ATTRIBUTE_STREAM = iter(generate_player_attributes_batch(PLAYER_ATTRIBUTE_BATCH_SIZE))
+            attributes = next(PLAYER_ATTRIBUTE_STREAM)
+    return attributes
+
+def player_strengths(batch):
+    """
+    Strength score of every player of a PlayerAttributeBatch: the sum of their attributes
+
+    Duel chances add up max(0, attribute - opponent's counter attribute), and every attribute
+    is the counter of exactly one other. So against an average opponent, a player's expected
+    chance minus the opponent's chance against them is this total minus a constant.
+    """
+    if isinstance(batch.values, array):
+        width = len(PLAYER_ATTRIBUTE_NAMES)
+        return [sum(batch.values[index * width:(index + 1) * width]) for index in range(batch.count)]
+    return batch.values.sum(axis=1, dtype="int64")
+
+def strength_tiers(team_count, strength):
+    """Return the tier of each of `team_count` teams, in random order, for a tier or a profile name"""
+    shares = STRENGTH_PROFILES.get(strength, {strength: 1.0})
+    counts = {tier: math.floor(share * team_count) for tier, share in shares.items()}
+    # Teams left over by rounding down go to the tiers with the largest remainders
+    by_remainder = sorted(shares, key=lambda tier: counts[tier] - shares[tier] * team_count)
+    for tier in by_remainder[:team_count - sum(counts.values())]:
+        counts[tier] += 1
+    tiers = [tier for tier, count in counts.items() for _ in range(count)]
+    random.shuffle(tiers)
+    return tiers
+
+class StrengthPlan:
+    """
+    Planned rosters of a strength-targeted run, kept as indices into a shared player pool
+
+    Holds the tier of every team (one byte each), the roster of every team as a flat
+    array of 16-bit pool indices and the pool as a PlayerAttributeBatch, so a plan for
+    millions of players stays small. Iterating yields (tier, [player_attributes, ...]) per team,
+    building the attribute dicts only when a roster is handed out.
+    """
+    __slots__ = ("tiers", "rosters", "pool", "players_per_team")
+
+    TIER_NAMES = list(STRENGTH_TIERS)
+
+    def __init__(self, tiers, rosters, pool, players_per_team):
+        self.tiers = tiers
+        self.rosters = rosters
+        self.pool = pool
+        self.players_per_team = players_per_team
+
+    def __len__(self):
+        return len(self.tiers)
+
+    def roster(self, index):
+        start = index * self.players_per_team
+        return self.rosters[start:start + self.players_per_team]
+
+    def __iter__(self):
+        for index, tier in enumerate(self.tiers):
+            yield self.TIER_NAMES[tier], [self.pool.to_dict(player) for player in self.roster(index)]
+
+    def strengths(self):
+        """Yield (tier, roster strength) per team, without building the attribute dicts"""
+        strengths = player_strengths(self.pool)
+        if isinstance(strengths, list):
+            for index, tier in enumerate(self.tiers):
+                yield self.TIER_NAMES[tier], sum(strengths[player] for player in self.roster(index))
+            return
+        np = load_numpy()
+        players = np.frombuffer(self.rosters, dtype=self.rosters.typecode)
+        # Summed STRENGTH_PLAN_CHUNK teams at a time, so the totals never cost a word per player
+        for start in range(0, len(self), STRENGTH_PLAN_CHUNK):
+            chunk = players[start * self.players_per_team:(start + STRENGTH_PLAN_CHUNK) * self.players_per_team]
+            totals = strengths[chunk].reshape(-1, self.players_per_team).sum(axis=1)
+            for tier, total in zip(self.tiers[start:start + STRENGTH_PLAN_CHUNK], totals.tolist()):
+                yield self.TIER_NAMES[tier], total
+
+def plan_team_strengths(team_count, players_per_team=5, strength="even"):
+    """
+    Plan the player attributes of `team_count` rosters so each team hits a strength tier
+
+    A pool of players (at most STRENGTH_POOL_MAX) is generated and sorted by strength. Tier
+    targets are quantiles of the roster strength (the sum of player strengths) of random rosters
+    drawn from the pool. Each team then draws STRENGTH_CANDIDATES candidate rosters from the
+    slice of the pool around its target's per-player strength and keeps the closest one. With
+    NumPy, STRENGTH_PLAN_CHUNK teams are searched per vectorized pass, so nothing but the plan
+    itself grows with `team_count`. Pool players can end up in several rosters; they only share
+    the attribute values.
+
+    Args:
+        team_count (int): Number of rosters to plan
+        players_per_team (int): Players per roster
+        strength (str): A tier of STRENGTH_TIERS for every team, or a profile of STRENGTH_PROFILES
+
+    Returns a StrengthPlan with the teams in random order
+    """
+    tier_indices = bytes(StrengthPlan.TIER_NAMES.index(tier) for tier in strength_tiers(team_count, strength))
+    pool = generate_player_attributes_batch(min(STRENGTH_POOL_MAX, max(4096, 2 * team_count * players_per_team)))
+    strengths = player_strengths(pool)
+    window = max(players_per_team, int(len(pool) * STRENGTH_WINDOW / 2))
+    rosters = array("H")
+    
+    np = load_numpy()
+    if np is not None:
+        rng = np.random.default_rng(random.getrandbits(64))
+        order = np.argsort(strengths, kind="stable").astype(np.uint16)
+        ranked = strengths[order]
+        random_rosters = ranked[rng.integers(0, len(pool), (4096, players_per_team))].sum(axis=1)
+        # One target per tier, indexed by each team's tier as its chunk is searched
+        tier_targets = np.quantile(random_rosters, [STRENGTH_TIERS[tier] for tier in StrengthPlan.TIER_NAMES]).round()
+        # Candidates are drawn around the pool position of each target's per-player strength
+        tier_centers = np.searchsorted(ranked, tier_targets / players_per_team)
+        team_tiers = np.frombuffer(tier_indices, dtype=np.uint8)
+        for start in range(0, team_count, STRENGTH_PLAN_CHUNK):
+            chunk = team_tiers[start:start + STRENGTH_PLAN_CHUNK]
+            offsets = rng.integers(-window, window + 1, (len(chunk), STRENGTH_CANDIDATES, players_per_team))
+            candidates = np.clip(tier_centers[chunk, None, None] + offsets, 0, len(pool) - 1)
+            best = np.abs(ranked[candidates].sum(axis=2) - tier_targets[chunk, None]).argmin(axis=1)
+            rosters.frombytes(order[candidates[np.arange(len(best)), best]].tobytes())
+    else:
+        order = sorted(range(len(pool)), key=strengths.__getitem__)
+        ranked = [strengths[index] for index in order]
+        random_rosters = sorted(sum(random.choices(ranked, k=players_per_team)) for _ in range(4096))
+        tier_targets = [round(percentile(random_rosters, STRENGTH_TIERS[tier])) for tier in StrengthPlan.TIER_NAMES]
+        tier_centers = [bisect_left(ranked, target / players_per_team) for target in tier_targets]
+        for tier in tier_indices:
+            target, center = tier_targets[tier], tier_centers[tier]
+            candidates = [[min(max(center + random.randint(-window, window), 0), len(pool) - 1)
+                           for _ in range(players_per_team)] for _ in range(STRENGTH_CANDIDATES)]
+            best = min(candidates, key=lambda roster: abs(sum(ranked[index] for index in roster) - target))
+            rosters.extend(order[index] for index in best)
+    
+    return StrengthPlan(tier_indices, rosters, pool, players_per_team)
+
+def print_strength_plan(plan):
+    """Print the number of planned teams and their average roster strength per tier"""
+    totals = {}
+    for tier, strength in plan.strengths():
+        count, total = totals.get(tier, (0, 0))
+        totals[tier] = (count + 1, total + strength)
+    summary = ", ".join(f"{count} in {tier} (strength {total / count:.1f})"
+                        for tier, (count, total) in sorted(totals.items(), key=lambda item: -STRENGTH_TIERS[item[0]]))
+    print(f"✅ Planned {len(plan)} rosters: {summary}")
+
+def next_planned_roster():
+    """Return the next planned roster's player attributes, or None without a strength plan (or once it is used up)"""
+    if TEAM_STRENGTH_PLAN is None:
+        return None
+    planned = next(TEAM_STRENGTH_PLAN, None)
+    return planned[1] if planned is not None else None
+
+def generate_tournament_data(teams, start_date=None, end_date=None, team_count=None):
+    """
+    Generate a random tournament payload matching the TournamentApiModel format
+
+    Args:
+        teams (list): IDs of the teams to pick participants from
+        start_date (str, optional): Start date in ISO format (YYYY-MM-DD)
+        end_date (str, optional): End date in ISO format (YYYY-MM-DD)
+        team_count (int, optional): Number of teams to include in the tournament
+
+    Returns the payload, or None if no valid teams could be selected
+    """
+    # Generate tournament data
+    name = generate_tournament_name()
+    tournament_start_date, tournament_end_date = generate_random_date_range(start_date, end_date)
+    
+    # Determine number of teams to include
+    max_teams = min(16, len(teams))
+    if team_count is not None and team_count > 0:
+        num_teams = min(team_count, len(teams))
+    else:
+        num_teams = random.randint(min(4, max_teams), max_teams)
+        
+    selected_teams = random.sample(teams, num_teams)
+    
+    # Create proper team objects for the API
+    valid_teams = []
+    for team_id in selected_teams:
+        if team_id is not None:
+            # Create the full team object expected by the API
+            api_team = {
+                "id": team_id,
+            }
+            valid_teams.append(api_team)
+    
+    if not valid_teams:
+        print("No valid team IDs found. Cannot create tournament.")
+        return None
+        
+    country = random.choice(COUNTRIES)
+    
+    # Create tournament payload matching the TournamentApiModel format
+    return {
+        "type": "SINGLE_GROUP",
+        "name": name,
+        "description": f"<strong>{name}</strong> is a premier esports tournament.",
+        "country": country,
+        "start_date": tournament_start_date,
+        "end_date": tournament_end_date,
+        "started": False,
+        "ended": False,
+        "teams": valid_teams
+    }
+
+def post_tournament(tournament_data, journal_key=None):
+    """
+    Create a single tournament, returning its new ID (or None on failure)
+
+    Args:
+        tournament_data (dict): Tournament payload
+        journal_key (str, optional): Key of the tournament in the run journal when it was already planned
+    """
+    try:
+        print(f"Creating tournament: {tournament_data['name']} in {tournament_data['country']} with {len(tournament_data['teams'])} teams")
+        print(f"Start: {tournament_data['start_date']}, End: {tournament_data['end_date']}")
+        if RUN_JOURNAL is not None and journal_key is None:
+            journal_key = RUN_JOURNAL.plan("tournaments", None, tournament_data)
+        response = get_api_client().post("tournaments", json=tournament_data)
+        
+        if response.status_code == 201:
+            tournament_id = response.json().get('id')
+            print(f"✅ Tournament created successfully with ID: {tournament_id}")
+            if RUN_JOURNAL is not None:
+                RUN_JOURNAL.ack("tournaments", journal_key, tournament_id)
+            return tournament_id
+        else:
+            print(f"❌ Failed to create tournament: {response.status_code}")
+            print(f"Response: {response.text}")
+    except Exception as e:
+        print(f"Error: {e}")
+    return None
+
+def create_tournament(count=1, start_date=None, end_date=None, team_count=None, registry=None, concurrency=None):
     """
     Create a random tournament using the API
     
@@ -627,83 +1473,151 @@ def create_tournament(count=1, start_date=None, end_date=None, team_count=None):
         start_date (str, optional): Start date in ISO format (YYYY-MM-DD)
         end_date (str, optional): End date in ISO format (YYYY-MM-DD)
         team_count (int, optional): Number of teams to include in the tournament
+        registry (UniquenessRegistry, optional): Shared registry of known teams (loaded from the API if omitted)
+        concurrency (int, optional): Number of tournaments created in parallel
     """
-    teams = fetch_teams()
+    # Only the team IDs are needed to build tournaments
+    if registry is None:
+        registry = load_registry(players=False)
+    teams = registry.team_ids
     
     if not teams:
         print("No teams found. Cannot create tournament.")
         return
     
+    if concurrency and concurrency > 1:
+        started = time.perf_counter()
+        payloads = (generate_tournament_data(teams, start_date, end_date, team_count) for _ in range(count))
+        tasks = (partial(post_tournament, data) for data in payloads if data is not None)
+        created = sum(1 for tournament_id in run_bounded(tasks, concurrency) if tournament_id is not None)
+        print_throughput({"tournaments": created}, time.perf_counter() - started)
+        return
+    
     for i in range(count):
-        # Generate tournament data
-        name = generate_tournament_name()
-        tournament_start_date, tournament_end_date = generate_random_date_range(start_date, end_date)
-        
-        # Determine number of teams to include
-        max_teams = min(16, len(teams))
-        if team_count is not None and team_count > 0:
-            num_teams = min(team_count, len(teams))
-        else:
-            num_teams = random.randint(4, max_teams)
-            
-        selected_teams = random.sample(teams, num_teams)
+        tournament_data = generate_tournament_data(teams, start_date, end_date, team_count)
+        if tournament_data is None:
+            continue
+        post_tournament(tournament_data)
+
+def plan_league(teams, tournament_count, region_count=4, team_count=None, overlap=0.0, start_date=None):
+    """
+    Precompute the tournaments of a league season in a single pass
+
+    Teams are split into disjoint regional pools. Each tournament belongs to a region
+    (round robin) and takes the regional teams that become free the earliest; with
+    `overlap`, each slot is instead filled from another region with that probability, so
+    pools overlap. A tournament starts the day after the latest of its teams' previous
+    tournaments ends, which keeps every team's date windows from overlapping.
+
+    Args:
+        teams (list): IDs of the teams taking part in the season
+        tournament_count (int): Number of tournaments in the season
+        region_count (int): Number of regions the teams are split into
+        team_count (int, optional): Teams per tournament (4-16 at random if omitted)
+        overlap (float): Probability (0-1) that a slot is filled by a team from another region
+        start_date (str, optional): Season start in ISO format (YYYY-MM-DD)
+
+    Returns the list of tournament payloads, in start date order per region
+    """
+    try:
+        season_start = datetime.fromisoformat(start_date) if start_date else None
+    except ValueError as e:
+        print(f"Error parsing dates: {e}")
+        print("Using random dates instead.")
+        season_start = None
+    if season_start is None:
+        season_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=30)
+    
+    team_ids = [team_id for team_id in teams if team_id is not None]
+    random.shuffle(team_ids)
+    region_count = max(1, min(region_count, len(team_ids) // 2))
+    regions = random.sample(REGIONS, region_count)
+    countries = {region: random.choice(COUNTRIES) for region in regions}
+    
+    # Per region, a heap of (day the team is free again, random tie-break, team ID)
+    pools = [[(0, random.random(), team_id) for team_id in team_ids[i::region_count]] for i in range(region_count)]
+    for pool in pools:
+        heapq.heapify(pool)
+    
+    tournaments = []
+    for index in range(tournament_count):
+        region_index = index % region_count
+        pool = pools[region_index]
+        size = team_count if team_count and team_count > 0 else random.randint(4, 16)
+        size = min(size, len(team_ids))
         
-        # Create proper team objects for the API
-        valid_teams = []
-        for team in selected_teams:
-            team_id = team.get("id")
-            if team_id is not None:
-                # Create the full team object expected by the API
-                api_team = {
-                    "id": team_id,
-                }
-                valid_teams.append(api_team)
+        # Take the teams free the earliest, borrowing from other regions for overlapping pools
+        # (or when the regional pool is too small)
+        picked = []
+        while len(picked) < size:
+            source = pool
+            if not pool or (region_count > 1 and random.random() < overlap):
+                source = random.choice([other for other in pools if other and other is not pool] or [pool])
+            picked.append((heapq.heappop(source), source))
         
-        if not valid_teams:
-            print("No valid team IDs found. Cannot create tournament.")
-            continue
-            
-        country = random.choice(COUNTRIES)
+        start_day = max(free_day for (free_day, _, _), _ in picked)
+        end_day = start_day + random.randint(3, 14)
+        for (_, _, team_id), source in picked:
+            heapq.heappush(source, (end_day + 1, random.random(), team_id))
         
-        # Create tournament payload matching the TournamentApiModel format
-        tournament_data = {
+        region = regions[region_index]
+        name = f"{region} {random.choice(TOURNAMENT_TYPES)} {season_start.year} Stage {index // region_count + 1}"
+        tournaments.append({
             "type": "SINGLE_GROUP",
             "name": name,
             "description": f"<strong>{name}</strong> is a premier esports tournament.",
-            "country": country,
-            "start_date": tournament_start_date,
-            "end_date": tournament_end_date,
+            "country": countries[region],
+            "start_date": (season_start + timedelta(days=start_day)).isoformat(),
+            "end_date": (season_start + timedelta(days=end_day)).isoformat(),
             "started": False,
             "ended": False,
-            "teams": valid_teams
-        }
-        
-        # Print the full payload for debugging
-        print(f"Tournament payload: {json.dumps(tournament_data, indent=2)}")
-        
-        try:
-            print(f"Creating tournament: {name} in {country} with {len(valid_teams)} teams")
-            print(f"Start: {tournament_start_date}, End: {tournament_end_date}")
-            response = requests.post(f"{API_BASE_URL}/tournaments", json=tournament_data, headers=get_auth_headers())
-            
-            if response.status_code == 201:
-                print(f"✅ Tournament created successfully with ID: {response.json().get('id')}")
-            else:
-                print(f"❌ Failed to create tournament: {response.status_code}")
-                print(f"Response: {response.text}")
-        except Exception as e:
-            print(f"Error: {e}")
+            "teams": [{"id": team_id} for (_, _, team_id), _ in picked],
+        })
+    
+    return tournaments
 
-def svg_to_png(svg_bytes):
+def create_league(count, region_count=4, team_count=None, overlap=0.0, start_date=None, registry=None,
+                  concurrency=None):
+    """
+    Create a league season of tournaments across regions
+
+    Args:
+        count (int): Number of tournaments in the season
+        region_count (int): Number of regions the teams are split into
+        team_count (int, optional): Teams per tournament (4-16 at random if omitted)
+        overlap (float): Probability (0-1) that a slot is filled by a team from another region
+        start_date (str, optional): Season start in ISO format (YYYY-MM-DD)
+        registry (UniquenessRegistry, optional): Shared registry of known teams (loaded from the API if omitted)
+        concurrency (int, optional): Number of tournaments created in parallel (defaults to HTTP_POOL_SIZE)
+    """
+    if registry is None:
+        registry = load_registry(players=False)
+    if len(registry.team_ids) < 2:
+        print("Not enough teams found. Cannot create a league.")
+        return
+    
+    tournaments = plan_league(registry.team_ids, count, region_count, team_count, overlap, start_date)
+    if tournaments:
+        print(f"Planned {len(tournaments)} tournaments for {len(registry.team_ids)} teams "
+              f"from {tournaments[0]['start_date'][:10]} to {max(t['end_date'] for t in tournaments)[:10]}")
+    
+    started = time.perf_counter()
+    tasks = (partial(post_tournament, data) for data in tournaments)
+    created = sum(1 for tournament_id in run_bounded(tasks, concurrency or HTTP_POOL_SIZE) if tournament_id is not None)
+    print_throughput({"tournaments": created}, time.perf_counter() - started)
+
+def svg_to_png(svg_bytes, indexed=None):
     """Convert SVG to PNG
     
     Uses cairosvg for high-quality SVG rendering.
     Falls back to a basic circular logo if cairosvg is not available.
+    The fallback emits an indexed-colour PNG when `indexed` is set (defaults to LOGO_INDEXED_PNG).
     
     Note: cairosvg requires the Cairo graphics library to be installed on your system.
     """
     # Try to use cairosvg
-    if CAIROSVG_AVAILABLE:
+    cairosvg = load_cairosvg()
+    if cairosvg is not None:
         try:
             # Render at 2x size for better quality then scale down if needed
             png_bytes = cairosvg.svg2png(bytestring=svg_bytes, output_width=128, output_height=128, scale=2.0)
@@ -726,326 +1640,2199 @@ def svg_to_png(svg_bytes):
             secondary_color = color_matches[1]
         elif len(color_matches) == 1:
             primary_color = color_matches[0]
-            
-        # Create a simple PNG with concentric circles
-        width, height = 128, 128
-        center_x, center_y = width // 2, height // 2
-        outer_radius = min(width, height) // 2 - 2
-        inner_radius = outer_radius * 0.7
-        
-        # Convert hex colors to RGB
-        def hex_to_rgb(hex_color):
-            h = hex_color.lstrip('#')
-            return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
-            
-        primary_rgb = hex_to_rgb(primary_color)
-        secondary_rgb = hex_to_rgb(secondary_color)
-        
-        # PNG header
-        png_data = bytearray([
-            0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A,  # PNG signature
-            0x00, 0x00, 0x00, 0x0D,  # IHDR chunk length
-            0x49, 0x48, 0x44, 0x52,  # "IHDR"
-            (width >> 24) & 0xFF, (width >> 16) & 0xFF, (width >> 8) & 0xFF, width & 0xFF,  # width
-            (height >> 24) & 0xFF, (height >> 16) & 0xFF, (height >> 8) & 0xFF, height & 0xFF,  # height
-            0x08,  # bit depth
-            0x06,  # color type (RGBA)
-            0x00,  # compression method
-            0x00,  # filter method
-            0x00,  # interlace method
-        ])
-        
-        # Calculate CRC for IHDR chunk
-        ihdr_crc = zlib.crc32(png_data[12:29]) & 0xFFFFFFFF
-        png_data.extend([(ihdr_crc >> 24) & 0xFF, (ihdr_crc >> 16) & 0xFF, (ihdr_crc >> 8) & 0xFF, ihdr_crc & 0xFF])
-        
-        # Create image data
-        raw_data = bytearray()
-        for y in range(height):
-            raw_data.append(0)  # Filter type for each scanline
-            for x in range(width):
-                # Calculate distance from center
-                dist = math.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
-                
-                if dist <= outer_radius:
-                    if dist <= inner_radius:
-                        # Inner circle - use primary color
-                        r, g, b = primary_rgb
-                    else:
-                        # Outer ring - use secondary color
-                        r, g, b = secondary_rgb
-                    raw_data.extend([r, g, b, 255])  # RGBA
-                else:
-                    # Transparent background
-                    raw_data.extend([0, 0, 0, 0])
         
-        # Compress image data
-        compressed_data = zlib.compress(raw_data)
-        
-        # IDAT chunk
-        png_data.extend([
-            (len(compressed_data) >> 24) & 0xFF, (len(compressed_data) >> 16) & 0xFF,
-            (len(compressed_data) >> 8) & 0xFF, len(compressed_data) & 0xFF
-        ])
-        png_data.extend([0x49, 0x44, 0x41, 0x54])  # "IDAT"
-        png_data.extend(compressed_data)
-        
-        # Calculate CRC for IDAT chunk
-        idat_crc = zlib.crc32(png_data[-len(compressed_data)-4:-len(compressed_data)]) & 0xFFFFFFFF
-        idat_crc = zlib.crc32(compressed_data, idat_crc) & 0xFFFFFFFF
-        png_data.extend([(idat_crc >> 24) & 0xFF, (idat_crc >> 16) & 0xFF, (idat_crc >> 8) & 0xFF, idat_crc & 0xFF])
-        
-        # IEND chunk
-        png_data.extend([
-            0x00, 0x00, 0x00, 0x00,  # length
-            0x49, 0x45, 0x4E, 0x44,  # "IEND"
-            0xAE, 0x42, 0x60, 0x82   # CRC
-        ])
-        
-        return bytes(png_data)
+        if indexed is None:
+            indexed = LOGO_INDEXED_PNG
+        return render_fallback_png(primary_color, secondary_color, indexed=indexed)
         
     except Exception as e:
         print(f"Error in PNG fallback: {e}")
         # Return minimal 1×1 transparent PNG as last resort
         return b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x00\x00\x02\x00\x01\xe5\'\xde\xfc\x00\x00\x00\x00IEND\xaeB`\x82'
 
-def fetch_players():
-    """Fetch all players from the API to check for existing nicknames"""
-    try:
-        response = requests.get(f"{API_BASE_URL}/players", headers=get_auth_headers())
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("items", [])
+# Size of the fallback logo and the pixel classes of its concentric circles
+FALLBACK_LOGO_SIZE = 128
+FALLBACK_TRANSPARENT, FALLBACK_INNER, FALLBACK_RING = 0, 1, 2
+
+def png_chunk(chunk_type, data):
+    """Build a PNG chunk: length, type, data and the CRC of type + data"""
+    crc = zlib.crc32(data, zlib.crc32(chunk_type)) & 0xFFFFFFFF
+    return len(data).to_bytes(4, "big") + chunk_type + data + crc.to_bytes(4, "big")
+
+@lru_cache(maxsize=None)
+def fallback_logo_mask():
+    """
+    Classify every pixel of the fallback logo as transparent, inner circle or outer ring
+
+    Computed once; returns one bytes object per row holding the pixel classes.
+    """
+    width, height = FALLBACK_LOGO_SIZE, FALLBACK_LOGO_SIZE
+    center_x, center_y = width // 2, height // 2
+    outer_radius = min(width, height) // 2 - 2
+    inner_radius = outer_radius * 0.7
+    
+    rows = []
+    for y in range(height):
+        row = bytearray(width)
+        for x in range(width):
+            # Calculate distance from center
+            dist = math.sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
+            if dist <= inner_radius:
+                row[x] = FALLBACK_INNER
+            elif dist <= outer_radius:
+                row[x] = FALLBACK_RING
+            else:
+                row[x] = FALLBACK_TRANSPARENT
+        rows.append(bytes(row))
+    return rows
+
+@lru_cache(maxsize=None)
+def fallback_logo_template(indexed=False):
+    """
+    Pre-built scanlines (filter byte included) for the fallback logo
+
+    For RGBA output every channel byte holds `1 + pixel_class * 4 + channel`, so a single
+    bytes.translate() with a 256-byte palette table produces the final image data. For
+    indexed output the scanlines already hold the palette indexes.
+    """
+    template = bytearray()
+    for row in fallback_logo_mask():
+        template.append(0)  # Filter type for each scanline
+        if indexed:
+            template.extend(row)
         else:
-            print(f"Error fetching players: {response.status_code}")
-            return []
-    except Exception as e:
-        print(f"Error: {e}")
-        return []
+            for pixel_class in row:
+                base = 1 + pixel_class * 4
+                template.extend((base, base + 1, base + 2, base + 3))
+    return bytes(template)
 
-def is_nickname_unique(nickname, existing_players):
-    """Check if a player nickname is unique"""
-    # Check if any existing player has this nickname
-    for player in existing_players:
-        if player.get("nickname") == nickname:
-            return False
-    return True
-
-def generate_unique_player_nickname(existing_players):
-    """Generate a unique player nickname, checking against existing ones"""
-    # Try up to 10 times to generate a unique nickname
-    for _ in range(10):
-        nickname = generate_player_nickname()
-        if is_nickname_unique(nickname, existing_players):
-            return nickname
-    
-    # If still not unique, add a random suffix
-    base_nickname = generate_player_nickname()
-    return f"{base_nickname}{random.randint(1000, 9999)}"
-
-def is_short_name_unique(short_name, existing_teams):
-    """Check if a team short name is unique"""
-    # Check if any existing team has this short name
-    for team in existing_teams:
-        if team.get("short_name") == short_name:
-            return False
-    return True
-
-def generate_truly_unique_short_name(base_name, existing_teams):
-    """Generate a truly unique short name by checking against existing teams"""
-    # Try up to 10 times with different suffixes
-    for _ in range(10):
-        short_name = generate_unique_short_name(base_name)
-        if is_short_name_unique(short_name, existing_teams):
-            return short_name
-    
-    # If still not unique, use a more robust approach with timestamp
-    timestamp = int(datetime.now().timestamp()) % 10000
-    short_name = f"{base_name.split()[-1]}{timestamp}"
-    return short_name
-
-def create_team_with_players(count=1, players_per_team=5):
-    """Create a random team with players using the API, with proactive unique name checking"""
-    # Fetch existing teams to check short name uniqueness
-    existing_teams = fetch_teams()
-    print(f"Fetched {len(existing_teams)} existing teams to ensure unique short names")
-    
-    # Fetch existing players to check nickname uniqueness
-    existing_players = fetch_players()
-    print(f"Fetched {len(existing_players)} existing players to ensure unique nicknames")
+def render_fallback_png(primary_color, secondary_color, indexed=False):
+    """
+    Render the fallback logo (inner circle in the primary color, outer ring in the secondary one)
+
+    The pixel layout is precomputed, so rendering is a palette substitution plus one zlib call.
+
+    Args:
+        primary_color (str): Hex color of the inner circle (e.g. "#FF0000")
+        secondary_color (str): Hex color of the outer ring
+        indexed (bool): Emit an indexed-colour PNG (PLTE + tRNS) instead of RGBA, which is much smaller
+    """
+    # Convert hex colors to RGB
+    def hex_to_rgb(hex_color):
+        h = hex_color.lstrip('#')
+        return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
     
-    for i in range(count):
-        # Generate team data with guaranteed unique short name
-        team_name = generate_team_name()
-        short_name = generate_truly_unique_short_name(team_name, existing_teams)
-        country = random.choice(COUNTRIES)
-        
-        # Generate a team logo as SVG
-        svg_logo_bytes = generate_team_logo()
-        
-        # Convert SVG to PNG (for backward compatibility)
-        logo_bytes = svg_to_png(svg_logo_bytes)
-        
-        try:
-            print(f"Creating team: {team_name} (short name: {short_name}) from {country}")
-            
-            # Create multipart form data
-            import uuid
-            boundary = str(uuid.uuid4())
-            
-            # Create multipart form data payload
-            form_data = bytearray()
-            
-            # Add team data fields
-            def add_text_field(name, value):
-                form_data.extend(f'--{boundary}\r\n'.encode('utf-8'))
-                form_data.extend(f'Content-Disposition: form-data; name="{name}"\r\n\r\n'.encode('utf-8'))
-                form_data.extend(f'{value}\r\n'.encode('utf-8'))
-            
-            # Add text fields
-            add_text_field("short_name", short_name)
-            add_text_field("full_name", team_name)
-            add_text_field("description", f'<strong>{team_name}</strong> is a professional esports organization.')
-            add_text_field("country", country)
+    primary_rgb = hex_to_rgb(primary_color)
+    secondary_rgb = hex_to_rgb(secondary_color)
+    width, height = FALLBACK_LOGO_SIZE, FALLBACK_LOGO_SIZE
+    
+    # Palette ordered by pixel class: transparent background, inner circle, outer ring
+    palette = [(0, 0, 0, 0), (*primary_rgb, 255), (*secondary_rgb, 255)]
+    
+    if indexed:
+        raw_data = fallback_logo_template(indexed=True)
+        color_type = 3
+        extra_chunks = (
+            png_chunk(b"PLTE", bytes(channel for rgba in palette for channel in rgba[:3])) +
+            png_chunk(b"tRNS", bytes(rgba[3] for rgba in palette))
+        )
+    else:
+        table = bytearray(256)
+        for pixel_class, rgba in enumerate(palette):
+            table[1 + pixel_class * 4:5 + pixel_class * 4] = bytes(rgba)
+        raw_data = fallback_logo_template().translate(table)
+        color_type = 6
+        extra_chunks = b""
+    
+    # bit depth 8, compression, filter and interlace methods 0
+    ihdr = width.to_bytes(4, "big") + height.to_bytes(4, "big") + bytes([8, color_type, 0, 0, 0])
+    
+    return b"".join((
+        b"\x89PNG\r\n\x1a\n",  # PNG signature
+        png_chunk(b"IHDR", ihdr),
+        extra_chunks,
+        png_chunk(b"IDAT", zlib.compress(raw_data)),
+        png_chunk(b"IEND", b""),
+    ))
+
+def logo_cache_key(svg_bytes):
+    """Content address of a rendered logo: the colored SVG plus the renderer that produced the PNG"""
+    if cairosvg_available():
+        renderer = b"cairosvg"
+    else:
+        renderer = b"fallback-indexed" if LOGO_INDEXED_PNG else b"fallback"
+    return hashlib.sha256(renderer + b"\0" + svg_bytes).hexdigest()
+
+def logo_cache_path(svg_bytes):
+    """Location of a logo in the on-disk cache, or None when the disk cache is disabled"""
+    if not LOGO_CACHE_DIR:
+        return None
+    key = logo_cache_key(svg_bytes)
+    return os.path.join(LOGO_CACHE_DIR, key[:2], f"{key}.png")
+
+def lookup_logo(svg_bytes):
+    """Return a previously rendered logo from the in-process LRU or the disk cache, or None"""
+    png_bytes = LOGO_MEMORY_CACHE.get(svg_bytes)
+    if png_bytes is not None:
+        LOGO_MEMORY_CACHE.move_to_end(svg_bytes)
+        LOGO_CACHE_STATS["memory_hits"] += 1
+        return png_bytes
+    
+    cache_path = logo_cache_path(svg_bytes)
+    if cache_path:
+        try:
+            with open(cache_path, "rb") as cached:
+                png_bytes = cached.read()
+        except OSError:
+            return None
+        LOGO_CACHE_STATS["disk_hits"] += 1
+        store_logo(svg_bytes, png_bytes, persist=False)
+        return png_bytes
+    return None
+
+def store_logo(svg_bytes, png_bytes, persist=True):
+    """Add a rendered logo to the in-process LRU and (optionally) the disk cache"""
+    LOGO_MEMORY_CACHE[svg_bytes] = png_bytes
+    if len(LOGO_MEMORY_CACHE) > LOGO_CACHE_SIZE:
+        LOGO_MEMORY_CACHE.popitem(last=False)
+    
+    cache_path = logo_cache_path(svg_bytes) if persist else None
+    if cache_path:
+        try:
+            # Write to a temporary file first so concurrent runs never read a partial logo
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as cached:
+                cached.write(png_bytes)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: could not write logo cache entry: {e}")
+
+def render_team_logo(svg_bytes):
+    """
+    Convert an SVG logo to PNG, rendering each distinct logo at most once
+
+    Results are memoized in an in-process LRU in front of an on-disk store under
+    LOGO_CACHE_DIR that persists between runs (disabled when LOGO_CACHE_DIR is None).
+    """
+    png_bytes = lookup_logo(svg_bytes)
+    if png_bytes is None:
+        png_bytes = svg_to_png(svg_bytes)
+        LOGO_CACHE_STATS["renders"] += 1
+        store_logo(svg_bytes, png_bytes)
+    return png_bytes
+
+def print_logo_cache_stats():
+    """Print how many logos were rendered and how many were served from the memory and disk caches"""
+    renders = LOGO_CACHE_STATS["renders"]
+    memory_hits = LOGO_CACHE_STATS["memory_hits"]
+    disk_hits = LOGO_CACHE_STATS["disk_hits"]
+    if renders + memory_hits + disk_hits:
+        print(f"Logos: {renders} rendered, {memory_hits} from memory, {disk_hits} from the disk cache")
+
+def iter_players(workers=None):
+    """Lazily iterate over all players in the API"""
+    return iter_collection("players", workers=workers)
+
+class NameSpace:
+    """
+    Indexed space of names built from component lists, walked in a seeded pseudo-random order
+
+    Every index in [0, size) is decoded in mixed radix into one index per component list
+    and passed to `build`. The walk is the affine permutation (offset + i * stride) mod size
+    with a random stride coprime to size, so each name is produced exactly once, in O(1)
+    and without storing the order.
+
+    Args:
+        sizes (list): Number of choices for each component
+        build (callable): Builds the name from one index per component
+        weight (float): Relative probability of drawing from this space
+        rng (random.Random): Generator used to pick the permutation
+    """
+
+    def __init__(self, sizes, build, weight, rng):
+        self.sizes = sizes
+        self.size = math.prod(sizes)
+        self.build = build
+        self.weight = weight
+        self.position = 0
+        self.offset = rng.randrange(self.size)
+        self.stride = 1
+        if self.size > 2:
+            self.stride = rng.randrange(1, self.size)
+            while math.gcd(self.stride, self.size) != 1:
+                self.stride = rng.randrange(1, self.size)
+
+    def next(self):
+        """Return the next name of the walk, or None once the space is exhausted"""
+        if self.position >= self.size:
+            return None
+        index = (self.offset + self.position * self.stride) % self.size
+        self.position += 1
+        
+        digits = []
+        for size in reversed(self.sizes):
+            index, digit = divmod(index, size)
+            digits.append(digit)
+        return self.build(*reversed(digits))
+
+def other_index(first, second):
+    """Map an index into a list with `first` removed back onto the full list"""
+    return second + (second >= first)
+
+class UniqueNameAllocator:
+    """
+    Hands out names that are not in `taken`, without random retries
+
+    Each call draws one of the name spaces (weighted like the random generators) and takes
+    the next name of its walk. Names already taken (existing entities, or the same string
+    produced by another space) are skipped and every allocated name is added to `taken`
+    (a KeySet, whose add() reports whether the name was free).
+    Only once every space is exhausted does it fall back to `fallback(rng, counter)`,
+    which appends a numeric suffix.
+    """
+
+    def __init__(self, spaces, taken, fallback, rng):
+        self.spaces = spaces
+        self.taken = taken
+        self.fallback = fallback
+        self.rng = rng
+        self.overflow = 0
+        self.lock = threading.Lock()
+
+    def allocate(self):
+        """Return a new unique name and reserve it"""
+        with self.lock:
+            while self.spaces:
+                space = self.rng.choices(self.spaces, weights=[space.weight for space in self.spaces])[0]
+                name = space.next()
+                if name is None:
+                    self.spaces.remove(space)
+                elif self.taken.add(name):
+                    return name
             
-            # Add logo file with proper headers for binary data
-            form_data.extend(f'--{boundary}\r\n'.encode('utf-8'))
-            form_data.extend(f'Content-Disposition: form-data; name="logo_image_file"; filename="logo.png"\r\n'.encode('utf-8'))
-            form_data.extend(f'Content-Type: image/png\r\n\r\n'.encode('utf-8'))
+            while True:
+                self.overflow += 1
+                name = self.fallback(self.rng, self.overflow)
+                if self.taken.add(name):
+                    return name
+
+def team_name_allocator(taken):
+    """Allocator over every team name generate_team_name can produce, with or without a prefix"""
+    rng = random.Random(random.getrandbits(64))
+    prefixes = [prefix for prefix in dict.fromkeys(TEAM_PREFIXES) if prefix]
+    adjectives = list(dict.fromkeys(TEAM_ADJECTIVES))
+    nouns = list(dict.fromkeys(TEAM_NOUNS))
+    adjective_count, noun_count = len(adjectives), len(nouns)
+    
+    # The five name shapes of generate_team_name, as (component sizes, builder)
+    patterns = [
+        ([noun_count], lambda n: nouns[n]),
+        ([adjective_count, noun_count], lambda a, n: f"{adjectives[a]} {nouns[n]}"),
+        ([noun_count, noun_count - 1], lambda n1, n2: f"{nouns[n1]} {nouns[other_index(n1, n2)]}"),
+        ([adjective_count, adjective_count - 1, noun_count],
+         lambda a1, a2, n: f"{adjectives[a1]} {adjectives[other_index(a1, a2)]} {nouns[n]}"),
+        ([adjective_count, noun_count, noun_count - 1],
+         lambda a, n1, n2: f"{adjectives[a]} {nouns[n1]} {nouns[other_index(n1, n2)]}"),
+    ]
+    
+    spaces = []
+    for sizes, build in patterns:
+        spaces.append(NameSpace(sizes, build, 0.3, rng))
+        spaces.append(NameSpace([len(prefixes)] + sizes,
+                                lambda p, *rest, build=build: f"{prefixes[p]} {build(*rest)}", 0.7, rng))
+    
+    return UniqueNameAllocator(spaces, taken, lambda rng, counter: f"{rng.choice(adjectives)} {rng.choice(nouns)} {counter}", rng)
+
+def leet_variants(nickname):
+    """Every distinct spelling of a nickname with at least one letter substitution applied"""
+    substitutions = [(old, new) for old, new in LEET_SUBSTITUTIONS if old in nickname.lower()]
+    variants = []
+    for mask in range(1, 2 ** len(substitutions)):
+        variant = nickname
+        for bit, (old, new) in enumerate(substitutions):
+            if mask & (1 << bit):
+                variant = variant.replace(old, new).replace(old.upper(), new)
+        if variant != nickname:
+            variants.append(variant)
+    return variants
+
+def nickname_allocator(taken):
+    """Allocator over every nickname generate_player_nickname can produce"""
+    rng = random.Random(random.getrandbits(64))
+    nicknames = list(dict.fromkeys(NICKNAMES))
+    count = len(nicknames)
+    variants = list(dict.fromkeys(variant for nickname in nicknames for variant in leet_variants(nickname)))
+    
+    spaces = [
+        NameSpace([count], lambda n: nicknames[n], 1, rng),
+        NameSpace([count, 99], lambda n, number: f"{nicknames[n]}{number + 1}", 1, rng),
+        NameSpace([len(NICKNAME_PREFIXES), count, len(NICKNAME_SUFFIXES)],
+                  lambda p, n, x: f"{NICKNAME_PREFIXES[p]}{nicknames[n]}{NICKNAME_SUFFIXES[x]}", 1, rng),
+        NameSpace([count, count - 1], lambda n1, n2: f"{nicknames[n1]}{nicknames[other_index(n1, n2)]}", 1, rng),
+        NameSpace([len(variants)], lambda v: variants[v], 1, rng),
+    ]
+    
+    # Numbers past the 1-99 range of the numbered pattern
+    return UniqueNameAllocator(spaces, taken, lambda rng, counter: f"{rng.choice(nicknames)}{99 + counter}", rng)
+
+def short_name_allocator(base, taken):
+    """Allocator over the short names of a team name's last word with a 1-999 suffix"""
+    rng = random.Random(random.getrandbits(64))
+    spaces = [NameSpace([999], lambda number: f"{base}{number + 1}", 1, rng)]
+    return UniqueNameAllocator(spaces, taken, lambda rng, counter: f"{base}{999 + counter}", rng)
+
+class KeySet:
+    """
+    Compact set of keys, kept as 64-bit fingerprints in an open-addressing array('Q')
+
+    Only the hash of each key is stored (8 bytes per slot, at most KEY_SET_MAX_LOAD full),
+    instead of the key object and a set entry, so millions of names fit in a few tens of MB.
+    Two keys sharing a fingerprint make the second look taken, which only ever costs a
+    uniqueness check a skipped name. Fingerprints come from hash(), so a KeySet is only
+    meaningful inside the process that built it.
+    """
+    __slots__ = ("slots", "count", "lock")
+
+    def __init__(self, keys=()):
+        self.slots = array("Q", bytes(8 * KEY_SET_MIN_SLOTS))
+        self.count = 0
+        self.lock = threading.Lock()
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, key):
+        # 0 marks an empty slot
+        fingerprint = (hash(key) & 0xFFFFFFFFFFFFFFFF) or 1
+        slots = self.slots
+        mask = len(slots) - 1
+        index = fingerprint & mask
+        while True:
+            current = slots[index]
+            if current == fingerprint:
+                return True
+            if not current:
+                return False
+            index = (index + 1) & mask
+
+    def add(self, key):
+        """Add a key, returning False if it (or a key with the same fingerprint) was already present"""
+        fingerprint = (hash(key) & 0xFFFFFFFFFFFFFFFF) or 1
+        with self.lock:
+            slots = self.slots
+            mask = len(slots) - 1
+            index = fingerprint & mask
+            while True:
+                current = slots[index]
+                if current == fingerprint:
+                    return False
+                if not current:
+                    break
+                index = (index + 1) & mask
+            slots[index] = fingerprint
+            self.count += 1
+            if self.count > len(slots) * KEY_SET_MAX_LOAD:
+                self.resize(len(slots) * 2)
+            return True
+
+    def resize(self, size):
+        slots = array("Q", bytes(8 * size))
+        mask = size - 1
+        for fingerprint in self.slots:
+            if fingerprint:
+                index = fingerprint & mask
+                while slots[index]:
+                    index = (index + 1) & mask
+                slots[index] = fingerprint
+        self.slots = slots
+
+    def nbytes(self):
+        """Memory held by the fingerprint table"""
+        return self.slots.itemsize * len(self.slots)
+
+class StringTable:
+    """
+    Append-only list of strings packed into one UTF-8 buffer
+
+    Each entry costs its encoded length plus an 8-byte offset, instead of a str object
+    and a list slot. Entries are decoded when they are read.
+    """
+    __slots__ = ("data", "offsets")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array("Q", [0])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def append(self, value):
+        self.data += (value or "").encode("utf-8")
+        self.offsets.append(len(self.data))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode("utf-8") or None
+
+    def nbytes(self):
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+class UniquenessRegistry:
+    """
+    Compact index of taken player nicknames and team short names
+
+    One registry is shared by all creation functions of a run and updated in place
+    as entities are created, so uniqueness checks are constant time and no list of
+    full payloads has to be kept or copied around. Names are kept as KeySet fingerprints,
+    so only these uniqueness keys stay resident however many entities a run creates.
+    It also remembers the IDs and names of known teams (in an array and a StringTable)
+    so players and tournaments can be assigned to them. New names are handed out by
+    allocators that walk the name spaces and skip the names recorded here.
+    """
+
+    def __init__(self):
+        self.nicknames = KeySet()
+        self.short_names = KeySet()
+        self.full_names = KeySet()
+        self.team_ids = array("q")
+        self.team_names = StringTable()
+        self.known_team_ids = KeySet()
+        self.allocators = {}
+
+    def add_team(self, team_id, short_name, full_name=None):
+        """Record a team (existing or newly created)"""
+        if short_name:
+            self.short_names.add(short_name)
+        if full_name:
+            self.full_names.add(full_name)
+        if team_id is not None and team_id not in self.known_team_ids:
+            self.known_team_ids.add(team_id)
+            self.team_ids.append(team_id)
+            self.team_names.append(full_name)
+
+    def random_team(self):
+        """Return the (id, full name) of a random known team"""
+        index = random.randrange(len(self.team_ids))
+        return self.team_ids[index], self.team_names[index]
+
+    def nbytes(self):
+        """Memory held by the registry's names and team IDs"""
+        return (self.nicknames.nbytes() + self.short_names.nbytes() + self.full_names.nbytes()
+                + self.known_team_ids.nbytes() + self.team_names.nbytes()
+                + self.team_ids.itemsize * len(self.team_ids))
+
+    def add_player(self, nickname):
+        """Record a player nickname (existing or newly created)"""
+        if nickname:
+            self.nicknames.add(nickname)
+
+    def allocator(self, key, create):
+        """Return the allocator stored under `key`, creating it on first use"""
+        allocator = self.allocators.get(key)
+        if allocator is None:
+            allocator = self.allocators[key] = create()
+        return allocator
+
+    def allocate_nickname(self):
+        """Reserve and return a nickname no player has"""
+        return self.allocator("nickname", lambda: nickname_allocator(self.nicknames)).allocate()
+
+    def allocate_team_name(self):
+        """Reserve and return a team name no team has"""
+        return self.allocator("team_name", lambda: team_name_allocator(self.full_names)).allocate()
+
+    def allocate_short_name(self, team_name):
+        """Reserve and return a short name (last word of the team name plus a number) no team has"""
+        base = team_name.split()[-1]
+        return self.allocator(("short_name", base), lambda: short_name_allocator(base, self.short_names)).allocate()
+
+    def load_teams(self):
+        """Stream all existing teams from the API into the registry"""
+        for team in iter_teams():
+            self.add_team(team.get("id"), team.get("short_name"), team.get("full_name"))
+        print(f"Fetched {len(self.team_ids)} existing teams to ensure unique short names")
+
+    def load_players(self):
+        """Stream all existing players from the API into the registry"""
+        for player in iter_players():
+            self.add_player(player.get("nickname"))
+        print(f"Fetched {len(self.nicknames)} existing players to ensure unique nicknames")
+
+def load_registry(teams=True, players=True):
+    """Create a UniquenessRegistry populated from the API"""
+    registry = UniquenessRegistry()
+    if teams:
+        registry.load_teams()
+    if players:
+        registry.load_players()
+    return registry
+
+def generate_unique_player_nickname(registry):
+    """Generate a player nickname guaranteed not to be taken yet (and reserve it in the registry)"""
+    return registry.allocate_nickname()
+
+def generate_truly_unique_short_name(base_name, registry):
+    """Generate a short name guaranteed not to be taken yet (and reserve it in the registry)"""
+    return registry.allocate_short_name(base_name)
+
+def generate_team_fields(registry):
+    """
+    Generate a team payload with a unique short name, along with its SVG logo
+
+    Returns a tuple of (team_data, svg_logo_bytes)
+    """
+    # Generate team data with a guaranteed unique name and short name
+    team_name = registry.allocate_team_name()
+    short_name = generate_truly_unique_short_name(team_name, registry)
+    country = random.choice(COUNTRIES)
+    
+    # Generate a team logo as SVG
+    svg_logo_bytes = generate_team_logo()
+    
+    team_data = {
+        "short_name": short_name,
+        "full_name": team_name,
+        "description": f'<strong>{team_name}</strong> is a professional esports organization.',
+        "country": country,
+    }
+    return team_data, svg_logo_bytes
+
+def generate_team_data(registry):
+    """
+    Generate a team payload with a unique short name, along with its PNG logo
+
+    Returns a tuple of (team_data, logo_bytes)
+    """
+    team_data, svg_logo_bytes = generate_team_fields(registry)
+    
+    # Convert SVG to PNG (for backward compatibility), reusing previously rendered logos
+    return team_data, render_team_logo(svg_logo_bytes)
+
+def iter_generated_teams(registry, count, render_workers=None):
+    """
+    Lazily generate `count` teams as (team_data, logo_bytes) tuples
+
+    With more than one render worker, logos are rasterized in a process pool ahead of
+    the consumer (a window of a few teams per worker), so CPU-bound rendering overlaps
+    with the API calls made for earlier teams. Logos already in the cache, or already
+    being rendered for an earlier team, are never submitted twice. Short names are
+    reserved in the registry by its allocator as soon as a team is generated.
+
+    Args:
+        registry (UniquenessRegistry): Shared registry of taken names
+        count (int): Number of teams to generate
+        render_workers (int, optional): Number of logo rendering processes
+    """
+    if not render_workers or render_workers < 2:
+        for _ in range(count):
+            yield generate_team_data(registry)
+        return
+    
+    # Importing the process pool pulls in multiprocessing, so only do it when rendering in parallel
+    from concurrent.futures import ProcessPoolExecutor
+    
+    lookahead = render_workers * 4
+    pending = deque()
+    in_flight = {}
+    generated = 0
+    
+    with ProcessPoolExecutor(max_workers=render_workers) as executor:
+        while generated < count or pending:
+            # Keep the render pool busy with the logos of upcoming teams
+            while generated < count and len(pending) < lookahead:
+                team_data, svg_logo_bytes = generate_team_fields(registry)
+                logo = lookup_logo(svg_logo_bytes)
+                if logo is None:
+                    logo = in_flight.get(svg_logo_bytes)
+                    if logo is None:
+                        logo = executor.submit(svg_to_png, svg_logo_bytes, LOGO_INDEXED_PNG)
+                        in_flight[svg_logo_bytes] = logo
+                pending.append((team_data, svg_logo_bytes, logo))
+                generated += 1
             
-            # Add binary file data
-            form_data.extend(logo_bytes)
+            team_data, svg_logo_bytes, logo = pending.popleft()
+            if isinstance(logo, Future):
+                future = logo
+                logo = future.result()
+                if in_flight.get(svg_logo_bytes) is future:
+                    del in_flight[svg_logo_bytes]
+                    LOGO_CACHE_STATS["renders"] += 1
+                    store_logo(svg_logo_bytes, logo)
+            yield team_data, logo
+
+@lru_cache(maxsize=None)
+def multipart_part_header(boundary, name, filename=None, content_type=None):
+    """Encoded delimiter and headers of a multipart part, built once per field"""
+    header = f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"'
+    if filename:
+        header += f'; filename="{filename}"'
+    header += "\r\n"
+    if content_type:
+        header += f"Content-Type: {content_type}\r\n"
+    return (header + "\r\n").encode("utf-8")
+
+class MultipartEncoder:
+    """
+    multipart/form-data request body that streams its parts instead of concatenating them
+
+    Text fields and the cached part headers are joined into small runs of bytes, while file
+    contents are kept as memoryviews of the caller's buffers and sent as they are, so an
+    upload never copies its file data. The body has an exact length (requests sends it as
+    Content-Length) and can be iterated again if the request is retried.
+
+    Args:
+        fields (dict): Text fields, in order
+        files (list, optional): (name, filename, content_type, data) tuples
+        boundary (str, optional): Multipart boundary (defaults to MULTIPART_BOUNDARY)
+    """
+
+    def __init__(self, fields, files=(), boundary=None):
+        boundary = boundary or MULTIPART_BOUNDARY
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.parts = []
+        
+        pending = []
+        for name, value in fields.items():
+            pending += (multipart_part_header(boundary, name), str(value).encode("utf-8"), b"\r\n")
+        for name, filename, content_type, data in files:
+            pending.append(multipart_part_header(boundary, name, filename, content_type))
+            self.parts.append(b"".join(pending))
+            self.parts.append(memoryview(data).cast("B"))
+            pending = [b"\r\n"]
+        pending.append(f"--{boundary}--\r\n".encode("utf-8"))
+        self.parts.append(b"".join(pending))
+        
+        self.length = sum(len(part) for part in self.parts)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.parts)
+
+def post_team(team_data, logo_bytes):
+    """Create a single team through the multipart endpoint, returning its new ID (or None on failure)"""
+    try:
+        body = MultipartEncoder(
+            {field: team_data[field] for field in ("short_name", "full_name", "description", "country")},
+            [("logo_image_file", "logo.png", "image/png", logo_bytes)],
+        )
+        
+        if RUN_JOURNAL is not None:
+            RUN_JOURNAL.plan("teams", team_data["short_name"], team_data)
+        
+        # The shared client adds the authorization header
+        team_response = get_api_client().post("teams", data=body, headers={"Content-Type": body.content_type})
+        
+        if team_response.status_code == 201:
+            team_id = team_response.json().get("id")
+            print(f"✅ Team created successfully with ID: {team_id}")
+            if RUN_JOURNAL is not None:
+                RUN_JOURNAL.ack("teams", team_data["short_name"], team_id)
+            return team_id
+        else:
+            print(f"❌ Failed to create team: {team_response.status_code}")
+            print(f"Response: {team_response.text}")
+    except Exception as e:
+        print(f"Error: {e}")
+    return None
+
+def generate_player_data(registry, team_id=None, country=None, attributes=None):
+    """
+    Generate a player payload with a unique nickname
+
+    Args:
+        registry (UniquenessRegistry): Registry used for nickname checks and random team assignment
+        team_id (int, optional): Team to assign the player to (a random known team if omitted)
+        country (str, optional): Player country (random if omitted)
+        attributes (dict, optional): Player attributes (random if omitted)
+
+    Returns a tuple of (player_data, team_name), where team_name is only set for random assignments
+    """
+    # Generate player data with guaranteed unique nickname
+    first_name = random.choice(FIRST_NAMES)
+    last_name = random.choice(LAST_NAMES)
+    nickname = generate_unique_player_nickname(registry)
+    role = random.choice(PLAYER_ROLES)
+    age = random.randint(18, 35)
+    
+    # Use provided country or pick random one
+    player_country = country if country else random.choice(COUNTRIES)
+    
+    # If team_id wasn't provided, assign to a random team
+    player_team_id = team_id
+    team_name = None
+    
+    if player_team_id is None:
+        player_team_id, team_name = registry.random_team()
+    
+    player_data = {
+        "nickname": nickname,
+        "full_name": f"{first_name} {last_name}",
+        "age": age,
+        "country": player_country,
+        "team_id": player_team_id,
+        "role": role,
+        "player_attributes": attributes or next_player_attributes()
+    }
+    return player_data, team_name
+
+def generate_team_players(registry, team_id, players_per_team):
+    """
+    Generate the players of a new team, reserving their nicknames in the registry
+
+    Nationalities are spread with distribute_nationalities, and the attributes come from the
+    strength plan when one is active (see plan_team_strengths).
+    """
+    nationalities = distribute_nationalities(players_per_team)
+    roster = next_planned_roster() or [None] * players_per_team
+    players = []
+    for country, attributes in zip(nationalities, roster):
+        player_data, _ = generate_player_data(registry, team_id, country, attributes)
+        players.append(player_data)
+    return players
+
+def post_player(player_data, display_team_info=True):
+    """Create a single player, returning its new ID (or None on failure)"""
+    nickname = player_data["nickname"]
+    role = player_data["role"]
+    try:
+        if RUN_JOURNAL is not None:
+            RUN_JOURNAL.plan("players", nickname, player_data)
+        player_response = get_api_client().post("players", json=player_data)
+        
+        if player_response.status_code == 201:
+            player_id = player_response.json().get("id")
+            if RUN_JOURNAL is not None:
+                RUN_JOURNAL.ack("players", nickname, player_id)
+            if display_team_info:
+                print(f"✅ Player created successfully with ID: {player_id}")
+            else:
+                print(f"  ✅ Player created: {nickname} ({role})")
+            return player_id
+        else:
+            if display_team_info:
+                print(f"❌ Failed to create player: {player_response.status_code}")
+            else:
+                print(f"  ❌ Failed to create player {nickname}: {player_response.status_code}")
+            print(f"Response: {player_response.text}")
+    except Exception as e:
+        print(f"Error: {e}")
+    return None
+
+def post_bulk(endpoint, payloads, key):
+    """
+    Submit a chunk of payloads to a bulk endpoint (e.g. /players/bulk)
+
+    Args:
+        endpoint (str): Collection path relative to the API base URL (e.g. "players")
+        payloads (list): Payloads to create
+        key (str): Unique field used to map the returned entities back to the payloads
+
+    A failed bulk call may still have been committed (a gateway error or timeout after the
+    insert), so the collection is then searched for the chunk's keys: entities found there are
+    acknowledged, instead of failing their per-item fallback on the unique constraint.
+
+    Returns a dict mapping the `key` of every acknowledged payload to its new ID
+    """
+    ids = {}
+    try:
+        if RUN_JOURNAL is not None:
+            for payload in payloads:
+                RUN_JOURNAL.plan(endpoint, payload[key], payload)
+        
+        # Bulk inserts are retried on transient failures (but not on a 500, see RETRY_WRITE_STATUS_CODES)
+        response = get_api_client().post(f"{endpoint}/bulk", json=payloads, retry=True)
+        if response.status_code == 201:
+            ids = {item.get(key): item.get("id") for item in response.json() if item.get("id") is not None}
+        else:
+            print(f"❌ Failed to bulk create {len(payloads)} {endpoint}: {response.status_code}")
+            print(f"Response: {response.text}")
+    except Exception as e:
+        print(f"Error: {e}")
+    
+    if not ids:
+        keys = {payload[key] for payload in payloads}
+        ids = {item[key]: item["id"] for item in iter_collection(endpoint) if item.get(key) in keys}
+        if ids:
+            print(f"✅ Found {len(ids)}/{len(payloads)} {endpoint} of the failed bulk request already created")
+    if RUN_JOURNAL is not None:
+        for item_key, item_id in ids.items():
+            RUN_JOURNAL.ack(endpoint, item_key, item_id)
+    return ids
+
+def create_players_in_bulk(players):
+    """
+    Create a chunk of players through /players/bulk
+
+    The returned IDs are written back into the player payloads. Players that were not
+    acknowledged by the bulk request are retried one by one.
+
+    Returns the list of players that were created
+    """
+    print(f"Creating {len(players)} players in bulk")
+    ids = post_bulk("players", players, "nickname")
+    
+    created_players = []
+    for player_data in players:
+        player_id = ids.get(player_data["nickname"])
+        if player_id is None:
+            player_id = post_player(player_data, display_team_info=False)
+        if player_id is not None:
+            player_data["id"] = player_id
+            created_players.append(player_data)
+    
+    print(f"✅ {len(created_players)}/{len(players)} players created ({len(ids)} in bulk)")
+    return created_players
+
+def create_teams_in_bulk(teams):
+    """
+    Create a chunk of teams through /teams/bulk
+
+    Logos are sent as base64 data URLs. The returned IDs are written back into the team
+    payloads, and teams that were not acknowledged by the bulk request are retried one by
+    one through the multipart endpoint.
+
+    Args:
+        teams (list): (team_data, logo_bytes) tuples as returned by generate_team_data()
+
+    Returns the list of team payloads that were created
+    """
+    print(f"Creating {len(teams)} teams in bulk")
+    payloads = [
+        {**team_data, "logo_image_file": f"data:image/png;base64,{base64.b64encode(logo_bytes).decode('ascii')}"}
+        for team_data, logo_bytes in teams
+    ]
+    ids = post_bulk("teams", payloads, "short_name")
+    
+    created_teams = []
+    for team_data, logo_bytes in teams:
+        team_id = ids.get(team_data["short_name"])
+        if team_id is None:
+            print(f"Creating team: {team_data['full_name']} (short name: {team_data['short_name']}) from {team_data['country']}")
+            team_id = post_team(team_data, logo_bytes)
+        if team_id is not None:
+            team_data["id"] = team_id
+            created_teams.append(team_data)
+    
+    print(f"✅ {len(created_teams)}/{len(teams)} teams created ({len(ids)} in bulk)")
+    return created_teams
+
+def create_teams(teams, bulk=False):
+    """
+    Create a chunk of generated teams, either through /teams/bulk or one request per team
+
+    Args:
+        teams (list): (team_data, logo_bytes) tuples as returned by generate_team_data()
+        bulk (bool): Whether to use the bulk endpoint
+
+    Returns the list of team payloads that were created
+    """
+    if bulk:
+        return create_teams_in_bulk(teams)
+    
+    created_teams = []
+    for team_data, logo_bytes in teams:
+        print(f"Creating team: {team_data['full_name']} (short name: {team_data['short_name']}) from {team_data['country']}")
+        team_id = post_team(team_data, logo_bytes)
+        if team_id is not None:
+            team_data["id"] = team_id
+            created_teams.append(team_data)
+    return created_teams
+
+def create_players(players, bulk=False):
+    """
+    Create a chunk of generated players, either through /players/bulk or one request per player
+
+    Returns the list of players that were created
+    """
+    if bulk:
+        return create_players_in_bulk(players)
+    
+    created_players = []
+    for player_data in players:
+        print(f"Creating player: {player_data['nickname']} ({player_data['role']}) from {player_data['country']}")
+        player_id = post_player(player_data, display_team_info=False)
+        if player_id is not None:
+            player_data["id"] = player_id
+            created_players.append(player_data)
+    return created_players
+
+def run_bounded(tasks, concurrency):
+    """
+    Run callables on a thread pool, yielding their results as they complete
+
+    The `tasks` iterable is consumed lazily on the calling thread and at most
+    2 * concurrency tasks are in flight at any time.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        in_flight = set()
+        for task in tasks:
+            in_flight.add(executor.submit(task))
+            if len(in_flight) >= concurrency * 2:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in as_completed(in_flight):
+            yield future.result()
+
+def print_throughput(counts, elapsed, action="Created"):
+    """Print how many entities of each kind were processed and the achieved entities/second"""
+    total = sum(counts.values())
+    summary = ", ".join(f"{created} {kind}" for kind, created in counts.items())
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"⏱  {action} {summary} in {elapsed:.2f}s ({rate:.1f} entities/s)")
+
+def run_creation_pipeline(team_count, players_per_team, registry, concurrency, batch_size=None,
+                          tournament_count=0, tournament_team_count=None, start_date=None, end_date=None,
+                          render_workers=None):
+    """
+    Create teams, their players and optionally tournaments with bounded parallelism
+
+    API calls run on a thread pool while payload generation and registry updates stay on
+    the calling thread. Every acknowledged team immediately feeds the creation of its
+    players, so players never reference a team that has not been created yet, and each
+    tournament starts as soon as its share of the new teams exists.
+
+    Args:
+        team_count (int): Number of teams to create
+        players_per_team (int): Number of players created for each team
+        registry (UniquenessRegistry): Shared registry of taken names
+        concurrency (int): Maximum number of API calls running in parallel
+        batch_size (int, optional): Use the bulk endpoints with chunks of this size
+        tournament_count (int): Number of tournaments to create from the new teams
+        tournament_team_count (int, optional): Number of teams per tournament
+        start_date (str, optional): Tournament start date in ISO format (YYYY-MM-DD)
+        end_date (str, optional): Tournament end date in ISO format (YYYY-MM-DD)
+        render_workers (int, optional): Number of processes rendering logos ahead of the uploads
+    """
+    bulk = bool(batch_size)
+    chunk_size = batch_size or 1
+    min_tournament_teams = tournament_team_count or 4
+    
+    counts = {"teams": 0, "players": 0, "tournaments": 0}
+    created_team_ids = array("q")
+    pending_players = []
+    tournaments_submitted = 0
+    
+    # Teams are generated lazily with their short names reserved, so in-flight teams never collide
+    generated_teams = iter_generated_teams(registry, team_count, render_workers)
+    chunks = iter(lambda: list(islice(generated_teams, chunk_size)), [])
+    teams_exhausted = False
+    in_flight = {}
+    
+    # Make sure the shared client exists before worker threads start using it
+    get_api_client()
+    started = time.perf_counter()
+    
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        def submit(kind, fn, *args):
+            in_flight[executor.submit(fn, *args)] = kind
+        
+        def submit_tournaments(final=False):
+            nonlocal tournaments_submitted
+            while tournaments_submitted < tournament_count and created_team_ids:
+                # Spread tournaments over the run: each one waits for its share of the new teams
+                needed = math.ceil((tournaments_submitted + 1) * team_count / tournament_count)
+                needed = min(max(needed, min_tournament_teams), team_count)
+                if not final and len(created_team_ids) < needed:
+                    break
+                tournaments_submitted += 1
+                tournament_data = generate_tournament_data(created_team_ids, start_date, end_date, tournament_team_count)
+                if tournament_data is not None:
+                    submit("tournaments", post_tournament, tournament_data)
+        
+        while True:
+            # Keep the pipeline full; player and tournament tasks also count towards the bound
+            while not teams_exhausted and len(in_flight) < concurrency * 2:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    teams_exhausted = True
+                else:
+                    submit("teams", create_teams, chunk, bulk)
             
-            # Add final boundary
-            form_data.extend(f'\r\n--{boundary}--\r\n'.encode('utf-8'))
+            if teams_exhausted and "teams" not in in_flight.values():
+                if pending_players:
+                    submit("players", create_players, pending_players, bulk)
+                    pending_players = []
+                submit_tournaments(final=True)
             
-            # Set headers with proper content type
-            headers = {
-                'Content-Type': f'multipart/form-data; boundary={boundary}'
-            }
+            if not in_flight:
+                break
             
-            # Add authorization header
-            auth_headers = get_auth_headers()
-            headers.update(auth_headers)
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind = in_flight.pop(future)
+                result = future.result()
+                
+                if kind == "teams":
+                    for team_data in result:
+                        team_id = team_data["id"]
+                        registry.add_team(team_id, team_data["short_name"], team_data["full_name"])
+                        created_team_ids.append(team_id)
+                        counts["teams"] += 1
+                        
+                        # The team exists now, so its players can be generated and queued
+                        pending_players.extend(generate_team_players(registry, team_id, players_per_team))
+                        
+                        while len(pending_players) >= chunk_size:
+                            submit("players", create_players, pending_players[:chunk_size], bulk)
+                            del pending_players[:chunk_size]
+                    submit_tournaments()
+                elif kind == "players":
+                    counts["players"] += len(result)
+                elif result is not None:
+                    counts["tournaments"] += 1
+    
+    print_throughput(counts, time.perf_counter() - started)
+
+def create_team_with_players(count=1, players_per_team=5, registry=None, batch_size=None, concurrency=None,
+                             tournament_count=0, tournament_team_count=None, start_date=None, end_date=None,
+                             render_workers=None):
+    """
+    Create random teams with players using the API, with proactive unique name checking
+
+    Args:
+        count (int): Number of teams to create
+        players_per_team (int): Number of players created for each team
+        registry (UniquenessRegistry, optional): Shared registry of taken names (loaded from the API if omitted)
+        batch_size (int, optional): When set, submit teams and players through the bulk endpoints
+            in chunks of this size instead of one request per entity
+        concurrency (int, optional): When greater than 1, pipeline the API calls on this many threads
+        tournament_count (int): Number of tournaments to create from the new teams (pipelined mode)
+        tournament_team_count (int, optional): Number of teams per tournament
+        start_date (str, optional): Tournament start date in ISO format (YYYY-MM-DD)
+        end_date (str, optional): Tournament end date in ISO format (YYYY-MM-DD)
+        render_workers (int, optional): Number of processes rendering logos ahead of the uploads
+    """
+    # Fetch existing teams and players to check short name and nickname uniqueness
+    if registry is None:
+        registry = load_registry()
+    
+    if (concurrency and concurrency > 1) or tournament_count:
+        run_creation_pipeline(count, players_per_team, registry, concurrency or 1, batch_size,
+                              tournament_count, tournament_team_count, start_date, end_date, render_workers)
+        return
+    
+    if batch_size:
+        create_team_with_players_in_batches(count, players_per_team, registry, batch_size, render_workers)
+        return
+    
+    for team_data, logo_bytes in iter_generated_teams(registry, count, render_workers):
+        team_name = team_data["full_name"]
+        short_name = team_data["short_name"]
+        
+        print(f"Creating team: {team_name} (short name: {short_name}) from {team_data['country']}")
+        team_id = post_team(team_data, logo_bytes)
+        
+        if team_id is not None:
+            # Add to the registry for future uniqueness checks
+            registry.add_team(team_id, short_name, team_name)
             
-            # Send the request with binary data
-            team_response = requests.post(
-                f"{API_BASE_URL}/teams", 
-                data=form_data,
-                headers=headers
-            )
+            # Create players for this team with unique nicknames
+            create_players(generate_team_players(registry, team_id, players_per_team))
+
+def create_team_with_players_in_batches(count, players_per_team, registry, batch_size, render_workers=None):
+    """Create teams and their players through the bulk endpoints, `batch_size` entities per request"""
+    pending_players = []
+    
+    # Teams are generated with their short names reserved, so a chunk never contains duplicates
+    generated_teams = iter_generated_teams(registry, count, render_workers)
+    for teams in iter(lambda: list(islice(generated_teams, batch_size)), []):
+        for team_data in create_teams_in_bulk(teams):
+            team_id = team_data["id"]
+            registry.add_team(team_id, team_data["short_name"], team_data["full_name"])
             
-            if team_response.status_code == 201:
-                team = team_response.json()
-                team_id = team.get("id")
-                print(f"✅ Team created successfully with ID: {team_id}")
-                
-                # Add to existing teams list for future uniqueness checks
-                existing_teams.append({"id": team_id, "short_name": short_name})
-                
-                # Generate nationality distribution for this team
-                nationalities = distribute_nationalities(players_per_team)
-                
-                # Create players for this team with unique nicknames
-                created_players = []
-                for j in range(players_per_team):
-                    player = create_player(
-                        team_id=team_id, 
-                        display_team_info=False, 
-                        country=nationalities[j],
-                        existing_players=existing_players + created_players
-                    )
-                    if player:
-                        created_players.append(player)
-                        existing_players.append(player)
-            else:
-                print(f"❌ Failed to create team: {team_response.status_code}")
-                print(f"Response: {team_response.text}")
-        except Exception as e:
-            print(f"Error: {e}")
+            # Players are only generated once their team exists, so they never reference a missing team
+            pending_players.extend(generate_team_players(registry, team_id, players_per_team))
+            while len(pending_players) >= batch_size:
+                create_players_in_bulk(pending_players[:batch_size])
+                del pending_players[:batch_size]
+    
+    if pending_players:
+        create_players_in_bulk(pending_players)
+
+def create_player(count=1, team_id=None, display_team_info=True, country=None, registry=None, batch_size=None,
+                  concurrency=None):
+    """
+    Create random players and optionally assign to a team with proactive unique nickname checking
+
+    Players are generated and sent as a stream; only the pending chunk is held in memory.
 
-def create_player(count=1, team_id=None, display_team_info=True, country=None, existing_players=None):
-    """Create random players and optionally assign to a team with proactive unique nickname checking"""
-    # If existing_players wasn't provided, fetch them
-    if existing_players is None:
-        existing_players = fetch_players()
-        print(f"Fetched {len(existing_players)} existing players to ensure unique nicknames")
+    Returns the created player for single player creation, or the number of players created
+    """
+    # If no registry was provided, fetch existing players (and teams to assign randomly)
+    if registry is None:
+        registry = load_registry(teams=team_id is None)
     
-    teams = []
-    created_players = []
+    created_count = 0
+    pending_players = []
     
-    # If no team_id is provided, get the list of teams to assign randomly
+    # If no team_id is provided, pick from the known teams to assign randomly
     if team_id is None:
-        teams = fetch_teams()
-        if not teams and not count == 0:
+        if not registry.team_ids and not count == 0:
             print("No teams found. Cannot create player without a team.")
             return None
     
+    if concurrency and concurrency > 1:
+        started = time.perf_counter()
+        
+        def player_chunks():
+            # Generate on the calling thread, so the allocator has reserved every nickname before it is submitted
+            chunk = []
+            for i in range(count if team_id is None else 1):
+                player_data, _ = generate_player_data(registry, team_id, country)
+                chunk.append(player_data)
+                if len(chunk) >= (batch_size or 1):
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+        
+        tasks = (partial(create_players, chunk, bool(batch_size)) for chunk in player_chunks())
+        for created in run_bounded(tasks, concurrency):
+            created_count += len(created)
+        print_throughput({"players": created_count}, time.perf_counter() - started)
+        return created_count
+    
     for i in range(count if team_id is None else 1):
-        # Generate player data with guaranteed unique nickname
-        first_name = random.choice(FIRST_NAMES)
-        last_name = random.choice(LAST_NAMES)
-        nickname = generate_unique_player_nickname(existing_players)
-        role = random.choice(PLAYER_ROLES)
-        age = random.randint(18, 35)
+        player_data, team_name = generate_player_data(registry, team_id, country)
+        nickname = player_data["nickname"]
         
-        # Use provided country or pick random one
-        player_country = country if country else random.choice(COUNTRIES)
+        # In batched mode, submit once a full chunk is ready
+        if batch_size:
+            pending_players.append(player_data)
+            if len(pending_players) >= batch_size:
+                created_count += len(create_players_in_bulk(pending_players))
+                pending_players = []
+            continue
         
-        # If team_id wasn't provided, assign to a random team
-        player_team_id = team_id
-        team_name = None
+        if display_team_info and team_name:
+            print(f"Creating player: {nickname} ({player_data['role']}) from {player_data['country']} for team {team_name}")
+        else:
+            print(f"Creating player: {nickname} ({player_data['role']}) from {player_data['country']}")
         
-        if player_team_id is None:
-            selected_team = random.choice(teams)
-            player_team_id = selected_team.get("id")
-            team_name = selected_team.get("full_name")
+        player_id = post_player(player_data, display_team_info)
+        if player_id is not None:
+            player_data["id"] = player_id
+            
+            created_count += 1
+            if count == 1 and team_id is not None:
+                # Single player creation for a team: return the player itself
+                return player_data
+    
+    if pending_players:
+        created_count += len(create_players_in_bulk(pending_players))
+    return created_count
+
+class RunJournal:
+    """
+    Append-only write-ahead journal of a generation run
+
+    Every entity is recorded as planned right before it is sent to the API and as
+    acknowledged (with its new ID) once the API created it, keyed by its unique field
+    (short name, nickname, or a sequence number for tournaments). The first record holds
+    the run's arguments, so an interrupted run can be resumed from the journal alone.
+
+    Records are flushed to the OS as they are written, so they survive the process dying;
+    fsync (for machine crashes) is batched every JOURNAL_SYNC_RECORDS records or
+    JOURNAL_SYNC_SECONDS seconds. Logos are not journaled.
+    """
+
+    def __init__(self, path, run_id):
+        self.path = path
+        self.run_id = run_id
+        self.lock = threading.Lock()
+        self.header = None
+        self.planned = {"teams": {}, "players": {}, "tournaments": {}}
+        self.acked = {"teams": {}, "players": {}, "tournaments": {}}
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.file = None
+
+    @classmethod
+    def start(cls, journal_dir, run_type, args):
+        """Start the journal of a new run, recording its type and arguments"""
+        run_id = f"{datetime.now():%Y%m%d-%H%M%S}-{os.urandom(3).hex()}"
+        os.makedirs(journal_dir, exist_ok=True)
+        journal = cls(os.path.join(journal_dir, f"{run_id}.jsonl"), run_id)
+        journal.file = open(journal.path, "a", encoding="utf-8")
+        journal.header = {"op": "run", "run_id": run_id, "type": run_type, "args": args}
+        journal.write(journal.header)
+        journal.sync()
+        return journal
+
+    @classmethod
+    def open(cls, journal_dir, run_id):
+        """Load the journal of an earlier run and reopen it for appending"""
+        journal = cls(os.path.join(journal_dir, f"{run_id}.jsonl"), run_id)
+        with open(journal.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A record cut short by the interruption
+                    continue
+                op = record.get("op")
+                if op == "run":
+                    journal.header = record
+                elif op == "plan":
+                    journal.planned[record["kind"]][record["key"]] = record["data"]
+                elif op == "ack":
+                    journal.acked[record["kind"]][record["key"]] = record["id"]
+        journal.file = open(journal.path, "a", encoding="utf-8")
+        return journal
+
+    def pending(self, kind):
+        """Planned entities of a kind that were never acknowledged, as {key: payload}"""
+        return {key: data for key, data in self.planned[kind].items() if key not in self.acked[kind]}
+
+    def write(self, record):
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()
+            self.unsynced += 1
+            if self.unsynced >= JOURNAL_SYNC_RECORDS or time.monotonic() - self.last_sync >= JOURNAL_SYNC_SECONDS:
+                self.sync_locked()
+
+    def sync_locked(self):
+        os.fsync(self.file.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def sync(self):
+        """Force the journal to disk"""
+        with self.lock:
+            self.sync_locked()
+
+    def plan(self, kind, key, data):
+        """
+        Record an entity about to be sent, returning its key
+
+        Tournaments have no unique field, so they are keyed by their position in the run
+        (pass key=None to assign the next one).
+        """
+        if key is None:
+            with self.lock:
+                key = str(len(self.planned[kind]))
+                self.planned[kind][key] = None
+        self.write({"op": "plan", "kind": kind, "key": key,
+                    "data": {field: value for field, value in data.items() if field != "logo_image_file"}})
+        return key
+
+    def ack(self, kind, key, entity_id):
+        """Record that the API created an entity"""
+        self.write({"op": "ack", "kind": kind, "key": key, "id": entity_id})
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+def resume_run(journal, batch_size=None, concurrency=None, render_workers=None):
+    """
+    Finish an interrupted run from its journal
+
+    Entities that were sent but never acknowledged are looked up in the API first (the
+    request may have succeeded right before the interruption): teams by short name,
+    players by nickname and tournaments by name and start day. Only the ones that do not
+    exist are sent again; pending teams get a freshly rendered logo.
+    The run is then completed with the arguments it was started with: missing players
+    of the run's teams are added and the remaining teams, players or tournaments created.
+
+    Args:
+        journal (RunJournal): Journal of the run, opened with RunJournal.open
+        batch_size (int, optional): Use the bulk endpoints with chunks of this size
+        concurrency (int, optional): Number of API calls running in parallel
+        render_workers (int, optional): Number of processes rendering logos
+    """
+    run_type = journal.header["type"]
+    args = journal.header["args"]
+    bulk = bool(batch_size)
+    chunk_size = batch_size or 1
+    
+    print(f"Resuming run {journal.run_id} ({run_type}): " + ", ".join(
+        f"{len(journal.acked[kind])}/{len(journal.planned[kind])} {kind} acknowledged" for kind in journal.planned))
+    registry = load_registry(players=run_type != "tournament")
+    
+    pending_teams = journal.pending("teams")
+    if pending_teams:
+        # Teams that reached the API before the interruption only need their acknowledgement
+        existing = {key for key in pending_teams if key in registry.short_names}
+        if existing:
+            for team in iter_teams():
+                if team.get("short_name") in existing:
+                    journal.ack("teams", team["short_name"], team.get("id"))
+                    journal.acked["teams"][team["short_name"]] = team.get("id")
+        teams = [(data, render_team_logo(generate_team_logo())) for key, data in pending_teams.items() if key not in existing]
+        print(f"{len(existing)} pending teams already existed, retrying {len(teams)}")
+        for start in range(0, len(teams), chunk_size):
+            for team_data in create_teams(teams[start:start + chunk_size], bulk):
+                registry.add_team(team_data["id"], team_data["short_name"], team_data["full_name"])
+                journal.acked["teams"][team_data["short_name"]] = team_data["id"]
+    
+    pending_players = journal.pending("players")
+    if pending_players:
+        existing = {key for key in pending_players if key in registry.nicknames}
+        if existing:
+            # Players that reached the API before the interruption are acknowledged with their real IDs
+            for player in iter_players():
+                if player.get("nickname") in existing:
+                    journal.ack("players", player["nickname"], player.get("id"))
+                    journal.acked["players"][player["nickname"]] = player.get("id")
+        players = [data for key, data in pending_players.items() if key not in existing]
+        print(f"{len(existing)} pending players already existed, retrying {len(players)}")
+        for start in range(0, len(players), chunk_size):
+            create_players(players[start:start + chunk_size], bulk)
+    
+    pending_tournaments = {key: data for key, data in journal.pending("tournaments").items() if data is not None}
+    if pending_tournaments:
+        # Tournaments have no unique field, so existing ones are recognized by name and start day
+        existing = {(tournament.get("name"), str(tournament.get("start_date"))[:10]): tournament.get("id")
+                    for tournament in iter_collection("tournaments")}
+        retried = 0
+        for key, tournament_data in pending_tournaments.items():
+            tournament_id = existing.get((tournament_data["name"], tournament_data["start_date"][:10]))
+            if tournament_id is not None:
+                journal.ack("tournaments", key, tournament_id)
+                journal.acked["tournaments"][key] = tournament_id
+            else:
+                post_tournament(tournament_data, key)
+                retried += 1
+        print(f"{len(pending_tournaments) - retried} pending tournaments already existed, retried {retried}")
+    
+    if run_type == "team":
+        # Teams acknowledged right before the interruption may be missing some of their players
+        players_per_team = args["players"]
+        planned_per_team = Counter(data.get("team_id") for data in journal.planned["players"].values())
+        missing = []
+        for team_id in journal.acked["teams"].values():
+            if team_id is None:
+                continue
+            count = players_per_team - planned_per_team[team_id]
+            if count > 0:
+                nationalities = distribute_nationalities(players_per_team)
+                for country in nationalities[:count]:
+                    player_data, _ = generate_player_data(registry, team_id, country)
+                    missing.append(player_data)
+        for start in range(0, len(missing), chunk_size):
+            create_players(missing[start:start + chunk_size], bulk)
         
-        player_data = {
-            "nickname": nickname,
-            "full_name": f"{first_name} {last_name}",
-            "age": age,
-            "country": player_country,
-            "team_id": player_team_id,
-            "role": role,
-            "player_attributes": generate_player_attributes()
-        }
+        remaining_teams = args["count"] - len(journal.planned["teams"])
+        remaining_tournaments = (args.get("tournaments") or 0) - len(journal.planned["tournaments"])
+        if remaining_teams > 0:
+            create_team_with_players(remaining_teams, players_per_team, registry, batch_size, concurrency,
+                                     max(0, remaining_tournaments), args.get("teams"), args.get("start_date"),
+                                     args.get("end_date"), render_workers)
+        elif remaining_tournaments > 0:
+            # Tournaments of a team run are made of that run's teams
+            run_registry = UniquenessRegistry()
+            for team_id in journal.acked["teams"].values():
+                run_registry.add_team(team_id, None)
+            create_tournament(remaining_tournaments, args.get("start_date"), args.get("end_date"), args.get("teams"),
+                              registry=run_registry, concurrency=concurrency)
+    elif run_type == "player":
+        remaining = (args["count"] if args.get("team") is None else 1) - len(journal.planned["players"])
+        if remaining > 0:
+            create_player(remaining, args.get("team"), country=args.get("country"), registry=registry,
+                          batch_size=batch_size, concurrency=concurrency)
+    elif run_type == "tournament":
+        remaining = args["count"] - len(journal.planned["tournaments"])
+        if remaining > 0:
+            create_tournament(remaining, args.get("start_date"), args.get("end_date"), args.get("teams"),
+                              registry=registry, concurrency=concurrency)
+
+class RecordWriter:
+    """
+    Stream records to disk one at a time
+
+    Writes either a JSON array (the format Bootstrap.ts imports) or NDJSON (one record
+    per line), optionally gzip-compressed. Nothing but the current record is held in memory.
+    """
+
+    def __init__(self, path, fmt="json", compress=False):
+        self.path = path
+        self.fmt = fmt
+        self.count = 0
+        opener = gzip.open if compress else open
+        self.file = opener(path, "wt", encoding="utf-8")
+        if fmt == "json":
+            self.file.write("[")
+
+    def write(self, record):
+        if self.fmt == "json":
+            self.file.write(",\n  " if self.count else "\n  ")
+            self.file.write(json.dumps(record, ensure_ascii=False))
+        else:
+            self.file.write(json.dumps(record, ensure_ascii=False))
+            self.file.write("\n")
+        self.count += 1
+
+    def close(self):
+        if self.fmt == "json":
+            self.file.write("\n]\n" if self.count else "]\n")
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def dataset_path(output_dir, kind, fmt="json", compress=False):
+    """Path of a dataset file, named after the bootstrap JSON files (e.g. bootstrap_teams.ndjson.gz)"""
+    extension = "json" if fmt == "json" else "ndjson"
+    return os.path.join(output_dir, f"bootstrap_{kind}.{extension}{'.gz' if compress else ''}")
+
+def to_bootstrap_team(team_id, team_data, logo_bytes):
+    """Convert a generated team into a bootstrap_teams.json record (the logo is inlined as a data URL)"""
+    return {
+        "id": team_id,
+        "full_name": team_data["full_name"],
+        "description": team_data["description"],
+        "short_name": team_data["short_name"],
+        "country": team_data["country"],
+        "imageLogo": f"data:image/png;base64,{base64.b64encode(logo_bytes).decode('ascii')}",
+    }
+
+def to_bootstrap_player(player_data):
+    """Convert a generated player into a bootstrap_players.json record"""
+    return {
+        "full_name": player_data["full_name"],
+        "nickname": player_data["nickname"],
+        "age": player_data["age"],
+        "country": player_data["country"],
+        "team_id": player_data["team_id"],
+        "role": player_data["role"],
+        "player_attributes": player_data["player_attributes"],
+    }
+
+def to_bootstrap_tournament(tournament_data):
+    """Convert a generated tournament payload into a bootstrap_tournaments.json record"""
+    return {
+        "name": tournament_data["name"],
+        "description": tournament_data["description"],
+        "start_date": tournament_data["start_date"],
+        "end_date": tournament_data["end_date"],
+        "started": False,
+        "ended": False,
+        "country": tournament_data["country"],
+        "type": tournament_data["type"],
+        "schedule": [],
+        "standings": [],
+        "team_ids": [team["id"] for team in tournament_data["teams"]],
+    }
+
+def export_dataset(output_dir, team_count, players_per_team=5, tournament_count=0, tournament_team_count=None,
+                   start_date=None, end_date=None, fmt="json", compress=False, first_team_id=1, render_workers=None):
+    """
+    Generate a dataset offline and write it in the Bootstrap JSON format
+
+    Writes bootstrap_teams, bootstrap_players and bootstrap_tournaments files matching the
+    schema of api/src/bootstrap/json, so Bootstrap.ts can load them without the API running.
+    Records are streamed to disk as they are generated; only the uniqueness keys stay in memory.
+
+    Args:
+        output_dir (str): Directory the files are written to
+        team_count (int): Number of teams to generate
+        players_per_team (int): Number of players generated for each team
+        tournament_count (int): Number of tournaments to generate
+        tournament_team_count (int, optional): Number of teams per tournament
+        start_date (str, optional): Tournament start date in ISO format (YYYY-MM-DD)
+        end_date (str, optional): Tournament end date in ISO format (YYYY-MM-DD)
+        fmt (str): "json" for JSON arrays (what Bootstrap.ts imports) or "ndjson"
+        compress (bool): gzip the files
+        first_team_id (int): Explicit ID given to the first team (teams are numbered sequentially)
+        render_workers (int, optional): Number of processes rendering logos ahead of the writer
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    registry = UniquenessRegistry()
+    started = time.perf_counter()
+    
+    with RecordWriter(dataset_path(output_dir, "teams", fmt, compress), fmt, compress) as teams_writer, \
+            RecordWriter(dataset_path(output_dir, "players", fmt, compress), fmt, compress) as players_writer:
+        generated_teams = iter_generated_teams(registry, team_count, render_workers)
+        for team_id, (team_data, logo_bytes) in enumerate(generated_teams, start=first_team_id):
+            teams_writer.write(to_bootstrap_team(team_id, team_data, logo_bytes))
+            
+            for player_data in generate_team_players(registry, team_id, players_per_team):
+                players_writer.write(to_bootstrap_player(player_data))
+    
+    # Team IDs are sequential, so tournaments can sample them without keeping the teams around
+    team_ids = range(first_team_id, first_team_id + team_count)
+    with RecordWriter(dataset_path(output_dir, "tournaments", fmt, compress), fmt, compress) as tournaments_writer:
+        for _ in range(tournament_count if team_ids else 0):
+            tournament_data = generate_tournament_data(team_ids, start_date, end_date, tournament_team_count)
+            if tournament_data is not None:
+                tournaments_writer.write(to_bootstrap_tournament(tournament_data))
+    
+    print_throughput({"teams": teams_writer.count, "players": players_writer.count,
+                      "tournaments": tournaments_writer.count}, time.perf_counter() - started,
+                     action=f"Exported to {output_dir}:")
+    print_logo_cache_stats()
+
+def find_dataset_file(input_dir, kind):
+    """Locate the dataset file of a kind in any of the export formats, or None if there is none"""
+    for fmt in ("ndjson", "json"):
+        for compress in (True, False):
+            path = dataset_path(input_dir, kind, fmt, compress)
+            if os.path.exists(path):
+                return path
+    return None
+
+def iter_records(path):
+    """
+    Stream records from a dataset file without loading it whole
+
+    Supports NDJSON and JSON arrays (including hand-formatted ones like the bootstrap
+    files), optionally gzip-compressed.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        if ".ndjson" in os.path.basename(path):
+            for line in file:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+            return
         
-        try:
-            if display_team_info and team_name:
-                print(f"Creating player: {nickname} ({role}) from {player_country} for team {team_name}")
+        decoder = json.JSONDecoder()
+        buffer = ""
+        in_array = False
+        for chunk in iter(lambda: file.read(1 << 16), ""):
+            buffer += chunk
+            pos = 0
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                if pos >= len(buffer):
+                    break
+                if not in_array:
+                    if buffer[pos] != "[":
+                        raise ValueError(f"{path} is not a JSON array")
+                    in_array = True
+                    pos += 1
+                    continue
+                if buffer[pos] == "]":
+                    return
+                try:
+                    record, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # The record continues in the next chunk
+                    break
+                yield record
+            buffer = buffer[pos:]
+        
+        if buffer.strip():
+            raise ValueError(f"{path} ends with an incomplete record")
+
+def from_bootstrap_team(record):
+    """
+    Convert a bootstrap_teams record back into the (team_data, logo_bytes) shape used for team creation
+
+    Only inlined data: URL logos are carried over; remote logo URLs are left for the API to ignore.
+    """
+    team_data = {
+        "short_name": record["short_name"],
+        "full_name": record["full_name"],
+        "description": record.get("description", ""),
+        "country": record["country"],
+    }
+    logo_bytes = None
+    image_logo = record.get("imageLogo") or ""
+    if image_logo.startswith("data:image"):
+        logo_bytes = base64.b64decode(image_logo.split(",", 1)[1])
+    return team_data, logo_bytes
+
+def from_bootstrap_player(record, team_id):
+    """Convert a bootstrap_players record into the player payload used for player creation"""
+    return {
+        "nickname": record["nickname"],
+        "full_name": record["full_name"],
+        "age": record["age"],
+        "country": record["country"],
+        "team_id": team_id,
+        "role": record["role"],
+        "player_attributes": record["player_attributes"],
+    }
+
+def from_bootstrap_tournament(record, team_ids):
+    """Convert a bootstrap_tournaments record into the payload used for tournament creation"""
+    return {
+        "type": record.get("type", "SINGLE_GROUP"),
+        "name": record["name"],
+        "description": record.get("description", ""),
+        "country": record["country"],
+        "start_date": record["start_date"],
+        "end_date": record["end_date"],
+        "started": False,
+        "ended": False,
+        "teams": [{"id": team_id} for team_id in team_ids],
+    }
+
+class ReplayCheckpoint:
+    """
+    Progress of a dataset replay
+
+    Stores how many records of each kind were processed, the offsets of the ones that
+    failed (retried first on the next run), and the mapping from the exported team IDs to
+    the IDs the target database assigned. The mapping is appended (and fsynced) to a side
+    file before the offsets are atomically rewritten, so an interrupted replay never
+    resumes past data it cannot reference.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.team_ids_path = f"{path}.team_ids"
+        self.offsets = {"teams": 0, "players": 0, "tournaments": 0}
+        self.failed = {kind: [] for kind in self.offsets}
+        self.team_ids = {}
+        # Created before the first request, so no batch is sent without a place to record it
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def load(self):
+        """Load a previous checkpoint if one exists. Returns True if there was one"""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, encoding="utf-8") as file:
+            data = json.load(file)
+        self.failed.update(data.pop("failed", {}))
+        self.offsets.update(data)
+        if os.path.exists(self.team_ids_path):
+            with open(self.team_ids_path, encoding="utf-8") as file:
+                for line in file:
+                    old_id, new_id = line.split()
+                    self.team_ids[int(old_id)] = int(new_id)
+        return True
+
+    def reset(self):
+        """Forget any previous progress"""
+        for path in (self.path, self.team_ids_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def add_team_ids(self, mapping):
+        """Durably record exported -> created team IDs"""
+        if not mapping:
+            return
+        with open(self.team_ids_path, "a", encoding="utf-8") as file:
+            file.writelines(f"{old_id} {new_id}\n" for old_id, new_id in mapping.items())
+            file.flush()
+            os.fsync(file.fileno())
+        self.team_ids.update(mapping)
+
+    def failed_count(self):
+        return sum(len(offsets) for offsets in self.failed.values())
+
+    def advance(self, kind, offsets, failed):
+        """
+        Mark a batch of records of a kind as processed and persist the checkpoint
+
+        Args:
+            kind (str): "teams", "players" or "tournaments"
+            offsets (list): Positions in the dataset file of the batch's records
+            failed (list): Positions of the records that were not acknowledged, kept for the next run
+        """
+        processed = set(offsets)
+        self.failed[kind] = sorted({offset for offset in self.failed[kind] if offset not in processed} | set(failed))
+        self.offsets[kind] = max(self.offsets[kind], max(offsets) + 1)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({**self.offsets, "failed": self.failed}, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+def replay_dataset(input_dir, batch_size=100, checkpoint_path=None, restart=False):
+    """
+    Stream an exported dataset into the API in batches, checkpointing after each batch
+
+    Teams and players go through the bulk endpoints (falling back to one request per row
+    that a bulk call did not create), tournaments are created one by one. Player team IDs
+    and tournament team lists are remapped to the IDs the target database assigned, so the
+    dataset can be loaded into a database that already has data. Rerunning after an
+    interruption resumes from the last processed batch, first retrying the records that
+    were not acknowledged (players and tournaments of a failed team fail with it).
+
+    Args:
+        input_dir (str): Directory holding the bootstrap_* dataset files
+        batch_size (int): Number of records submitted per batch
+        checkpoint_path (str, optional): Checkpoint file (defaults to replay_checkpoint.json in input_dir)
+        restart (bool): Ignore an existing checkpoint and replay from the start
+
+    Returns the number of records still not replayed
+    """
+    checkpoint = ReplayCheckpoint(checkpoint_path or os.path.join(input_dir, "replay_checkpoint.json"))
+    if restart:
+        checkpoint.reset()
+    elif checkpoint.load():
+        print(f"Resuming replay from checkpoint: {checkpoint.offsets}")
+    
+    started = time.perf_counter()
+    counts = {"teams": 0, "players": 0, "tournaments": 0}
+    
+    def rows(path, kind):
+        """Yield (offset, record), the records that failed last time first, then the unprocessed ones"""
+        retry = set(checkpoint.failed[kind])
+        if retry:
+            print(f"Retrying {len(retry)} {kind} that were not replayed")
+            yield from ((offset, record) for offset, record in islice(enumerate(iter_records(path)), max(retry) + 1)
+                        if offset in retry)
+        yield from islice(enumerate(iter_records(path)), checkpoint.offsets[kind], None)
+    
+    def batches(kind):
+        path = find_dataset_file(input_dir, kind)
+        if path is None:
+            print(f"No {kind} file found in {input_dir}, skipping")
+            return iter(())
+        records = rows(path, kind)
+        return iter(lambda: list(islice(records, batch_size)), [])
+    
+    for batch in batches("teams"):
+        offsets = [offset for offset, _ in batch]
+        batch = [record for _, record in batch]
+        teams = [from_bootstrap_team(record) for record in batch]
+        payloads = []
+        for team_data, logo_bytes in teams:
+            payload = dict(team_data)
+            if logo_bytes is not None:
+                payload["logo_image_file"] = f"data:image/png;base64,{base64.b64encode(logo_bytes).decode('ascii')}"
+            payloads.append(payload)
+        
+        print(f"Replaying {len(batch)} teams")
+        ids = post_bulk("teams", payloads, "short_name")
+        mapping = {}
+        failed = []
+        for offset, record, (team_data, logo_bytes) in zip(offsets, batch, teams):
+            team_id = ids.get(team_data["short_name"])
+            if team_id is None:
+                # The multipart endpoint needs a logo file, so render one for teams exported without it
+                team_id = post_team(team_data, logo_bytes or render_team_logo(generate_team_logo()))
+            if team_id is None:
+                print(f"❌ Team {team_data['short_name']} could not be replayed; its players will be skipped")
+                failed.append(offset)
+                continue
+            mapping[record.get("id", team_id)] = team_id
+        
+        checkpoint.add_team_ids(mapping)
+        checkpoint.advance("teams", offsets, failed)
+        counts["teams"] += len(mapping)
+    
+    for batch in batches("players"):
+        players = []
+        failed = []
+        for offset, record in batch:
+            team_id = checkpoint.team_ids.get(record.get("team_id"))
+            if team_id is None:
+                print(f"  ❌ Skipping player {record.get('nickname')}: team {record.get('team_id')} was not replayed")
+                failed.append(offset)
+                continue
+            players.append((offset, from_bootstrap_player(record, team_id)))
+        
+        if players:
+            counts["players"] += len(create_players_in_bulk([player for _, player in players]))
+            failed.extend(offset for offset, player in players if "id" not in player)
+        checkpoint.advance("players", [offset for offset, _ in batch], failed)
+    
+    for batch in batches("tournaments"):
+        failed = []
+        for offset, record in batch:
+            team_ids = [checkpoint.team_ids[team_id] for team_id in record.get("team_ids", []) if team_id in checkpoint.team_ids]
+            if not team_ids:
+                print(f"❌ Skipping tournament {record.get('name')}: none of its teams were replayed")
+                failed.append(offset)
+                continue
+            if post_tournament(from_bootstrap_tournament(record, team_ids)) is not None:
+                counts["tournaments"] += 1
             else:
-                print(f"Creating player: {nickname} ({role}) from {player_country}")
-                
-            player_response = requests.post(f"{API_BASE_URL}/players", json=player_data, headers=get_auth_headers())
+                failed.append(offset)
+        checkpoint.advance("tournaments", [offset for offset, _ in batch], failed)
+    
+    print_throughput(counts, time.perf_counter() - started, action="Replayed")
+    failed = checkpoint.failed_count()
+    if failed:
+        kinds = ", ".join(f"{len(offsets)} {kind}" for kind, offsets in checkpoint.failed.items() if offsets)
+        print(f"❌ {failed} records were not replayed ({kinds}); rerun to retry them")
+    return failed
+
+class SoakStats:
+    """
+    Latencies of a soak run per in-flight level: every round played through the round
+    endpoint, every game (its round plays and /play) and every match, plus failures
+    """
+
+    KINDS = ("round", "game", "match")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.levels = {}
+
+    def level(self, in_flight):
+        with self.lock:
+            return self.levels.setdefault(in_flight, {"latencies": {kind: array("d") for kind in self.KINDS},
+                                                      "errors": Counter(), "seconds": 0.0})
+
+    def record(self, in_flight, kind, latency):
+        stats = self.level(in_flight)
+        with self.lock:
+            stats["latencies"][kind].append(latency)
+
+    def error(self, in_flight, kind):
+        stats = self.level(in_flight)
+        with self.lock:
+            stats["errors"][kind] += 1
+
+    def summary(self):
+        """Return, per in-flight level, the matches/rounds per second and p50/p95/p99/max latency in ms per kind"""
+        summary = {}
+        with self.lock:
+            for in_flight, stats in sorted(self.levels.items()):
+                seconds = max(stats["seconds"], 1e-9)
+                level = {"seconds": round(stats["seconds"], 3), "errors": dict(stats["errors"]),
+                         "matches_per_second": round(len(stats["latencies"]["match"]) / seconds, 3),
+                         "rounds_per_second": round(len(stats["latencies"]["round"]) / seconds, 3)}
+                for kind, latencies in stats["latencies"].items():
+                    latencies = sorted(latencies)
+                    level[kind] = {"count": len(latencies)}
+                    if latencies:
+                        level[kind].update({name: round(percentile(latencies, fraction) * 1000, 1)
+                                            for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))})
+                        level[kind]["max"] = round(latencies[-1] * 1000, 1)
+                summary[str(in_flight)] = level
+        return summary
+
+    def print_summary(self):
+        """Print one line per in-flight level and kind"""
+        print("\nSoak results:")
+        print(f"  {'In flight':>9} {'Kind':<6} {'Count':>7} {'Errors':>6} {'Per sec':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for in_flight, level in self.summary().items():
+            for kind in self.KINDS:
+                stats = level[kind]
+                rate = level["matches_per_second"] if kind == "match" else (
+                    level["rounds_per_second"] if kind == "round" else stats["count"] / max(level["seconds"], 1e-9))
+                latency = "".join(f" {stats[name]:>9.1f}" if name in stats else f" {'-':>9}" for name in ("p50", "p95", "p99"))
+                print(f"  {in_flight:>9} {kind:<6} {stats['count']:>7} {level['errors'].get(kind, 0):>6} {rate:>8.2f}{latency}")
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=2)
+            file.write("\n")
+        print(f"✅ Soak results written to {path}")
+
+def start_tournament(tournament_id):
+    """Start a tournament, returning False if it does not exist or could not be started"""
+    try:
+        response = get_api_client().post(f"tournaments/{tournament_id}/start")
+        if response.status_code == 200:
+            print(f"✅ Tournament {tournament_id} started")
+            return True
+        if response.status_code == 400:
+            print(f"Tournament {tournament_id} was already started")
+            return True
+        print(f"❌ Failed to start tournament {tournament_id}: {response.status_code}")
+        return False
+    except Exception as e:
+        print(f"Error: {e}")
+        return False
+
+def last_played_round(game_id):
+    """
+    Return (round, finished) for the last round a game has logs for, (0, True) for a game
+    with no rounds yet, or None if the request failed
+    """
+    response = get_api_client().get(f"games/{game_id}/rounds/last")
+    if response.status_code != 200:
+        print(f"❌ Failed to fetch the last round of game {game_id}: {response.status_code}")
+        return None
+    logs = response.json()
+    if not logs:
+        return 0, True
+    return logs[-1]["round_state"]["round"], any(log["round_state"].get("finished") for log in logs)
+
+def play_match(match, round_plays, stats, in_flight):
+    """
+    Play a match game by game through the API until the series is decided
+
+    Each unfinished game gets its first `round_plays` rounds played one request at a time,
+    then /games/{id}/play plays the rest. Round plays continue after the rounds a game
+    already has (from an interrupted soak, or the API's scheduler), since the round
+    endpoint does not check for existing logs and would record a round twice.
+    The winner of every game is read from its stats.
+
+    Returns the winning team ID, or None if a request failed
+    """
+    client = get_api_client()
+    started = time.perf_counter()
+    try:
+        response = client.get(f"games/match/{match['id']}")
+        if response.status_code != 200:
+            print(f"❌ Failed to fetch the games of match {match['id']}: {response.status_code}")
+            stats.error(in_flight, "match")
+            return None
+        games = sorted(response.json(), key=lambda game: (game["date"], game["id"]))
+        
+        games_to_win = MATCH_GAMES_TO_WIN.get(match.get("type"), 1)
+        wins = Counter()
+        for game in games:
+            # Games left once the series is decided are never played, like MatchService.playFullMatch
+            if wins and max(wins.values()) >= games_to_win:
+                break
             
-            if player_response.status_code == 201:
-                player_data["id"] = player_response.json().get("id")
-                if display_team_info:
-                    print(f"✅ Player created successfully with ID: {player_data['id']}")
-                else:
-                    print(f"  ✅ Player created: {nickname} ({role})")
+            if not game.get("finished"):
+                game_started = time.perf_counter()
+                last_round = last_played_round(game["id"]) if round_plays > 0 else (0, True)
+                if last_round is None:
+                    stats.error(in_flight, "round")
+                    return None
+                # A round left half played is finished by /play, which continues from the last duel
+                played, finished = last_round
+                first_round = played + 1 if finished else ROUND_PLAYS_LIMIT + 1
+                for round_number in range(first_round, min(round_plays, ROUND_PLAYS_LIMIT) + 1):
+                    round_started = time.perf_counter()
+                    response = client.post(f"games/{game['id']}/rounds/{round_number}/play")
+                    if response.status_code != 200:
+                        print(f"❌ Failed to play round {round_number} of game {game['id']}: {response.status_code}")
+                        stats.error(in_flight, "round")
+                        return None
+                    stats.record(in_flight, "round", time.perf_counter() - round_started)
                 
-                # Add the created player to our list
-                created_players.append(player_data)
-            else:
-                if display_team_info:
-                    print(f"❌ Failed to create player: {player_response.status_code}")
-                else:
-                    print(f"  ❌ Failed to create player {nickname}: {player_response.status_code}")
-                print(f"Response: {player_response.text}")
-        except Exception as e:
-            print(f"Error: {e}")
+                response = client.post(f"games/{game['id']}/play")
+                if response.status_code != 200:
+                    print(f"❌ Failed to play game {game['id']}: {response.status_code}")
+                    stats.error(in_flight, "game")
+                    return None
+                stats.record(in_flight, "game", time.perf_counter() - game_started)
+            
+            response = client.get(f"games/{game['id']}/stats")
+            if response.status_code != 200:
+                print(f"❌ Failed to fetch the stats of game {game['id']}: {response.status_code}")
+                stats.error(in_flight, "game")
+                return None
+            wins[response.json().get("winner_id")] += 1
+        
+        stats.record(in_flight, "match", time.perf_counter() - started)
+        winner = max(wins, key=wins.get) if wins else None
+        print(f"✅ Match {match['id']} played ({'-'.join(str(count) for count in wins.values())}), winner: {winner}")
+        return winner
+    except Exception as e:
+        print(f"Error: {e}")
+        stats.error(in_flight, "match")
+        return None
+
+def soak_tournaments(count=1, in_flight_levels=(1,), round_plays=SOAK_ROUND_PLAYS, tournament_ids=None):
+    """
+    Start generated tournaments and play all of their matches through the API
+
+    The matches of every tournament are collected from its schedule and played with a bounded
+    number of matches (and so games) in flight. With several in-flight levels, the matches are
+    split into consecutive stages, one per level, so a single run shows where throughput stops
+    growing and latency starts to climb.
+
+    Args:
+        count (int): Number of tournaments to play (the most recent unstarted ones)
+        in_flight_levels (list): Matches in flight for each stage
+        round_plays (int): Rounds of every game played through the round endpoint
+        tournament_ids (list, optional): Play these tournaments instead
+
+    Returns the SoakStats of the run
+    """
+    stats = SoakStats()
+    if not tournament_ids:
+        unstarted = sorted(tournament["id"] for tournament in iter_collection("tournaments")
+                           if not tournament.get("started"))
+        tournament_ids = unstarted[-count:] if count > 0 else []
+    if not tournament_ids:
+        print("❌ No unstarted tournaments to play")
+        return stats
     
-    # Return the first created player for single player creation, or the list for multiple
-    if count == 1 and team_id is not None and created_players:
-        return created_players[0]
-    return created_players
+    matches = []
+    for tournament_id in tournament_ids:
+        if start_tournament(tournament_id):
+            matches.extend(match for match in iter_collection(f"tournaments/{tournament_id}/schedule")
+                           if not match.get("finished"))
+    print(f"Playing {len(matches)} matches from {len(tournament_ids)} tournaments")
+    
+    stage_size = math.ceil(len(matches) / len(in_flight_levels)) if matches else 0
+    for stage, in_flight in enumerate(in_flight_levels):
+        stage_matches = matches[stage * stage_size:(stage + 1) * stage_size]
+        if not stage_matches:
+            continue
+        print(f"Stage {stage + 1}: {len(stage_matches)} matches with {in_flight} in flight")
+        started = time.perf_counter()
+        tasks = (partial(play_match, match, round_plays, stats, in_flight) for match in stage_matches)
+        for _ in run_bounded(tasks, in_flight):
+            pass
+        stats.level(in_flight)["seconds"] += time.perf_counter() - started
+    
+    stats.print_summary()
+    return stats
+
+# Read endpoints backed by the API's CacheService (allTeamStats and allPlayerStats, one ranked
+# list each, so the first page fills the whole entry)
+CACHED_READ_PATHS = ("teams/stats", "players/stats")
+
+class WarmStats:
+    """Latencies of the read endpoints walked by the cache warmer, per pass (cold, then warm)"""
+
+    PHASES = ("cold", "warm")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.endpoints = {}
+        self.seconds = dict.fromkeys(self.PHASES, 0.0)
+
+    def entry(self, path):
+        endpoint = re.sub(r"/\d+", "/{id}", path)
+        with self.lock:
+            return self.endpoints.setdefault(endpoint, {phase: {"latencies": array("d"), "errors": 0}
+                                                        for phase in self.PHASES})
+
+    def record(self, phase, path, latency):
+        entry = self.entry(path)
+        with self.lock:
+            entry[phase]["latencies"].append(latency)
+
+    def error(self, phase, path):
+        entry = self.entry(path)
+        with self.lock:
+            entry[phase]["errors"] += 1
+
+    def summary(self):
+        """Return, per endpoint and pass, the request count, errors and p50/p95/max latency in ms"""
+        summary = {}
+        with self.lock:
+            for endpoint, phases in sorted(self.endpoints.items()):
+                summary[endpoint] = {}
+                for phase, stats in phases.items():
+                    latencies = sorted(stats["latencies"])
+                    summary[endpoint][phase] = {"requests": len(latencies), "errors": stats["errors"]}
+                    if latencies:
+                        summary[endpoint][phase].update({"p50": round(percentile(latencies, 0.5) * 1000, 1),
+                                                         "p95": round(percentile(latencies, 0.95) * 1000, 1),
+                                                         "max": round(latencies[-1] * 1000, 1)})
+                summary[endpoint]["cached"] = endpoint in CACHED_READ_PATHS
+                cold, warm = summary[endpoint]["cold"], summary[endpoint]["warm"]
+                if summary[endpoint]["cached"] and cold.get("p50") and warm.get("p50"):
+                    summary[endpoint]["speedup"] = round(cold["p50"] / warm["p50"], 2)
+            summary["seconds"] = {phase: round(seconds, 3) for phase, seconds in self.seconds.items()}
+        return summary
+
+    def print_summary(self):
+        """Print the cold and warm latency of every endpoint side by side"""
+        summary = self.summary()
+        seconds = summary.pop("seconds")
+        print(f"\nCache warm-up (cold pass {seconds['cold']:.2f}s, warm pass {seconds['warm']:.2f}s):")
+        print(f"  {'Endpoint':<30} {'Cache':<8} {'Requests':>8} {'Errors':>6} {'Cold p50':>9} {'Cold p95':>9} {'Cold max':>9} "
+              f"{'Warm p50':>9} {'Warm p95':>9} {'Speedup':>8}")
+        for endpoint, phases in summary.items():
+            cold, warm = phases["cold"], phases["warm"]
+            latency = "".join(f" {stats[name]:>9.1f}" if name in stats else f" {'-':>9}"
+                              for stats, name in ((cold, "p50"), (cold, "p95"), (cold, "max"),
+                                                  (warm, "p50"), (warm, "p95")))
+            speedup = f"{phases['speedup']:.2f}x" if "speedup" in phases else "-"
+            cache = "cached" if phases["cached"] else "uncached"
+            print(f"  {endpoint:<30} {cache:<8} {cold['requests']:>8} {cold['errors'] + warm['errors']:>6}{latency} {speedup:>8}")
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=2)
+            file.write("\n")
+        print(f"✅ Warm-up results written to {path}")
+
+def warm_request(path, paginated, stats, phase):
+    """GET the first page of a read endpoint, recording its latency"""
+    params = {"limit": PAGE_SIZE, "offset": 0} if paginated else None
+    started = time.perf_counter()
+    try:
+        response = get_api_client().get(path, params=params)
+        if response.status_code != 200:
+            print(f"❌ Failed to read {path}: {response.status_code}")
+            stats.error(phase, path)
+            return
+        stats.record(phase, path, time.perf_counter() - started)
+    except Exception as e:
+        print(f"Error: {e}")
+        stats.error(phase, path)
+
+def warm_pass(tournament_ids, stats, phase, concurrency):
+    """
+    Read every warmed endpoint once
+
+    Only the first page is read: the stats endpoints cache their whole ranked list on the first
+    request, and the standings and schedule of the given tournaments are uncached reads that
+    are timed for comparison.
+    """
+    started = time.perf_counter()
+    tasks = [partial(warm_request, path, True, stats, phase) for path in CACHED_READ_PATHS]
+    for tournament_id in tournament_ids:
+        tasks.append(partial(warm_request, f"tournaments/{tournament_id}/standings", False, stats, phase))
+        tasks.append(partial(warm_request, f"tournaments/{tournament_id}/schedule", True, stats, phase))
+    for _ in run_bounded(tasks, concurrency):
+        pass
+    stats.seconds[phase] += time.perf_counter() - started
+
+def warm_caches(tournament_ids, concurrency=1, keep_warm=None):
+    """
+    Warm the API's read caches after a seed and report cold against warm latency
+
+    /teams/stats and /players/stats are the only reads behind the API's CacheService: each is
+    ranked in a single cached list that expires after CACHE_TTL.ALL_STATS (30 seconds). Both are
+    read twice, the first pass filling the cache and the second showing what users see once it
+    is warm, and keep_warm re-reads them on that interval. The standings and schedule of every
+    given tournament are read in the same passes and reported as uncached, for comparison.
+
+    Args:
+        tournament_ids (list): Tournaments whose standings and schedule are read alongside
+        concurrency (int): Number of requests in flight
+        keep_warm (float, optional): Seconds between further passes, until interrupted
+
+    Returns the WarmStats of the two passes
+    """
+    stats = WarmStats()
+    concurrency = max(1, concurrency)
+    print(f"Warming the team and player stats caches, reading {len(tournament_ids)} tournaments uncached, "
+          f"with {concurrency} requests in flight")
+    for phase in WarmStats.PHASES:
+        warm_pass(tournament_ids, stats, phase, concurrency)
+    stats.print_summary()
+    
+    if keep_warm:
+        print(f"Keeping the stats caches warm every {keep_warm:g}s (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(keep_warm)
+                warm_pass([], WarmStats(), "warm", concurrency)
+        except KeyboardInterrupt:
+            print("Stopped keeping the caches warm")
+    return stats
+
+def run_tournament_ids(journal_dir, run_id):
+    """Return the IDs of the tournaments a journaled run created"""
+    journal = RunJournal.open(journal_dir, run_id)
+    try:
+        return sorted(tournament_id for tournament_id in journal.acked["tournaments"].values()
+                      if tournament_id is not None)
+    finally:
+        journal.close()
 
 def main():
     """Main function to parse arguments and run the script"""
+    global PAGE_FETCH_WORKERS, HTTP_POOL_SIZE, HTTP_MAX_RETRIES, LOGO_CACHE_DIR, LOGO_INDEXED_PNG, RUN_JOURNAL, \
+        TEAM_STRENGTH_PLAN
+    
     parser = argparse.ArgumentParser(description="Generate tournaments, teams, and players for VAVALM")
-    parser.add_argument("type", choices=["tournament", "team", "player"], help="Type of data to generate")
+    parser.add_argument("type", choices=["tournament", "league", "team", "player", "export", "replay", "soak", "warm"],
+                        help="Type of data to generate (league creates a season of tournaments across regions, "
+                             "export writes teams, players and tournaments to files, "
+                             "replay loads an exported dataset into the API, "
+                             "soak starts tournaments and plays all of their games, "
+                             "warm fills the API's team and player stats cache)")
     parser.add_argument("count", type=int, nargs="?", default=1, help="Number of items to generate")
     
     # Tournament options
@@ -1053,8 +3840,17 @@ def main():
     parser.add_argument("--end-date", type=str, help="End date for tournament (YYYY-MM-DD)")
     parser.add_argument("--teams", type=int, help="Number of teams to include in the tournament")
     
+    # League options
+    parser.add_argument("--regions", type=int, default=4,
+                        help="Number of regions the teams are split into (for league)")
+    parser.add_argument("--overlap", type=float, default=0.0,
+                        help="Probability (0-1) that a tournament slot goes to a team from another region (for league)")
+    
     # Team options
     parser.add_argument("--players", type=int, default=5, help="Number of players per team (for team generation)")
+    parser.add_argument("--strength", type=str, choices=list(STRENGTH_PROFILES) + list(STRENGTH_TIERS),
+                        help="Generate rosters in a strength tier (S-D) or a league profile of tiers "
+                             "(for team and export)")
     
     # Player options
     parser.add_argument("--team", type=int, help="Team ID to assign players to (for player generation)")
@@ -1063,8 +3859,120 @@ def main():
     # Authentication options
     parser.add_argument("--token", type=str, help="JWT token for API authentication")
     
+    # Concurrency options
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Number of API calls to run in parallel")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Adapt the number of API writes in flight (AIMD) up to --concurrency: ramp up while "
+                             "latency and errors stay healthy, back off on 429/5xx responses or latency spikes")
+    parser.add_argument("--latency-tolerance", type=float, default=ADAPTIVE_LATENCY_TOLERANCE,
+                        help="Median write latency, as a multiple of the baseline, that counts as a spike (with --adaptive)")
+    parser.add_argument("--tournaments", type=int, default=0,
+                        help="Number of tournaments to create from the newly created teams (for team generation)")
+    
+    # Logo rendering options
+    parser.add_argument("--render-workers", type=int, default=1,
+                        help="Number of processes rendering team logos ahead of the uploads")
+    
+    # Bulk options
+    parser.add_argument("--batch-size", type=int,
+                        help="Submit teams and players through the bulk endpoints in chunks of this size")
+    
+    # HTTP options
+    parser.add_argument("--pool-size", type=int, default=HTTP_POOL_SIZE,
+                        help="Maximum number of pooled keep-alive connections to the API")
+    parser.add_argument("--max-retries", type=int, default=HTTP_MAX_RETRIES,
+                        help="Retries for idempotent and bulk API calls on transient failures")
+    parser.add_argument("--connection-stats", action="store_true",
+                        help="Print connection reuse statistics at the end of the run")
+    parser.add_argument("--metrics-json", type=str,
+                        help="Write per-endpoint request latency, throughput and error metrics to this JSON file")
+    
+    # Logo options
+    parser.add_argument("--logo-cache-dir", type=str, default=LOGO_CACHE_DIR,
+                        help="Directory where rendered logos are cached between runs")
+    parser.add_argument("--no-logo-cache", action="store_true",
+                        help="Do not read or write the on-disk logo cache")
+    parser.add_argument("--indexed-logos", action="store_true",
+                        help="Emit smaller indexed-colour PNGs from the fallback logo renderer (without cairosvg)")
+    
+    # Export options
+    parser.add_argument("--output-dir", type=str, default="dataset",
+                        help="Directory the dataset is written to (for export)")
+    parser.add_argument("--format", type=str, choices=["json", "ndjson"], default="json",
+                        help="Dataset file format: JSON arrays like the bootstrap files, or NDJSON (for export)")
+    parser.add_argument("--gzip", action="store_true", help="gzip the dataset files (for export)")
+    parser.add_argument("--first-team-id", type=int, default=1,
+                        help="ID given to the first exported team (for export)")
+    
+    # Replay options
+    parser.add_argument("--input-dir", type=str, default="dataset",
+                        help="Directory holding the dataset to load (for replay)")
+    parser.add_argument("--checkpoint", type=str,
+                        help="Checkpoint file tracking replay progress (defaults to <input-dir>/replay_checkpoint.json)")
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignore an existing replay checkpoint and start from the beginning (for replay)")
+    
+    # Journal options
+    parser.add_argument("--resume", type=str, metavar="RUN_ID",
+                        help="Resume an interrupted tournament/team/player run from its journal")
+    parser.add_argument("--journal-dir", type=str, default=RUN_JOURNAL_DIR,
+                        help="Directory where run journals are written")
+    parser.add_argument("--no-journal", action="store_true",
+                        help="Do not journal the run (it cannot be resumed)")
+    
+    # Fetch options
+    parser.add_argument("--fetch-workers", type=int, default=1,
+                        help="Number of pages to fetch concurrently when reading existing teams and players")
+    
+    # Soak options
+    parser.add_argument("--tournament-ids", type=str,
+                        help="Comma-separated tournament IDs to soak or warm instead of the most recent ones")
+    parser.add_argument("--in-flight", type=str,
+                        help="Comma-separated numbers of matches played at once, one stage per value "
+                             "(default: --concurrency)")
+    parser.add_argument("--round-plays", type=int, default=SOAK_ROUND_PLAYS,
+                        help=f"Rounds of every game played one request at a time before the rest of the game "
+                             f"(0-{ROUND_PLAYS_LIMIT})")
+    parser.add_argument("--soak-json", type=str,
+                        help="Write the per-stage soak latencies and throughput to this JSON file")
+    
+    # Warm options
+    parser.add_argument("--run-id", type=str,
+                        help="Warm the tournaments created by this journaled run (see --resume)")
+    parser.add_argument("--keep-warm", type=float, metavar="SECONDS",
+                        help="After the report, read the stats endpoints again every SECONDS until interrupted")
+    parser.add_argument("--warm-json", type=str,
+                        help="Write the cold and warm latency per endpoint to this JSON file")
+    
     args = parser.parse_args()
 
+    # With --adaptive, --concurrency is the ceiling the limit may ramp up to
+    if args.adaptive and args.concurrency <= 1:
+        args.concurrency = ADAPTIVE_MAX_CONCURRENCY
+
+    PAGE_FETCH_WORKERS = max(1, args.fetch_workers)
+    in_flight_max = max((int(level) for level in args.in_flight.split(",")), default=1) if args.in_flight else 1
+    HTTP_POOL_SIZE = max(1, args.pool_size, PAGE_FETCH_WORKERS, args.concurrency, in_flight_max)
+    HTTP_MAX_RETRIES = max(0, args.max_retries)
+    LOGO_CACHE_DIR = None if args.no_logo_cache else args.logo_cache_dir
+    LOGO_INDEXED_PNG = args.indexed_logos
+    
+    # Strength-targeted rosters are planned up front and handed out as teams are created
+    if args.strength and args.type in ("team", "export"):
+        plan = plan_team_strengths(args.count, args.players, args.strength)
+        print_strength_plan(plan)
+        TEAM_STRENGTH_PLAN = iter(plan)
+    
+    # Exports are generated offline, so they need neither the API nor a token
+    if args.type == "export":
+        export_dataset(args.output_dir, args.count, args.players, args.tournaments, args.teams,
+                       args.start_date, args.end_date, args.format, args.gzip, args.first_team_id,
+                       args.render_workers)
+        return
+
+    import dotenv
+    import jwt
     dotenv.load_dotenv(os.path.join(os.path.dirname(__file__), '../api/.env'))
     
     # Set JWT token if provided
@@ -1075,24 +3983,117 @@ def main():
         token = jwt.encode({'username': 'admin'}, os.getenv('JWT_SECRET'), algorithm='HS256')
         set_jwt_token(token)
     
-    if args.type == "tournament":
-        create_tournament(args.count, args.start_date, args.end_date, args.teams)
-    elif args.type == "team":
-        create_team_with_players(args.count, args.players)
-    elif args.type == "player":
-        # If a country was specified, pass it to create_player
-        if args.country and args.country in COUNTRIES:
-            create_player(args.count, args.team, country=args.country)
-        else:
-            create_player(args.count, args.team)
+    # Tournament, team and player runs are journaled so they can be resumed
+    journaled = args.type in ("tournament", "team", "player")
+    if args.resume:
+        if not journaled:
+            print("❌ --resume only applies to tournament, team and player runs")
+            return
+        try:
+            RUN_JOURNAL = RunJournal.open(args.journal_dir, args.resume)
+        except FileNotFoundError:
+            print(f"❌ No journal found for run {args.resume} in {args.journal_dir}")
+            return
+        if RUN_JOURNAL.header is None or RUN_JOURNAL.header["type"] != args.type:
+            print(f"❌ Run {args.resume} is not a {args.type} run")
+            RUN_JOURNAL.close()
+            return
+    elif journaled and not args.no_journal:
+        RUN_JOURNAL = RunJournal.start(args.journal_dir, args.type, {
+            "count": args.count,
+            "players": args.players,
+            "team": args.team,
+            "country": args.country if args.country in COUNTRIES else None,
+            "tournaments": args.tournaments,
+            "teams": args.teams,
+            "start_date": args.start_date,
+            "end_date": args.end_date,
+        })
+        print(f"Run ID: {RUN_JOURNAL.run_id} (resume with --resume={RUN_JOURNAL.run_id})")
+    
+    limiter = None
+    replay_failed = 0
+    if args.adaptive:
+        limiter = AdaptiveLimiter(args.concurrency, latency_tolerance=args.latency_tolerance)
+        get_api_client().limiter = limiter
+        limiter.start_readout()
+    
+    try:
+        if args.resume:
+            resume_run(RUN_JOURNAL, args.batch_size, args.concurrency, args.render_workers)
+        elif args.type == "tournament":
+            create_tournament(args.count, args.start_date, args.end_date, args.teams, concurrency=args.concurrency)
+        elif args.type == "league":
+            create_league(args.count, args.regions, args.teams, args.overlap, args.start_date,
+                          concurrency=args.concurrency if args.concurrency > 1 else None)
+        elif args.type == "team":
+            create_team_with_players(args.count, args.players, batch_size=args.batch_size, concurrency=args.concurrency,
+                                     tournament_count=args.tournaments, tournament_team_count=args.teams,
+                                     start_date=args.start_date, end_date=args.end_date,
+                                     render_workers=args.render_workers)
+        elif args.type == "player":
+            # If a country was specified, pass it to create_player
+            if args.country and args.country in COUNTRIES:
+                create_player(args.count, args.team, country=args.country, batch_size=args.batch_size,
+                              concurrency=args.concurrency)
+            else:
+                create_player(args.count, args.team, batch_size=args.batch_size, concurrency=args.concurrency)
+        elif args.type == "replay":
+            replay_failed = replay_dataset(args.input_dir, args.batch_size or 100, args.checkpoint, args.restart)
+        elif args.type == "soak":
+            in_flight_levels = [max(1, int(level)) for level in args.in_flight.split(",")] if args.in_flight \
+                else [max(1, args.concurrency)]
+            tournament_ids = [int(tournament_id) for tournament_id in args.tournament_ids.split(",")] \
+                if args.tournament_ids else None
+            soak = soak_tournaments(args.count, in_flight_levels, args.round_plays, tournament_ids)
+            if args.soak_json:
+                soak.write_json(args.soak_json)
+        elif args.type == "warm":
+            if args.tournament_ids:
+                tournament_ids = [int(tournament_id) for tournament_id in args.tournament_ids.split(",")]
+            elif args.run_id:
+                try:
+                    tournament_ids = run_tournament_ids(args.journal_dir, args.run_id)
+                except FileNotFoundError:
+                    print(f"❌ No journal found for run {args.run_id} in {args.journal_dir}")
+                    return
+            else:
+                tournament_ids = sorted(tournament["id"] for tournament in iter_collection("tournaments"))
+                tournament_ids = tournament_ids[-args.count:] if args.count > 0 else []
+            warm = warm_caches(tournament_ids, args.concurrency, args.keep_warm)
+            if args.warm_json:
+                warm.write_json(args.warm_json)
+    except PageFetchError as e:
+        # Carrying on would check uniqueness against (or play) an incomplete collection
+        print(f"❌ {e}, aborting")
+        sys.exit(1)
+    finally:
+        if RUN_JOURNAL is not None:
+            RUN_JOURNAL.close()
+        if limiter is not None:
+            limiter.stop_readout()
+    
+    if limiter is not None:
+        limiter.print_summary()
+    if args.type == "team":
+        print_logo_cache_stats()
+    get_api_client().metrics.print_summary()
+    if args.metrics_json:
+        get_api_client().metrics.write_json(args.metrics_json)
+    if args.connection_stats:
+        get_api_client().print_connection_stats()
+    if replay_failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: ./generate_data.py [tournament|team|player] [count] [options]")
+        print("Usage: ./generate_data.py [tournament|league|team|player|export|replay|soak|warm] [count] [options]")
         print("Examples:")
         print("  ./generate_data.py tournament 3        # Generate 3 tournaments")
         print("  ./generate_data.py tournament 1 --start-date=2023-06-01 --end-date=2023-06-15 --teams=8")
         print("                                         # Generate a tournament with specific dates and 8 teams")
+        print("  ./generate_data.py league 300 --regions=6 --teams=8")
+        print("                                         # Generate a season of 300 tournaments across 6 regions")
         print("  ./generate_data.py team 2 --players=5  # Generate 2 teams with 5 players each")
         print("  ./generate_data.py player 5            # Generate 5 players assigned to random teams")
         print("  ./generate_data.py player 3 --team=1   # Generate 3 players assigned to team with ID 1")
@@ -1100,6 +4101,10 @@ if __name__ == "__main__":
         print("                                         # Generate 2 Korean players assigned to team with ID 1")
         print("  ./generate_data.py tournament 1 --token=\"eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...\"")
         print("                                         # Generate a tournament with JWT authentication")
+        print("  ./generate_data.py export 100 --tournaments=5 --output-dir=dataset")
+        print("                                         # Write 100 teams, their players and 5 tournaments to files")
+        print("  ./generate_data.py replay --input-dir=dataset --batch-size=500")
+        print("                                         # Load an exported dataset into the API, resuming if interrupted")
         sys.exit(1)
     
     main() 
\ No newline at end of file
@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo duel and match simulator for generated rosters
+
+Mirrors the API's game model (ChanceService, DuelService, RoundService and MatchService)
+with NumPy, so the balance of generated player attributes can be checked and the outcome
+of a whole generated league predicted without playing a single game on the server:
+
+- A duel is won with chance proportional to the sum of max(0, attribute - opponent's
+  counter attribute) over all attributes, scaled by the role's duel (or trade) win buff.
+- Duel players are picked with weights from their role's duel (or trade) select buff; the
+  winner of a duel that started a trade stays in for the next duel.
+- A round is played until one side has no players left, a game until a team reaches 13
+  rounds with a 2 round margin, and a match until a team wins the majority of its games.
+
+Rounds are independent of each other in the API, so many rounds, games and matches are
+simulated side by side as array lanes. Requires NumPy.
+"""
+import argparse
+import json
+import random
+import sys
+import time
+
+import generate_data
+
+# Counter attribute each attribute is compared against (ChanceService.getCounterAttributeName)
+COUNTER_ATTRIBUTES = {
+    "clutch": "awareness",
+    "awareness": "game_reading",
+    "game_reading": "aim",
+    "aim": "positioning",
+    "positioning": "clutch",
+    "resilience": "confidence",
+    "confidence": "game_sense",
+    "game_sense": "decision_making",
+    "decision_making": "resilience",
+    "strategy": "adaptability",
+    "adaptability": "strategy",
+    "communication": "unpredictability",
+    "unpredictability": "utility_usage",
+    "utility_usage": "teamwork",
+    "teamwork": "communication",
+    "rage_fuel": "rage_fuel",
+}
+
+# Role buffs from ChanceService: duel win, trade win, duel select and trade select
+ROLE_BUFFS = {
+    "Duelist":    (0.30, 0.40, 0.40, 0.40),
+    "Controller": (0.05, 0.15, 0.05, 0.15),
+    "Flex":       (0.15, 0.35, 0.15, 0.35),
+    "Initiator":  (0.25, 0.20, 0.40, 0.20),
+    "IGL":        (0.00, 0.10, 0.05, 0.15),
+    "Sentinel":   (0.05, 0.20, 0.05, 0.20),
+}
+
+# Base chance of a trade duel after any duel (DuelService)
+BASE_TRADE_CHANCE = 0.10
+
+# Players per side in a round (RoundService takes the first 5 players of each team)
+PLAYERS_PER_SIDE = 5
+
+# Rounds needed to win a game, and the margin needed from 12-12 on (RoundService)
+ROUNDS_TO_WIN = 13
+ROUND_MARGIN = 2
+
+# Games needed to win a match (MatchService.numberOfGamesToWinForMatchType)
+GAMES_TO_WIN = {"BO1": 1, "BO3": 2, "BO5": 3}
+
+# Rounds simulated side by side per chunk of a league prediction (bounds the memory used)
+ROUND_LANES = 500_000
+
+# Pairings whose duel tables are built at once
+MATCHUP_CHUNK = 256
+
+ROLES = list(ROLE_BUFFS)
+
+def require_numpy():
+    """Return NumPy, or exit with install hints if it is not available"""
+    np = generate_data.load_numpy()
+    if np is None:
+        print("❌ The simulator needs NumPy, which is in the script requirements:")
+        print("- ./python_deps.sh (from the repository root)")
+        print("- or: pip install -r requirements.txt")
+        sys.exit(1)
+    return np
+
+def role_tables(np):
+    """
+    Per-role lookup tables, indexed by role_index()
+
+    Returns a dict of arrays: duel/trade win multipliers (1 + buff), duel/trade select
+    weights (the number of copies DuelService puts in its pick list) and the chance that a
+    duel won by the role starts a trade (randomInt(0, 100) < chance * 100). The last entry
+    is for unknown roles, which get no buffs.
+    """
+    buffs = np.array([ROLE_BUFFS[role] for role in ROLES] + [(0.0, 0.0, 0.0, 0.0)])
+    trade_chance = np.minimum(BASE_TRADE_CHANCE + buffs[:, 3], 1) * 100
+    return {
+        "win": 1 + buffs[:, :2].T,
+        "select": np.floor(buffs[:, 2:].T * 100),
+        "trade": np.minimum(np.ceil(trade_chance), 100) / 100,
+    }
+
+def role_index(role):
+    return ROLES.index(role) if role in ROLE_BUFFS else len(ROLES)
+
+def counter_index():
+    """Column of each attribute's counter attribute, in PLAYER_ATTRIBUTE_NAMES order"""
+    names = generate_data.PLAYER_ATTRIBUTE_NAMES
+    return [names.index(COUNTER_ATTRIBUTES[name]) for name in names]
+
+def player_arrays(np, players):
+    """Return the (players x attributes) matrix and role indices of a list of player payloads"""
+    names = generate_data.PLAYER_ATTRIBUTE_NAMES
+    # Attributes are small integers, so int16 keeps the duel arithmetic cheap
+    attributes = np.array([[player["player_attributes"][name] for name in names] for player in players],
+                          dtype=np.int16).reshape(len(players), len(names))
+    roles = np.array([role_index(player.get("role")) for player in players], dtype=np.int64)
+    return attributes, roles
+
+def duel_chances(np, attributes1, attributes2):
+    """
+    Attribute chances of player 1 against player 2 and the other way around, broadcasting
+    over any leading dimensions (ChanceService.getSumOfAttributesChances)
+    """
+    counters = counter_index()
+    chances = []
+    for attack, defence in ((attributes1, attributes2), (attributes2, attributes1)):
+        difference = attack - np.take(defence, counters, axis=-1)
+        chances.append(np.maximum(difference, 0, out=difference).sum(axis=-1))
+    return chances
+
+def duel_win_probability(np, chances1, chances2):
+    """
+    Exact chance that player 1 wins a duel given both players' buffed chances
+
+    DuelService draws randomInt(0, ceil(c1 + c2)) and player 1 wins below c1, which holds
+    for ceil(c1) of the ceil(c1 + c2) possible draws.
+    """
+    return np.ceil(chances1) / np.ceil(chances1 + chances2)
+
+def simulate_duels(np, rng, attributes1, roles1, attributes2, roles2, trade=False):
+    """
+    Play one duel per row of the two player arrays and return whether player 1 won each one
+
+    Args:
+        attributes1 (ndarray): (duels x attributes) matrix of the first players
+        roles1 (ndarray): Role indices of the first players
+        attributes2 (ndarray): (duels x attributes) matrix of the second players
+        roles2 (ndarray): Role indices of the second players
+        trade (bool): Whether the duels are trades (trade win buffs instead of duel win buffs)
+    """
+    win = role_tables(np)["win"][int(trade)]
+    chances1, chances2 = duel_chances(np, attributes1, attributes2)
+    chances1 = np.maximum(1, chances1 * win[roles1])
+    chances2 = np.maximum(1, chances2 * win[roles2])
+    return rng.random(len(chances1)) < duel_win_probability(np, chances1, chances2)
+
+class Matchups:
+    """
+    Precomputed duel tables for pairs of rosters
+
+    For every pair, `win[pair, trade, i, j]` is the chance that player i of the first team
+    beats player j of the second and `trade[pair, side, i]` the chance that a duel won by
+    player i of a side starts a trade. The players alive on a side are a bit mask (`roster`
+    holds each side's full mask). DuelService picks a duel player by drawing from a list that
+    holds each alive player once per point of their select weight. `pick_total[pair, side,
+    trade, alive]` is the length of that list and `pick_table[..., alive, k]` the player at
+    position k, so a pick is a single lookup.
+
+    Args:
+        rosters (list): (attributes, roles) of each team, at most PLAYERS_PER_SIDE players
+        pairs (ndarray): (pairs x 2) team indices into `rosters`
+    """
+
+    def __init__(self, np, rosters, pairs):
+        tables = role_tables(np)
+        attributes_count = len(generate_data.PLAYER_ATTRIBUTE_NAMES)
+        attributes = np.zeros((len(rosters), PLAYERS_PER_SIDE, attributes_count), dtype=np.int16)
+        roles = np.full((len(rosters), PLAYERS_PER_SIDE), len(ROLES))
+        present = np.zeros((len(rosters), PLAYERS_PER_SIDE), dtype=bool)
+        for team, (team_attributes, team_roles) in enumerate(rosters):
+            size = min(len(team_roles), PLAYERS_PER_SIDE)
+            attributes[team, :size] = team_attributes[:size]
+            roles[team, :size] = team_roles[:size]
+            present[team, :size] = True
+
+        self.pairs = np.asarray(pairs)
+        first, second = self.pairs[:, 0], self.pairs[:, 1]
+        chances1, chances2 = duel_chances(np, attributes[first][:, :, None, :], attributes[second][:, None, :, :])
+        self.win = np.empty((len(self.pairs), 2, PLAYERS_PER_SIDE, PLAYERS_PER_SIDE))
+        for trade in (0, 1):
+            buffed1 = np.maximum(1, chances1 * tables["win"][trade][roles[first]][:, :, None])
+            buffed2 = np.maximum(1, chances2 * tables["win"][trade][roles[second]][:, None, :])
+            self.win[:, trade] = duel_win_probability(np, buffed1, buffed2)
+
+        sides = np.stack([first, second], axis=1)
+        bits = 1 << np.arange(PLAYERS_PER_SIDE)
+        self.roster = (present[sides] * bits).sum(axis=-1)
+        self.trade = tables["trade"][roles[sides]]
+
+        # Select weights of every alive mask: (pairs, side, trade, mask, player)
+        select = tables["select"].T[roles[sides]].transpose(0, 1, 3, 2).astype(np.int64)
+        alive_players = (np.arange(2 ** PLAYERS_PER_SIDE)[:, None] & bits) > 0
+        cumulative = (select[:, :, :, None, :] * alive_players).cumsum(axis=-1)
+        self.pick_total = cumulative[..., -1]
+        positions = np.arange(max(1, int(self.pick_total.max())))
+        self.pick_table = np.zeros(self.pick_total.shape + positions.shape, dtype=np.int8)
+        for player in range(PLAYERS_PER_SIDE - 1):
+            self.pick_table += positions >= cumulative[..., player, None]
+
+    def __len__(self):
+        return len(self.pairs)
+
+def simulate_rounds(np, rng, matchups, pair_indices):
+    """
+    Play one round per entry of `pair_indices` and return whether the first team won each
+
+    All rounds advance one duel per step; a round ends when one side has nobody alive, so
+    at most 2 * PLAYERS_PER_SIDE - 1 steps are needed. The state of finished rounds is
+    dropped after every step, so each step only works on the rounds still being played.
+    """
+    won = np.zeros(len(pair_indices), dtype=bool)
+    lanes = np.arange(len(pair_indices))
+    pairs = np.asarray(pair_indices)
+    alive = matchups.roster[pairs]
+    trade = np.zeros(len(pairs), dtype=np.intp)
+    keeper_side = np.zeros(len(pairs), dtype=np.intp)
+    keeper = np.zeros(len(pairs), dtype=np.intp)
+    win = matchups.win.ravel()
+    trade_chance = matchups.trade.ravel()
+    pick_total = matchups.pick_total.ravel()
+    pick_table = matchups.pick_table.ravel()
+    positions = matchups.pick_table.shape[-1]
+    sides = np.arange(2)
+
+    while len(lanes):
+        rows = np.arange(len(lanes))
+        masks = ((pairs[:, None] * 2 + sides) * 2 + trade[:, None]) * 2 ** PLAYERS_PER_SIDE + alive
+        draws = (rng.random(masks.shape) * pick_total[masks]).astype(np.intp)
+        picks = pick_table[masks * positions + draws].astype(np.intp)
+        # The winner of a duel that started a trade stays in for the trade duel
+        kept = np.flatnonzero(trade)
+        picks[kept, keeper_side[kept]] = keeper[kept]
+
+        first_wins = rng.random(len(lanes)) < win[((pairs * 2 + trade) * PLAYERS_PER_SIDE + picks[:, 0])
+                                                  * PLAYERS_PER_SIDE + picks[:, 1]]
+        keeper_side = (~first_wins).astype(np.intp)
+        loser_side = 1 - keeper_side
+        alive[rows, loser_side] &= ~(1 << picks[rows, loser_side])
+        keeper = picks[rows, keeper_side]
+        trade = (rng.random(len(lanes)) < trade_chance[(pairs * 2 + keeper_side) * PLAYERS_PER_SIDE + keeper]).astype(np.intp)
+
+        finished = alive[rows, loser_side] == 0
+        if finished.any():
+            won[lanes[finished]] = first_wins[finished]
+            playing = ~finished
+            lanes, pairs, alive, trade, keeper_side, keeper = (
+                values[playing] for values in (lanes, pairs, alive, trade, keeper_side, keeper))
+    return won
+
+def simulate_games(np, rng, matchups, pair_indices):
+    """
+    Play one game per entry of `pair_indices` and return the (first team, second team) scores
+
+    The first 24 rounds of every game are played at once; games still tied at 12-12 then
+    go on two rounds at a time until a team wins both.
+    """
+    games = len(pair_indices)
+    regulation = 2 * (ROUNDS_TO_WIN - 1)
+    rounds = simulate_rounds(np, rng, matchups, np.repeat(pair_indices, regulation)).reshape(games, regulation)
+    first = rounds.cumsum(axis=1)
+    second = np.arange(1, regulation + 1) - first
+    decided = ((first >= ROUNDS_TO_WIN) | (second >= ROUNDS_TO_WIN)) & (np.abs(first - second) >= ROUND_MARGIN)
+    ended = decided.any(axis=1)
+    end = decided.argmax(axis=1)
+    first_score = np.where(ended, first[np.arange(games), end], ROUNDS_TO_WIN - 1)
+    second_score = np.where(ended, second[np.arange(games), end], ROUNDS_TO_WIN - 1)
+
+    overtime = np.flatnonzero(~ended)
+    while len(overtime):
+        pair_rounds = simulate_rounds(np, rng, matchups, np.repeat(pair_indices[overtime], 2)).reshape(-1, 2)
+        first_score[overtime] += pair_rounds.sum(axis=1)
+        second_score[overtime] += 2 - pair_rounds.sum(axis=1)
+        overtime = overtime[pair_rounds.sum(axis=1) == 1]
+    return first_score, second_score
+
+def simulate_matches(np, rng, matchups, pair_indices, match_type="BO3"):
+    """
+    Play one match per entry of `pair_indices` and return whether the first team won each
+
+    Games are independent, so the team that wins the majority of all 2n-1 games of a best
+    of n wins the series, exactly as if play stopped once it was decided.
+    """
+    games_to_win = GAMES_TO_WIN[match_type]
+    games = 2 * games_to_win - 1
+    first, second = simulate_games(np, rng, matchups, np.repeat(pair_indices, games))
+    return (first > second).reshape(-1, games).sum(axis=1) >= games_to_win
+
+def generate_rosters(team_count, players_per_team):
+    """Generate teams and their players offline; returns a list of (team_name, players)"""
+    registry = generate_data.UniquenessRegistry()
+    teams = []
+    for team_id in range(1, team_count + 1):
+        team_name = registry.allocate_team_name()
+        players = []
+        for _ in range(players_per_team):
+            # Nationalities play no part in the simulation, so they are left random
+            player_data, _ = generate_data.generate_player_data(registry, team_id)
+            registry.add_player(player_data["nickname"])
+            players.append(player_data)
+        teams.append((team_name, players))
+    return teams
+
+def load_rosters(input_dir):
+    """Load the teams and players of an exported dataset; returns a list of (team_name, players)"""
+    teams_path = generate_data.find_dataset_file(input_dir, "teams")
+    players_path = generate_data.find_dataset_file(input_dir, "players")
+    if teams_path is None or players_path is None:
+        print(f"❌ No exported teams and players found in {input_dir}")
+        sys.exit(1)
+    players = {}
+    for player in generate_data.iter_records(players_path):
+        players.setdefault(player["team_id"], []).append(player)
+    return [(team["full_name"], players[team["id"]])
+            for team in generate_data.iter_records(teams_path) if players.get(team["id"])]
+
+def benchmark_duels(np, rng, rosters, count):
+    """
+    Play `count` duels between random pairs of the rosters' players
+
+    Returns the duels/second and, as a balance check, how often the player with the higher
+    attribute total won and each role's duel win rate.
+    """
+    attributes = np.concatenate([team_attributes for team_attributes, _ in rosters])
+    roles = np.concatenate([team_roles for _, team_roles in rosters])
+    first = rng.integers(0, len(roles), count)
+    second = rng.integers(0, len(roles), count)
+
+    started = time.perf_counter()
+    first_wins = simulate_duels(np, rng, attributes[first], roles[first], attributes[second], roles[second])
+    elapsed = time.perf_counter() - started
+
+    totals = attributes.sum(axis=1)
+    uneven = totals[first] != totals[second]
+    stronger_wins = (first_wins == (totals[first] > totals[second]))[uneven]
+    role_wins = np.bincount(roles[first], first_wins, len(ROLES) + 1) + np.bincount(roles[second], ~first_wins, len(ROLES) + 1)
+    role_duels = np.bincount(roles[first], minlength=len(ROLES) + 1) + np.bincount(roles[second], minlength=len(ROLES) + 1)
+    return {
+        "duels": count,
+        "seconds": round(elapsed, 4),
+        "duels_per_second": round(count / elapsed) if elapsed else None,
+        "stronger_player_win_rate": round(float(stronger_wins.mean()), 4) if len(stronger_wins) else None,
+        "role_win_rates": {role: round(float(role_wins[index] / role_duels[index]), 4)
+                           for index, role in enumerate(ROLES) if role_duels[index]},
+    }
+
+def league_pairs(np, rng, team_count, opponents=None):
+    """
+    Pairs of teams to simulate: a full round robin, or `opponents` random opponents per team
+    """
+    if opponents is None or opponents >= team_count - 1:
+        first, second = np.triu_indices(team_count, k=1)
+        return np.stack([first, second], axis=1)
+    first = np.repeat(np.arange(team_count), opponents)
+    second = (first + rng.integers(1, team_count, len(first))) % team_count
+    return np.stack([first, second], axis=1)
+
+def predict_league(np, rng, rosters, matches, match_type="BO3", opponents=None):
+    """
+    Simulate `matches` matches for every pairing of the league
+
+    Returns the matches/second, each pairing's win probability for the first team and each
+    team's predicted match win rate.
+    """
+    pairs = league_pairs(np, rng, len(rosters), opponents)
+    probabilities = np.empty(len(pairs))
+    # Pairings are simulated in chunks so the round lanes stay within ROUND_LANES and the
+    # pick tables (about 25KB per pairing) within MATCHUP_CHUNK
+    games = 2 * GAMES_TO_WIN[match_type] - 1
+    chunk_pairs = max(1, min(MATCHUP_CHUNK, ROUND_LANES // (matches * games * 2 * (ROUNDS_TO_WIN - 1))))
+
+    started = time.perf_counter()
+    for start in range(0, len(pairs), chunk_pairs):
+        matchups = Matchups(np, rosters, pairs[start:start + chunk_pairs])
+        first_wins = simulate_matches(np, rng, matchups, np.repeat(np.arange(len(matchups)), matches), match_type)
+        probabilities[start:start + len(matchups)] = first_wins.reshape(-1, matches).mean(axis=1)
+    elapsed = time.perf_counter() - started
+
+    wins = np.bincount(pairs[:, 0], probabilities, len(rosters)) + np.bincount(pairs[:, 1], 1 - probabilities, len(rosters))
+    played = np.bincount(pairs.ravel(), minlength=len(rosters))
+    return {
+        "matches": len(pairs) * matches,
+        "seconds": round(elapsed, 4),
+        "matches_per_second": round(len(pairs) * matches / elapsed) if elapsed else None,
+        "pairs": pairs,
+        "probabilities": probabilities,
+        "win_rates": np.divide(wins, played, out=np.zeros(len(rosters)), where=played > 0),
+    }
+
+def rank_correlation(np, values, other):
+    """Spearman rank correlation of two equally long sequences"""
+    ranks = np.argsort(np.argsort(values))
+    other_ranks = np.argsort(np.argsort(other))
+    if len(values) < 2 or ranks.std() == 0 or other_ranks.std() == 0:
+        return None
+    return float(np.corrcoef(ranks, other_ranks)[0, 1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate duels and matches between generated rosters")
+    parser.add_argument("teams", type=int, nargs="?", default=32, help="Number of teams to generate")
+    parser.add_argument("--players", type=int, default=5, help="Players per generated team")
+    parser.add_argument("--input-dir", type=str, help="Use the rosters of an exported dataset instead of generating them")
+    parser.add_argument("--duels", type=int, default=1_000_000, help="Random duels played for the balance check")
+    parser.add_argument("--matches", type=int, default=100, help="Matches simulated per pairing")
+    parser.add_argument("--match-type", type=str, choices=list(GAMES_TO_WIN), default="BO3", help="Match format")
+    parser.add_argument("--opponents", type=int,
+                        help="Random opponents per team instead of a full round robin (for large leagues)")
+    parser.add_argument("--top", type=int, default=10, help="Number of strongest and weakest teams listed")
+    parser.add_argument("--seed", type=int, help="Seed for the roster generation and the simulation")
+    parser.add_argument("--output", type=str, help="Write the predictions to this JSON file")
+    args = parser.parse_args()
+
+    np = require_numpy()
+    if args.seed is not None:
+        random.seed(args.seed)
+    rng = np.random.default_rng(args.seed)
+
+    started = time.perf_counter()
+    if args.input_dir:
+        teams = load_rosters(args.input_dir)
+    else:
+        teams = generate_rosters(args.teams, args.players)
+    if len(teams) < 2:
+        print("❌ At least two teams with players are needed")
+        sys.exit(1)
+    rosters = [player_arrays(np, players[:PLAYERS_PER_SIDE]) for _, players in teams]
+    print(f"✅ Loaded {len(teams)} rosters in {time.perf_counter() - started:.2f}s")
+
+    duels = benchmark_duels(np, rng, rosters, args.duels)
+    print(f"\n⏱  {duels['duels']} duels in {duels['seconds']:.2f}s ({duels['duels_per_second']} duels/s)")
+    print(f"Higher attribute total wins {duels['stronger_player_win_rate']:.1%} of uneven duels")
+    print("Duel win rate by role: " + ", ".join(f"{role} {rate:.1%}" for role, rate in duels["role_win_rates"].items()))
+
+    league = predict_league(np, rng, rosters, args.matches, args.match_type, args.opponents)
+    print(f"\n⏱  {league['matches']} {args.match_type} matches between {len(league['pairs'])} pairings in "
+          f"{league['seconds']:.2f}s ({league['matches_per_second']} matches/s)")
+
+    strength = np.array([team_attributes.sum(axis=1).mean() for team_attributes, _ in rosters])
+    correlation = rank_correlation(np, strength, league["win_rates"])
+    if correlation is not None:
+        print(f"Rank correlation of average attribute total and predicted win rate: {correlation:.2f}")
+
+    order = np.argsort(-league["win_rates"])
+    top = min(args.top, len(order))
+    print(f"\n{'Team':<36} {'Win rate':>8} {'Strength':>9}")
+    for index in list(order[:top]) + ([None] if len(order) > 2 * top else []) + list(order[max(top, len(order) - top):]):
+        if index is None:
+            print(f"{'...':<36}")
+            continue
+        print(f"{teams[index][0][:36]:<36} {league['win_rates'][index]:>8.1%} {strength[index]:>9.1f}")
+
+    if args.output:
+        report = {
+            "match_type": args.match_type,
+            "matches_per_pairing": args.matches,
+            "duels": duels,
+            "league": {key: league[key] for key in ("matches", "seconds", "matches_per_second")},
+            "strength_win_rate_correlation": correlation,
+            "teams": [{"name": name, "strength": round(float(strength[index]), 2),
+                       "win_rate": round(float(league["win_rates"][index]), 4)}
+                      for index, (name, _) in enumerate(teams)],
+            "pairings": [{"teams": [teams[first][0], teams[second][0]], "first_win_probability": round(float(probability), 4)}
+                         for (first, second), probability in zip(league["pairs"].tolist(), league["probabilities"])],
+        }
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+        print(f"✅ Predictions written to {args.output}")
+
+if __name__ == "__main__":
+    main()